@@ -0,0 +1,56 @@
+"""Deterministic utterances for benchmarks
+
+Utterances are generated from fixed vocabularies with a fixed seed,
+so the benchmarks are reproducible and run offline.
+"""
+import random
+from typing import Dict, List
+
+
+LANGUAGES = ('en', 'zh', 'mixed')
+SIZES = {'short': 16, 'medium': 128, 'long': 1024}  # approximate number of characters
+
+EN_WORDS = [
+    'I', 'want', 'to', 'order', 'a', 'large', 'cup', 'of', 'bubble', 'milk', 'tea',
+    'with', 'less', 'sugar', 'please', 'the', 'price', 'is', '12', '3.5', 'dollars',
+    'café', 'naïve', 'HELLO', 'World', 'unwanted', 'running', 'thanks', 'and',
+]
+ZH_CHARS = list('我想要點一杯大杯珍珠奶茶半糖少冰請問多少錢謝謝你好早安紅茶拿鐵綠')
+PUNCTUATIONS = [',', '.', '!', '?', '，', '。', '！', '？']
+DIGITS = ['12', '3.5', '100']
+
+
+def gen_utterance(lang: str, size: int, seed: int = 0) -> str:
+    rng = random.Random(f"{lang}-{size}-{seed}")
+    pieces: List[str] = []
+    length = 0
+    while length < size:
+        kind = lang if lang != 'mixed' else rng.choice(['en', 'zh'])
+        if kind == 'en':
+            piece = rng.choice(EN_WORDS) + ' '
+        else:
+            piece = ''.join(rng.choice(ZH_CHARS) for _ in range(rng.randint(1, 4)))
+        if rng.random() < 0.15:
+            piece += rng.choice(PUNCTUATIONS)
+        if rng.random() < 0.05:
+            piece += rng.choice(DIGITS) + ' '
+        pieces.append(piece)
+        length += len(piece)
+    return ''.join(pieces)[:size].strip()
+
+
+def gen_corpus() -> Dict[str, Dict[str, str]]:
+    """Utterances keyed by language and size name"""
+    return {
+        lang: {size_name: gen_utterance(lang, size) for size_name, size in SIZES.items()}
+        for lang in LANGUAGES
+    }
+
+
+def gen_labels(length: int, seed: int = 0) -> List[int]:
+    """Entity labels with runs of entities"""
+    rng = random.Random(f"labels-{length}-{seed}")
+    labels = []
+    while len(labels) < length:
+        labels.extend([rng.choice([0, 0, 1, 2, 3])] * rng.randint(1, 5))
+    return labels[:length]
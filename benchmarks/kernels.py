@@ -0,0 +1,88 @@
+"""Benchmark cases of kernels in `uttut.pipeline.edit`
+
+The replacement groups and span groups are generated by real operators
+on the benchmark corpus.
+"""
+from typing import Callable, Dict, Iterator, Tuple
+
+from uttut.pipeline.edit import lst2lst, lst2str, str2lst, str2str
+from uttut.pipeline.edit.label_map import LabelMap
+from uttut.pipeline.edit.label_propagation import (
+    expand_by_span_group,
+    propagate_by_replacement_group,
+    reduce_by_span_group,
+)
+from uttut.pipeline.ops import (
+    AddWhitespaceAroundCJK,
+    AddWhitespaceAroundPunctuation,
+    EngTokenizer,
+    SpanSubwords,
+)
+
+from .corpus import gen_corpus, gen_labels
+from .ops import gen_op_kwargs, gen_tokens
+
+
+def gen_cases() -> Iterator[Tuple[Dict, int, Dict[str, Callable]]]:
+    """Yield (case info, input length, functions to be measured)"""
+    corpus = gen_corpus()
+    span_subwords = SpanSubwords(**gen_op_kwargs(corpus)['SpanSubwords'])
+    for lang, utterances in corpus.items():
+        str_op = AddWhitespaceAroundPunctuation() if lang == 'en' else AddWhitespaceAroundCJK()
+        for size_name, utterance in utterances.items():
+            tokens = gen_tokens(utterance)
+            str_case = _gen_replacement_group_funcs(str2str, str_op, utterance)
+            lst_case = _gen_replacement_group_funcs(lst2lst, span_subwords, tokens)
+            span_case = _gen_span_group_funcs(utterance)
+
+            for kernel, (input_length, funcs) in [
+                    ('str2str', str_case),
+                    ('lst2lst', lst_case),
+                    ('span_group', span_case),
+                ]:
+                yield (
+                    {'group': 'kernel', 'name': kernel, 'lang': lang, 'size': size_name},
+                    input_length,
+                    funcs,
+                )
+
+
+def _gen_replacement_group_funcs(edit_module, op, input_sequence):
+    _, label_aligner = op.transform(input_sequence)
+    replacement_group = label_aligner._forward_edit
+    transduce_func = label_aligner._forward_transduce_func
+    labels = gen_labels(len(input_sequence))
+
+    label_map = LabelMap(len(input_sequence))
+    label_map.propagate(replacement_group, transduce_func)
+
+    def propagate_label_map():
+        LabelMap(len(input_sequence)).propagate(replacement_group, transduce_func)
+
+    funcs = {
+        'apply': lambda: edit_module.apply(input_sequence, replacement_group),
+        'inverse': lambda: edit_module.inverse(input_sequence, replacement_group),
+        'propagate': lambda: propagate_by_replacement_group(
+            labels, replacement_group, transduce_func),
+        'label_map_propagate': propagate_label_map,
+        'label_map_apply': lambda: label_map.apply(labels),
+    }
+    return len(input_sequence), funcs
+
+
+def _gen_span_group_funcs(utterance: str):
+    _, label_aligner = EngTokenizer().transform(utterance)
+    # span group is based on the utterance whose whitespaces are removed
+    utterance = str2str.apply(utterance, label_aligner._forward_edit['replacement_group'])
+    span_group = label_aligner._forward_edit['span_group']
+    tokens = str2lst.apply(utterance, span_group)
+    labels = gen_labels(len(utterance))
+    token_labels = gen_labels(len(tokens))
+
+    funcs = {
+        'str2lst_apply': lambda: str2lst.apply(utterance, span_group),
+        'lst2str_apply': lambda: lst2str.apply(tokens, span_group),
+        'reduce': lambda: reduce_by_span_group(labels, span_group),
+        'expand': lambda: expand_by_span_group(token_labels, span_group),
+    }
+    return len(utterance), funcs
@@ -0,0 +1,106 @@
+"""Benchmark cases of operators
+
+Every operator exported by `uttut.pipeline.ops` has a case, which measures
+- transform: Operator.transform of a sequence
+- label_transform: LabelAligner.transform of entity labels
+- inverse_transform: LabelAligner.inverse_transform of the transformed labels
+"""
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from uttut.pipeline.ops import (
+    AddWhitespaceAroundCJK,
+    AddWhitespaceAroundPunctuation,
+    MergeWhiteSpaceCharacters,
+    StripWhiteSpaceCharacters,
+    WhiteSpaceTokenizer,
+)
+from uttut.pipeline.ops.base import Operator
+import uttut.pipeline.ops as ops_module
+from uttut.pipeline.pipe import Pipe
+
+from .corpus import gen_corpus, gen_labels
+
+
+USER_WORDS = ['bubble milk tea', 'milk', '珍珠奶茶', '紅茶', '拿鐵', '大杯']
+
+
+def gen_tokens(utterance: str) -> List[str]:
+    pipe = Pipe()
+    for op in [
+            AddWhitespaceAroundCJK(),
+            AddWhitespaceAroundPunctuation(),
+            MergeWhiteSpaceCharacters(),
+            StripWhiteSpaceCharacters(),
+            WhiteSpaceTokenizer(),
+        ]:
+        pipe.add_op(op)
+    tokens, _, _ = pipe.transform_sequence(utterance, intermediate_mode='none')
+    return tokens
+
+
+def gen_token2index(corpus) -> Dict[str, int]:
+    tokens = sorted({
+        token
+        for utterances in corpus.values()
+        for utterance in utterances.values()
+        for token in gen_tokens(utterance)
+    })
+    token2index = {'<unk>': 0}
+    for token in tokens[::2]:  # leave the others unknown
+        token2index[token] = len(token2index)
+    return token2index
+
+
+def gen_vocab(token2index: Dict[str, int]) -> Dict[str, int]:
+    vocab = dict(token2index)
+    for token in list(token2index):
+        for char in token:
+            vocab.setdefault(char, len(vocab))
+            vocab.setdefault('##' + char, len(vocab))
+    vocab.setdefault('[UNK]', len(vocab))
+    return vocab
+
+
+def gen_op_kwargs(corpus) -> Dict[str, Dict]:
+    """Keyword arguments of operators, defaults are used if not listed"""
+    token2index = gen_token2index(corpus)
+    return {
+        'AddWhitespaceAroundWordnZhChar': {'user_words': USER_WORDS},
+        'CustomWordTokenizer': {'user_words': USER_WORDS},
+        'ReplaceAwithB': {'a': 'milk', 'b': '_drink_'},
+        'Pad': {'maxlen': 64},
+        'Token2Index': {'token2index': token2index},
+        'Token2IndexwithHash': {'token2index': token2index},
+        'SpanSubwords': {'vocab': gen_vocab(token2index), 'unk_token': '[UNK]'},
+    }
+
+
+def get_op_names() -> List[str]:
+    return sorted(name for name in ops_module.__all__ if name != 'Operator')
+
+
+def gen_cases() -> Iterator[Tuple[Dict, int, Dict[str, Callable]]]:
+    """Yield (case info, input length, functions to be measured)"""
+    corpus = gen_corpus()
+    op_kwargs = gen_op_kwargs(corpus)
+    for op_name in get_op_names():
+        op = Operator.from_dict({'op_name': op_name, 'op_kwargs': op_kwargs.get(op_name, {})})
+        for lang, utterances in corpus.items():
+            for size_name, utterance in utterances.items():
+                input_sequence = utterance if op.input_type == str else gen_tokens(utterance)
+                yield (
+                    {'group': 'op', 'name': op_name, 'lang': lang, 'size': size_name},
+                    len(input_sequence),
+                    _gen_funcs(op, input_sequence),
+                )
+
+
+def _gen_funcs(op: Operator, input_sequence) -> Dict[str, Callable]:
+    labels = gen_labels(len(input_sequence))
+    _, label_aligner = op.transform(input_sequence)
+    output_labels = label_aligner.transform(labels)
+    return {
+        'transform': lambda: op.transform(input_sequence),
+        'label_transform': lambda: label_aligner.transform(labels),
+        'inverse_transform': lambda: label_aligner.inverse_transform(output_labels),
+    }
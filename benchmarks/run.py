@@ -0,0 +1,94 @@
+import argparse
+import json
+import platform
+import re
+import sys
+from typing import Dict, List
+
+from uttut.__version__ import __version__
+
+from . import kernels, ops
+from .timer import measure
+
+
+SUITES = {'op': ops, 'kernel': kernels}
+
+
+def run(
+        suites: List[str] = None,
+        pattern: str = None,
+        min_time: float = 0.05,
+        repeat: int = 3,
+    ) -> Dict:
+    """Run benchmarks
+
+    Args:
+        suites (strs): names of suites in SUITES. If None, all suites are run.
+        pattern (str): regex, only cases whose `group/name/lang/size` match are run.
+        min_time (float): min seconds of a timing round, see `measure`.
+        repeat (int): number of timing rounds.
+
+    Return:
+        report (dict): JSON serializable results
+
+    """
+    if suites is None:
+        suites = list(SUITES)
+    regex = re.compile(pattern) if pattern else None
+
+    results = []
+    for suite in suites:
+        for info, input_length, funcs in SUITES[suite].gen_cases():
+            case_name = '/'.join([info['group'], info['name'], info['lang'], info['size']])
+            if regex is not None and not regex.search(case_name):
+                continue
+            for metric, func in funcs.items():
+                seconds = measure(func, min_time=min_time, repeat=repeat)
+                results.append({
+                    **info,
+                    'metric': metric,
+                    'input_length': input_length,
+                    'seconds_per_call': seconds,
+                    'calls_per_sec': 1 / seconds,
+                    'units_per_sec': input_length / seconds,
+                })
+
+    return {
+        'meta': {
+            'uttut': __version__,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'min_time': min_time,
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Microbenchmarks of uttut operators and edit kernels.',
+    )
+    parser.add_argument('--suite', choices=list(SUITES), action='append',
+                        help='suites to run, all if not given')
+    parser.add_argument('--filter', help='regex of case names, e.g. "op/Pad/zh"')
+    parser.add_argument('--min-time', type=float, default=0.05,
+                        help='min seconds of a timing round')
+    parser.add_argument('--repeat', type=int, default=3, help='number of timing rounds')
+    parser.add_argument('--output', help='path of the JSON report, stdout if not given')
+    args = parser.parse_args(argv)
+
+    report = run(
+        suites=args.suite,
+        pattern=args.filter,
+        min_time=args.min_time,
+        repeat=args.repeat,
+    )
+    if args.output:
+        with open(args.output, 'w') as f_out:
+            json.dump(report, f_out, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
@@ -0,0 +1,31 @@
+import json
+
+from ..ops import get_op_names
+from ..run import main, run
+
+
+def test_run():
+    report = run(pattern='/short$', min_time=1e-4, repeat=1)
+    results = report['results']
+
+    assert set(get_op_names()) == {
+        result['name'] for result in results if result['group'] == 'op'}
+    assert {'transform', 'label_transform', 'inverse_transform'} == {
+        result['metric'] for result in results if result['group'] == 'op'}
+    assert {'apply', 'inverse', 'propagate', 'reduce', 'expand'} < {
+        result['metric'] for result in results if result['group'] == 'kernel'}
+    assert {'en', 'zh', 'mixed'} == {result['lang'] for result in results}
+    assert {'short'} == {result['size'] for result in results}
+    assert all(result['seconds_per_call'] > 0 for result in results)
+
+
+def test_main(tmpdir):
+    path = str(tmpdir.join('report.json'))
+    main([
+        '--suite', 'kernel', '--filter', 'str2str/zh/medium',
+        '--min-time', '1e-4', '--repeat', '1', '--output', path,
+    ])
+    with open(path, 'r') as f_in:
+        report = json.load(f_in)
+    assert {'str2str'} == {result['name'] for result in report['results']}
+    assert 'uttut' in report['meta']
@@ -0,0 +1,37 @@
+import time
+from typing import Callable
+
+
+def measure(func: Callable, min_time: float = 0.05, repeat: int = 3) -> float:
+    """Best seconds per call of func
+
+    The number of calls per round is doubled until a round takes at least
+    min_time, then the best of `repeat` rounds is taken, like `timeit`.
+
+    Args:
+        func (callable): called without arguments
+        min_time (float): min seconds of a round
+        repeat (int): number of rounds
+
+    Return:
+        seconds per call (float)
+
+    """
+    number = 1
+    while True:
+        elapsed = _time_calls(func, number)
+        if elapsed >= min_time:
+            break
+        number *= 2
+
+    best = elapsed
+    for _ in range(repeat - 1):
+        best = min(best, _time_calls(func, number))
+    return best / number
+
+
+def _time_calls(func: Callable, number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return time.perf_counter() - start
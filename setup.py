@@ -30,6 +30,7 @@ if use_cython:
         Extension('uttut.pipeline.edit.validation', ['uttut/pipeline/edit/validation.pyx']),
         Extension('uttut.pipeline.edit.label_propagation',
                   ['uttut/pipeline/edit/label_propagation.pyx']),
+        Extension('uttut.pipeline.edit.label_map', ['uttut/pipeline/edit/label_map.pyx']),
         Extension(
             name='uttut.pipeline.ops.utils.consistent_hash',
             sources=[
@@ -39,6 +40,14 @@ if use_cython:
             extra_compile_args=['-O3'],
             language='c++',
         ),
+        Extension('uttut.pipeline.ops.utils.unicode_class',
+                  ['uttut/pipeline/ops/utils/unicode_class.pyx']),
+        Extension('uttut.pipeline.ops.utils.double_array_trie',
+                  ['uttut/pipeline/ops/utils/double_array_trie.pyx']),
+        Extension('uttut.pipeline.ops.utils.token_lookup',
+                  ['uttut/pipeline/ops/utils/token_lookup.pyx']),
+        Extension('uttut.pipeline.ops.utils.char_ngram',
+                  ['uttut/pipeline/ops/utils/char_ngram.pyx']),
     ]
     ext_modules = cythonize(
         ext_modules,
@@ -63,9 +72,18 @@ else:
         Extension('uttut.pipeline.edit.validation', ['uttut/pipeline/edit/validation.c']),
         Extension('uttut.pipeline.edit.label_propagation',
                   ['uttut/pipeline/edit/label_propagation.c']),
+        Extension('uttut.pipeline.edit.label_map', ['uttut/pipeline/edit/label_map.c']),
         Extension('uttut.pipeline.ops.utils.consistent_hash',
                   ['uttut/pipeline/ops/utils/consistent_hash.cpp',
                    'uttut/pipeline/ops/utils/MurmurHash3.cpp']),
+        Extension('uttut.pipeline.ops.utils.unicode_class',
+                  ['uttut/pipeline/ops/utils/unicode_class.c']),
+        Extension('uttut.pipeline.ops.utils.double_array_trie',
+                  ['uttut/pipeline/ops/utils/double_array_trie.c']),
+        Extension('uttut.pipeline.ops.utils.token_lookup',
+                  ['uttut/pipeline/ops/utils/token_lookup.c']),
+        Extension('uttut.pipeline.ops.utils.char_ngram',
+                  ['uttut/pipeline/ops/utils/char_ngram.c']),
     ]
 
 here = Path(__file__).parent
@@ -89,7 +107,7 @@ setup(
     license=about["__license__"],
     author=about["__author__"],
     url=about["__url__"],
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks', 'benchmarks.*']),
     install_requires=[],
     long_description=long_description,
     long_description_content_type="text/markdown",
@@ -1,2 +1,3 @@
 from . import ops
 from .pipe import Pipe
+from .vocabulary import Vocabulary
@@ -0,0 +1,340 @@
+"""Binary artifact of Pipe
+
+Layout (little-endian):
+
+    offset  size  content
+    0       8     MAGIC
+    8       2     format version (uint16)
+    10      2     reserved
+    12      4     length of header (uint32)
+    16      32    SHA-256 digest of everything after offset 48
+    48      H     header, compact JSON in UTF-8
+    ...           blobs, each section is aligned to 8 bytes
+
+Large configs of operators are stored as blobs instead of JSON, which are
+smaller and faster to decode, e.g. a vocabulary (str -> int) is stored
+as an int64 array of indices, a uint32 array of character offsets and the
+concatenated UTF-8 text of tokens. Blobs are decoded into Python objects on load.
+
+The tries built by operators from configs, e.g. of `user_words`, are stored
+as `DoubleArrayTrie.to_bytes` blobs. They are loaded by
+`DoubleArrayTrie.from_buffer` without copying, so if the artifact is loaded
+by mmap, see `Pipe.load_artifact`, their arrays are paged in on demand.
+
+The checksum is an integrity check only, it does not prove that the configs
+are valid. `Pipe.to_artifact` and `json_to_artifact` only write configs of
+operators which are created with validation. A `Vocabulary` shared by operators is stored
+once with its id, and it is decoded only if no vocabulary of the id is loaded,
+see `uttut.pipeline.vocabulary`.
+"""
+from array import array
+from functools import partial
+from typing import Dict, List, Tuple
+import hashlib
+import json
+import struct
+import sys
+
+from . import vocabulary
+from .ops.base import Operator
+from .ops.utils.double_array_trie import DoubleArrayTrie
+from .vocabulary import Vocabulary
+
+
+MAGIC = b'UTTUTPA\x00'
+FORMAT_VERSION = 1
+
+_PREAMBLE = struct.Struct('<8sHHI32s')
+_ALIGNMENT = 8
+
+
+class ArtifactError(ValueError):
+    pass
+
+
+def dumps(steps: List[Dict], checkpoints: Dict[str, int]) -> bytes:
+    """Encode steps and checkpoints of a pipe into an artifact
+
+    The blobs of steps of the same fingerprint are written once, and so is
+    a table (dict or list) shared by several steps, e.g. a `Vocabulary`.
+
+    Args:
+        steps (dicts): [{'op_name': name, 'op_kwargs': kwargs}, ...],
+            a step may have 'fingerprint', the fingerprint of its operator,
+            and 'tries', (key, value) = (name, output of `DoubleArrayTrie.to_bytes`).
+        checkpoints (dict): (key, value) = (name, index of step)
+
+    Return:
+        artifact (bytes)
+
+    """
+    writer = _BlobWriter()
+    header_steps = []
+    written_steps = {}  # fingerprint -> header step
+    for step in steps:
+        fingerprint = step.get('fingerprint')
+        if fingerprint in written_steps:
+            header_steps.append(written_steps[fingerprint])
+            continue
+
+        op_kwargs = {}
+        blobs = {}
+        for name, value in step['op_kwargs'].items():
+            blob = writer.write(value)
+            if blob is None:
+                op_kwargs[name] = value
+            else:
+                op_kwargs[name] = None  # placeholder to keep the order of kwargs
+                blobs[name] = blob
+        header_step = {'op_name': step['op_name'], 'op_kwargs': op_kwargs, 'blobs': blobs}
+        if step.get('tries'):
+            header_step['tries'] = {
+                name: writer.write_bytes(data) for name, data in step['tries'].items()
+            }
+        header_steps.append(header_step)
+        if fingerprint is not None:
+            written_steps[fingerprint] = header_step
+
+    header = json.dumps(
+        {'steps': header_steps, 'checkpoints': checkpoints},
+        ensure_ascii=False,
+        separators=(',', ':'),
+    ).encode('utf-8')
+    header += b' ' * (-(_PREAMBLE.size + len(header)) % _ALIGNMENT)
+    body = header + writer.getvalue()
+    preamble = _PREAMBLE.pack(
+        MAGIC, FORMAT_VERSION, 0, len(header), hashlib.sha256(body).digest())
+    return preamble + body
+
+
+def loads(buffer) -> Tuple[List[Dict], Dict[str, int]]:
+    """Decode an artifact
+
+    The checksum is always verified, so a corrupted artifact is rejected.
+    The configs are not validated, see `Pipe.from_artifact`.
+
+    Arg:
+        buffer: bytes-like object, e.g. bytes or mmap
+
+    Returns:
+        steps (dicts): [{'op_name': name, 'op_kwargs': kwargs}, ...],
+            a step has 'tries', (key, value) = (name, DoubleArrayTrie),
+            if its tries are stored.
+        checkpoints (dict)
+
+    Raise:
+        ArtifactError: If the magic, version or checksum is not valid.
+
+    """
+    view = memoryview(buffer)
+    if len(view) < _PREAMBLE.size:
+        raise ArtifactError('Artifact is truncated.')
+    magic, version, _, header_size, digest = _PREAMBLE.unpack_from(view)
+    if magic != MAGIC:
+        raise ArtifactError('Not an uttut pipe artifact.')
+    if version > FORMAT_VERSION:
+        raise ArtifactError(
+            f"Artifact version {version} is not supported, "
+            f"the latest version is {FORMAT_VERSION}.",
+        )
+    body = view[_PREAMBLE.size:]
+    if hashlib.sha256(body).digest() != digest:
+        raise ArtifactError('Checksum mismatch, the artifact is corrupted.')
+
+    header = json.loads(bytes(body[:header_size]).decode('utf-8'))
+    blobs = body[header_size:]
+    values = {}  # location -> value, a blob shared by steps is read once
+    steps = [_read_step(blobs, step, values) for step in header['steps']]
+    return steps, header['checkpoints']
+
+
+def op_to_step(op: Operator) -> Dict:
+    """A step of `dumps` from an operator"""
+    step = {
+        'op_name': op.__class__.__name__,
+        'op_kwargs': op.configs,
+        'fingerprint': op.fingerprint,
+    }
+    tries = op._get_tries()
+    if tries:
+        step['tries'] = {name: trie.to_bytes() for name, trie in tries.items()}
+    return step
+
+
+def json_to_artifact(serialized_str: str) -> bytes:
+    """Convert the output of `Pipe.serialize` into an artifact
+
+    The operators are created with validation as `Pipe.deserialize` does.
+
+    Raise:
+        ValueError, KeyError or TypeError: If the configs of an operator are not valid.
+
+    """
+    pipe_bundle = json.loads(serialized_str)
+    serialized_vocabularies = pipe_bundle.get('vocabularies', {})
+
+    def get_vocabulary(vocab_id: str) -> Vocabulary:
+        return Vocabulary.load_serialized(serialized_vocabularies[vocab_id])
+
+    steps = []
+    for step_info in pipe_bundle['steps']:
+        if isinstance(step_info, str):
+            step_info = json.loads(step_info)
+        # backward compatibility
+        elif not isinstance(step_info, dict):
+            raise TypeError("Invalid json string format!")
+        op = Operator.from_dict({
+            'op_name': step_info['op_name'],
+            'op_kwargs': vocabulary.resolve(step_info['op_kwargs'], get_vocabulary),
+        })
+        steps.append(op_to_step(op))
+    return dumps(steps, pipe_bundle['checkpoints'])
+
+
+def artifact_to_json(buffer) -> str:
+    """Convert an artifact into the format of `Pipe.serialize`"""
+    steps, checkpoints = loads(buffer)
+    vocabularies = {}
+    pipe_bundle = {
+        'steps': [
+            json.dumps(
+                {
+                    'op_name': step['op_name'],
+                    'op_kwargs': vocabulary.externalize(step['op_kwargs'], vocabularies),
+                },
+                ensure_ascii=False,
+                indent=2,
+            )
+            for step in steps
+        ],
+        'checkpoints': checkpoints,
+    }
+    if vocabularies:
+        pipe_bundle['vocabularies'] = {
+            vocab_id: vocab.serialize() for vocab_id, vocab in vocabularies.items()
+        }
+    return json.dumps(pipe_bundle, ensure_ascii=False, indent=2)
+
+
+class _BlobWriter:
+
+    def __init__(self):
+        self._chunks = []
+        self._size = 0
+        self._vocabularies = {}  # id -> description of blob
+        self._tables = {}  # id of object -> (object, description of blob)
+
+    def getvalue(self) -> bytes:
+        return b''.join(self._chunks)
+
+    def write(self, value):
+        """Write value as a blob if it is a str table, return its description"""
+        if isinstance(value, Vocabulary):
+            if value.id not in self._vocabularies:
+                self._vocabularies[value.id] = {
+                    'kind': 'str2int',
+                    'count': len(value),
+                    'values': self._write_array(array('q', value.values())),
+                    **self._write_strs(value.keys()),
+                    'vocabulary': value.id,
+                }
+            return self._vocabularies[value.id]
+        if id(value) in self._tables:
+            return self._tables[id(value)][1]
+        if _is_str2int(value):
+            blob = {
+                'kind': 'str2int',
+                'count': len(value),
+                'values': self._write_array(array('q', value.values())),
+                **self._write_strs(value.keys()),
+            }
+        elif _is_strs(value):
+            blob = {'kind': 'strs', 'count': len(value), **self._write_strs(value)}
+        else:
+            return None
+        # value is kept to keep its id unique
+        self._tables[id(value)] = (value, blob)
+        return blob
+
+    def _write_strs(self, strs) -> Dict:
+        offsets = array('I', [0])
+        for string in strs:
+            offsets.append(offsets[-1] + len(string))
+        return {
+            'offsets': self._write_array(offsets),
+            'text': self.write_bytes(''.join(strs).encode('utf-8')),
+        }
+
+    def _write_array(self, values: array):
+        if sys.byteorder == 'big':
+            values.byteswap()
+        return self.write_bytes(values.tobytes())
+
+    def write_bytes(self, data: bytes):
+        location = [self._size, len(data)]
+        padding = b'\x00' * (-len(data) % _ALIGNMENT)
+        self._chunks.extend([data, padding])
+        self._size += len(data) + len(padding)
+        return location
+
+
+def _is_str2int(value) -> bool:
+    if not isinstance(value, dict) or len(value) == 0:
+        return False
+    # bool is excluded although it is a subclass of int
+    return all(isinstance(key, str) for key in value) and \
+        all(type(val) is int for val in value.values())
+
+
+def _is_strs(value) -> bool:
+    return isinstance(value, list) and len(value) > 0 and all(isinstance(v, str) for v in value)
+
+
+def _read_step(blobs: memoryview, step: Dict, values: Dict) -> Dict:
+    op_kwargs = dict(step['op_kwargs'])
+    for name, blob in step['blobs'].items():
+        location = tuple(blob['offsets'])
+        if location not in values:
+            if 'vocabulary' in blob:
+                values[location] = Vocabulary.load(
+                    blob['vocabulary'], partial(_read_blob, blobs, blob))
+            else:
+                values[location] = _read_blob(blobs, blob)
+        op_kwargs[name] = values[location]
+    output_step = {'op_name': step['op_name'], 'op_kwargs': op_kwargs}
+
+    tries = {}
+    for name, location in step.get('tries', {}).items():
+        location = tuple(location)
+        if location not in values:
+            start, size = location
+            values[location] = DoubleArrayTrie.from_buffer(blobs[start: start + size])
+        tries[name] = values[location]
+    if tries:
+        output_step['tries'] = tries
+    return output_step
+
+
+def _read_blob(blobs: memoryview, blob: Dict):
+    strs = _read_strs(blobs, blob)
+    if blob['kind'] == 'strs':
+        return strs
+    if blob['kind'] == 'str2int':
+        return dict(zip(strs, _read_array(blobs, blob['values'], 'q')))
+    raise ArtifactError(f"Unknown kind of blob: {blob['kind']}")
+
+
+def _read_strs(blobs: memoryview, blob: Dict) -> List[str]:
+    offsets = _read_array(blobs, blob['offsets'], 'I')
+    start, size = blob['text']
+    text = bytes(blobs[start: start + size]).decode('utf-8')
+    return [text[offsets[i]: offsets[i + 1]] for i in range(blob['count'])]
+
+
+def _read_array(blobs: memoryview, location: List[int], typecode: str) -> List[int]:
+    start, size = location
+    values = array(typecode)
+    values.frombytes(blobs[start: start + size])
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values.tolist()
@@ -0,0 +1,122 @@
+from collections import OrderedDict, namedtuple
+import sys
+import threading
+
+
+CacheInfo = namedtuple(
+    'CacheInfo',
+    ['hits', 'misses', 'evictions', 'entries', 'nbytes', 'max_entries', 'max_bytes'],
+)
+
+
+class LRUCache:
+
+    """A bounded least-recently-used cache
+
+    The least recently used entries are evicted when the number of entries
+    exceeds max_entries or the total size exceeds max_bytes.
+
+    Args:
+        max_entries (int): max number of entries. If None, it is unbounded.
+        max_bytes (int): max total size of entries in bytes. If None, it is unbounded.
+
+    Raises:
+        ValueError: If max_entries or max_bytes < 1.
+
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = None):
+        for name, limit in [('max_entries', max_entries), ('max_bytes', max_bytes)]:
+            if limit is not None and limit < 1:
+                raise ValueError(f"{name} should be a positive integer or None. Got {limit}")
+
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()  # (key, value) = (key, (value, nbytes))
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Retrieve the value of key and mark it as the most recently used
+
+        Arg:
+            key: a hashable object
+
+        Return:
+            the cached value, None if key is not cached
+
+        """
+        with self._lock:
+            if key not in self._entries:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+    def put(self, key, value, nbytes: int):
+        """Store value of key and evict the least recently used entries if needed
+
+        A value larger than max_bytes is not stored.
+
+        Args:
+            key: a hashable object
+            value: the value to be cached
+            nbytes (int): size of value in bytes
+
+        """
+        if self._max_bytes is not None and nbytes > self._max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._nbytes -= self._entries.pop(key)[1]
+
+            self._entries[key] = (value, nbytes)
+            self._nbytes += nbytes
+            while self._exceeds_limits():
+                _, (_, evicted_nbytes) = self._entries.popitem(last=False)
+                self._nbytes -= evicted_nbytes
+                self._evictions += 1
+
+    def _exceeds_limits(self):
+        if self._max_entries is not None and len(self._entries) > self._max_entries:
+            return True
+        return self._max_bytes is not None and self._nbytes > self._max_bytes
+
+    def clear(self):
+        """Remove all entries, the counters are kept"""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._entries),
+            nbytes=self._nbytes,
+            max_entries=self._max_entries,
+            max_bytes=self._max_bytes,
+        )
+
+    def __getstate__(self):
+        # entries are not shipped, e.g. to worker processes
+        return {'max_entries': self._max_entries, 'max_bytes': self._max_bytes}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+
+def get_nbytes(obj) -> int:
+    """Estimate size of a str or a (nested) list of str in bytes"""
+    nbytes = sys.getsizeof(obj)
+    if isinstance(obj, (list, tuple)):
+        nbytes += sum(get_nbytes(element) for element in obj)
+    return nbytes
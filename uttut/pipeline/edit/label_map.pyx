@@ -0,0 +1,319 @@
+from typing import Callable, List, Tuple
+
+from .replacement cimport Replacement, ReplacementGroup  # noqa: E999
+from .span cimport Span, SpanGroup
+from .label_propagation import _get_most_common_label
+
+
+cdef class LabelMap:
+
+    '''Composition of label propagations
+
+    A `LabelMap` records a chain of `propagate_by_replacement_group`,
+    `reduce_by_span_group` and `expand_by_span_group` calls and composes them
+    into one mapping, so that the labels are mapped in a single pass.
+
+    The output sequence is represented by a list of pieces. A piece is a tuple
+    (rule, start, length) which covers `length` output positions:
+        rule is None: copy labels[start: start + length] from the input labels
+        otherwise: take [start: start + length] of the output of the rule
+
+    A rule computes `transduce_func(source_labels, output_size)` where
+    source_labels are collected from its own source pieces.
+
+    Only the lengths of the edits are kept, thus the mapping does not hold
+    any input sequence.
+
+    E.g.
+    >>> label_map = LabelMap(3)
+    >>> label_map.propagate(ReplacementGroup.add_all([(1, 2, 'abc')]))
+    >>> label_map.apply([1, 2, 3])
+    [1, 2, 2, 2, 3]
+
+    Args:
+        input_length (int): the length of input labels
+    '''
+
+    cdef readonly unsigned int input_length
+    cdef readonly unsigned int output_length
+    cdef list _pieces
+
+    def __cinit__(self, unsigned int input_length):
+        self.input_length = input_length
+        self.output_length = input_length
+        self._pieces = [(None, 0, input_length)] if input_length > 0 else []
+
+    @property
+    def pieces(self) -> List[Tuple]:
+        return self._pieces
+
+    cpdef void propagate(  # type: ignore
+            self,
+            ReplacementGroup replacement_group,
+            object transduce_func=None,
+        ) except *:
+        '''Compose `propagate_by_replacement_group`'''
+        cdef _PieceReader reader
+        cdef list pieces, new_values
+        cdef unsigned int i_start, output_size, i
+        cdef unsigned int[:] starts, ends
+        cdef int output_length
+
+        if transduce_func is None:
+            transduce_func = _get_most_common_label
+
+        replacement_group._validate_done()
+        starts = replacement_group._starts
+        ends = replacement_group._ends
+        new_values = replacement_group._new_values
+
+        reader = _PieceReader(self._pieces)
+        pieces = []
+        i_start = 0
+        output_length = self.output_length
+        for i in range(starts.shape[0]):
+            _extend_pieces(pieces, reader.read(starts[i] - i_start))
+            output_size = len(new_values[i])
+            if output_size > 0:
+                pieces.append((
+                    _Rule(
+                        transduce_func,
+                        output_size,
+                        reader.read(ends[i] - starts[i]),
+                    ),
+                    0,
+                    output_size,
+                ))
+            else:
+                reader.read(ends[i] - starts[i])
+            output_length += output_size
+            output_length -= ends[i] - starts[i]
+            i_start = ends[i]
+        _extend_pieces(pieces, reader.read(self.output_length - i_start))
+
+        self._pieces = pieces
+        self.output_length = output_length
+
+    cpdef void propagate_inverse(  # type: ignore
+            self,
+            ReplacementGroup replacement_group,
+            object transduce_func=None,
+        ) except *:
+        '''Compose `propagate_by_replacement_group` with the inverse of replacement_group
+
+        This is equivalent to propagate(inverse(input_sequence, replacement_group))
+        where `inverse` is `str2str.inverse` or `lst2lst.inverse`, but it only
+        needs the forward replacement_group.
+        '''
+        cdef _PieceReader reader
+        cdef list pieces, new_values
+        cdef unsigned int i_start, start, before, after, i
+        cdef unsigned int[:] starts, ends
+        cdef int output_length
+
+        if transduce_func is None:
+            transduce_func = _get_most_common_label
+
+        replacement_group._validate_done()
+        starts = replacement_group._starts
+        ends = replacement_group._ends
+        new_values = replacement_group._new_values
+
+        reader = _PieceReader(self._pieces)
+        pieces = []
+        i_start = 0
+        start = 0  # start of replacement in the output of forward edit
+        output_length = self.output_length
+        for i in range(starts.shape[0]):
+            before = ends[i] - starts[i]
+            after = len(new_values[i])
+            start += starts[i] - i_start
+            _extend_pieces(pieces, reader.read(starts[i] - i_start))
+            if before > 0:
+                pieces.append((_Rule(transduce_func, before, reader.read(after)), 0, before))
+            else:
+                reader.read(after)
+            output_length += before
+            output_length -= after
+            start += after
+            i_start = ends[i]
+        _extend_pieces(pieces, reader.read(self.output_length - start))
+
+        self._pieces = pieces
+        self.output_length = output_length
+
+    cpdef void reduce(  # type: ignore
+            self,
+            SpanGroup span_group,
+            object transduce_func=None,
+        ) except *:
+        '''Compose `reduce_by_span_group`'''
+        cdef _PieceReader reader
+        cdef list pieces, sources
+        cdef unsigned int i
+        cdef unsigned int[:] starts, ends
+        cdef bint is_default_func
+
+        if transduce_func is None:
+            transduce_func = _get_most_common_label
+        is_default_func = transduce_func is _get_most_common_label
+
+        # empty span group and empty labels pair
+        if (len(span_group) == 0) and (self.output_length == 0):
+            return
+
+        span_group._validate_done()
+        starts = span_group._starts
+        ends = span_group._ends
+
+        if self.output_length != ends[starts.shape[0] - 1]:
+            raise ValueError('labels and span_group are not compatible.')
+
+        reader = _PieceReader(self._pieces)
+        pieces = []
+        for i in range(starts.shape[0]):
+            sources = reader.read(ends[i] - starts[i])
+            if is_default_func and ends[i] - starts[i] == 1:
+                # the most common label of a single label is itself
+                _extend_pieces(pieces, sources)
+            else:
+                pieces.append((_Rule(transduce_func, 1, sources), 0, 1))
+
+        self._pieces = pieces
+        self.output_length = len(span_group)
+
+    cpdef void expand(self, SpanGroup span_group) except *:  # type: ignore
+        '''Compose `expand_by_span_group`'''
+        cdef _PieceReader reader
+        cdef list pieces, sources
+        cdef unsigned int span_length, i
+        cdef unsigned int[:] starts, ends
+
+        if len(span_group) != self.output_length:
+            raise ValueError('labels and span_group are not compatible.')
+
+        # empty span group and empty labels pair
+        if len(span_group) == 0:
+            return
+
+        span_group._validate_done()
+        starts = span_group._starts
+        ends = span_group._ends
+
+        reader = _PieceReader(self._pieces)
+        pieces = []
+        for i in range(starts.shape[0]):
+            sources = reader.read(1)
+            span_length = ends[i] - starts[i]
+            if span_length == 1:
+                _extend_pieces(pieces, sources)
+            elif span_length > 1:
+                pieces.append((_Rule(_repeat_label, span_length, sources), 0, span_length))
+
+        self._pieces = pieces
+        self.output_length = ends[starts.shape[0] - 1]
+
+    def apply(self, list labels) -> List[int]:
+        '''Map labels through the composed propagations
+
+        Args:
+            labels (ints): has the same length as input_length
+
+        Raise:
+            ValueError if length of labels is not matched.
+
+        Return:
+            labels (ints): has the same length as output_length
+        '''
+        if len(labels) != self.input_length:
+            raise ValueError('Invalid input labels')
+        return _collect_labels(self._pieces, labels, {})
+
+
+cdef class _Rule:
+
+    cdef object transduce_func
+    cdef unsigned int output_size
+    cdef list sources
+
+    def __cinit__(self, object transduce_func, unsigned int output_size, list sources):
+        self.transduce_func = transduce_func
+        self.output_size = output_size
+        self.sources = sources
+
+
+cdef class _PieceReader:
+
+    '''Read pieces sequentially by the number of covered positions'''
+
+    cdef list _pieces
+    cdef unsigned int _index
+    cdef unsigned int _offset
+
+    def __cinit__(self, list pieces):
+        self._pieces = pieces
+        self._index = 0
+        self._offset = 0
+
+    cdef list read(self, unsigned int n_positions):
+        cdef list output = []
+        cdef object rule
+        cdef unsigned int start, length, n_taken
+
+        while n_positions > 0:
+            rule, start, length = self._pieces[self._index]
+            n_taken = min(n_positions, length - self._offset)
+            output.append((rule, start + self._offset, n_taken))
+            n_positions -= n_taken
+            self._offset += n_taken
+            if self._offset == length:
+                self._index += 1
+                self._offset = 0
+        return output
+
+
+cdef void _extend_pieces(list pieces, list new_pieces) except *:
+    cdef object rule, last_rule
+    cdef unsigned int start, length, last_start, last_length
+    cdef tuple piece
+
+    for piece in new_pieces:
+        if pieces:
+            # merge contiguous pieces of the same source
+            last_rule, last_start, last_length = pieces[-1]
+            rule, start, length = piece
+            if rule is last_rule and start == last_start + last_length:
+                pieces[-1] = (rule, last_start, last_length + length)
+                continue
+        pieces.append(piece)
+
+
+cdef list _collect_labels(list pieces, list labels, dict results):
+    cdef list output_labels = []
+    cdef object rule
+    cdef unsigned int start, length
+
+    for rule, start, length in pieces:
+        if rule is None:
+            output_labels.extend(labels[start: start + length])
+        else:
+            output_labels.extend(_evaluate(rule, labels, results)[start: start + length])
+    return output_labels
+
+
+cdef list _evaluate(_Rule rule, list labels, dict results):
+    cdef list output_labels
+
+    # a rule may be sliced into several pieces, evaluate it only once
+    if rule in results:
+        return results[rule]
+    output_labels = rule.transduce_func(
+        _collect_labels(rule.sources, labels, results),
+        rule.output_size,
+    )
+    results[rule] = output_labels
+    return output_labels
+
+
+def _repeat_label(list labels, unsigned int output_size) -> List[int]:
+    return labels * output_size
@@ -25,33 +25,38 @@ def propagate_by_replacement_group(
     Return:
         labels (list of ints)
     """
-    cdef unsigned int output_len, i_start, o_start, fixed_len, expand_size
-    cdef list output_labels
-    cdef Replacement replacement
+    cdef unsigned int output_len, i_start, o_start, fixed_len, expand_size, i
+    cdef unsigned int[:] starts, ends
+    cdef list output_labels, new_values
 
     if transduce_func is None:
         transduce_func = _get_most_common_label
 
+    replacement_group._validate_done()
+    starts = replacement_group._starts
+    ends = replacement_group._ends
+    new_values = replacement_group._new_values
+
     output_len = _compute_output_length(labels, replacement_group)
     output_labels = [ENTITY_LABEL['NOT_ENTITY']] * output_len
 
     i_start = 0
     o_start = 0
 
-    for replacement in replacement_group:
+    for i in range(starts.shape[0]):
         # before replacement
-        fixed_len = replacement.start - i_start
-        output_labels[o_start: o_start + fixed_len] = labels[i_start: replacement.start]
+        fixed_len = starts[i] - i_start
+        output_labels[o_start: o_start + fixed_len] = labels[i_start: starts[i]]
         o_start += fixed_len
 
         # replacement
-        expand_size = len(replacement.new_value)
+        expand_size = len(new_values[i])
         output_labels[o_start: o_start + expand_size] = transduce_func(
-            labels[replacement.start: replacement.end],
+            labels[starts[i]: ends[i]],
             expand_size,
         )
 
-        i_start = replacement.end
+        i_start = ends[i]
         o_start += expand_size
 
     # final
@@ -102,14 +107,19 @@ cdef unsigned int _count_and_get_most_common(list ints):
 
 cdef unsigned int _compute_output_length(input_seq, ReplacementGroup replacement_group):
     # use cases: str -> str or list -> list
-    cdef unsigned int len_iters, offset, after, before
-    cdef Replacement replacement
+    cdef unsigned int len_iters, offset, after, before, i
+    cdef unsigned int[:] starts, ends
+    cdef list new_values
+
+    starts = replacement_group._starts
+    ends = replacement_group._ends
+    new_values = replacement_group._new_values
 
     len_iters = len(input_seq)
     offset = 0
-    for replacement in replacement_group:
-        after = len(replacement.new_value)
-        before = replacement.end - replacement.start
+    for i in range(starts.shape[0]):
+        after = len(new_values[i])
+        before = ends[i] - starts[i]
         offset += after - before
 
     return len_iters + offset
@@ -123,8 +133,8 @@ def reduce_by_span_group(
     # use case: string -> list
 
     cdef unsigned int output_len, i
+    cdef unsigned int[:] starts, ends
     cdef list output_labels
-    cdef Span span
 
     if transduce_func is None:
         transduce_func = _get_most_common_label
@@ -133,14 +143,18 @@ def reduce_by_span_group(
     if (len(span_group) == 0) and (len(labels) == 0):
         return labels
 
-    if len(labels) != span_group[-1].end:
+    span_group._validate_done()
+    starts = span_group._starts
+    ends = span_group._ends
+    output_len = starts.shape[0]
+
+    if len(labels) != ends[output_len - 1]:
         raise ValueError('labels and span_group are not compatible.')
 
-    output_len = len(span_group)
     output_labels = [ENTITY_LABEL['NOT_ENTITY']] * output_len
 
-    for i, span in enumerate(span_group):
-        output_labels[i: i + 1] = transduce_func(labels[span.start: span.end], 1)
+    for i in range(output_len):
+        output_labels[i: i + 1] = transduce_func(labels[starts[i]: ends[i]], 1)
 
     return output_labels
 
@@ -148,9 +162,9 @@ def reduce_by_span_group(
 def expand_by_span_group(list labels, SpanGroup span_group) -> List[int]:
     # use case: list -> str
 
-    cdef unsigned int output_len, label, i
+    cdef unsigned int output_len, label, i, j
+    cdef unsigned int[:] starts, ends
     cdef list output_labels
-    cdef Span span
 
     if len(span_group) != len(labels):
         raise ValueError('labels and span_group are not compatible.')
@@ -159,11 +173,16 @@ def expand_by_span_group(list labels, SpanGroup span_group) -> List[int]:
     if len(span_group) == 0:
         return labels
 
-    output_len = span_group[-1].end
+    span_group._validate_done()
+    starts = span_group._starts
+    ends = span_group._ends
+
+    output_len = ends[starts.shape[0] - 1]
     output_labels = [ENTITY_LABEL['NOT_ENTITY']] * output_len
 
-    for span, label in zip(span_group, labels):
-        for i in range(span.start, span.end):
-            output_labels[i] = label
+    for i in range(starts.shape[0]):
+        label = labels[i]
+        for j in range(starts[i], ends[i]):
+            output_labels[j] = label
 
     return output_labels
@@ -1,20 +1,28 @@
 from .replacement import ReplacementGroup
 from .utils import (
-    _transform_sequence,
+    _apply_to_list,
+    _apply_to_list_in_place,
     _gen_inverse_replacement_group,
 )
 
 
 def apply(input_lst: list, replacement_group: ReplacementGroup) -> list:
-    output: list
-    n_replacement = len(replacement_group)
-    output = [[]] * (2 * n_replacement + 1)
-    output_lst = _transform_sequence(
-        input_seq=input_lst,
-        replacement_group=replacement_group,
-        output=output,
-    )
-    return sum(output_lst, [])
+    return _apply_to_list(input_lst, replacement_group)
+
+
+def apply_in_place(input_lst: list, replacement_group: ReplacementGroup) -> list:
+    '''Apply replacement_group to input_lst in place
+
+    It only supports replacements which preserve length, e.g. one token to one index.
+
+    Raise:
+        ValueError: If any replacement changes the length.
+
+    Return:
+        input_lst (list): the modified input_lst
+
+    '''
+    return _apply_to_list_in_place(input_lst, replacement_group)
 
 
 def inverse(input_lst: list, replacement_group: ReplacementGroup) -> ReplacementGroup:
@@ -16,6 +16,6 @@ def apply(input_lst: List[str], span_group: SpanGroup) -> str:
 def _validate_compatibility(input_lst: List[str], span_group: SpanGroup):
     if len(input_lst) != len(span_group):
         raise ValueError('Input list and span group have different length.')
-    for i, (token, span) in enumerate(zip(input_lst, span_group)):
-        if len(token) != span.end - span.start:
+    for i, (token, start, end) in enumerate(zip(input_lst, span_group.starts, span_group.ends)):
+        if len(token) != end - start:
             raise ValueError(f"{i}-th element is not compatible.")
@@ -1,3 +1,6 @@
+from cpython cimport array  # noqa: E999
+
+
 cdef class Replacement:  # noqa: E999
 
     cdef public unsigned int start
@@ -8,8 +11,14 @@ cdef class Replacement:  # noqa: E999
 
 cdef class ReplacementGroup:   # noqa: E999
 
+    cdef array.array _starts
+    cdef array.array _ends
+    cdef list _new_values
+    cdef list _annotations
     cdef list _replacements
     cdef bint _is_done
+    cdef bint _in_order
+    cdef object _value_type
 
     cpdef void add(
         self,
@@ -21,4 +30,7 @@ cdef class ReplacementGroup:   # noqa: E999
     cpdef void done(self, bint skip_sort=?) except *
     cpdef bint is_empty(self)
 
-    cdef void _validate_new_values(self) except *
+    cdef void _validate_done(self) except *
+    cdef list _get_replacements(self)
+    cdef void _set_replacements(self, list replacements)
+    cdef void _validate_new_values(self, list replacements) except *
@@ -1,12 +1,19 @@
 from typing import List
+import array as py_array
 import warnings
 
+from cpython cimport array  # noqa: E999
+
+from .trusted import is_trusted
 from .validation cimport (  # noqa: E211, E999
     _validate_start_end_in_c,
     _validate_disjoint_in_c,
 )
 
 
+cdef array.array _UINT_ARRAY = py_array.array('I')
+
+
 cdef class Replacement:
 
     '''Represents an edit to a Sequence such as a string or a list
@@ -71,12 +78,48 @@ cdef class Replacement:
         hash_num = hash((self.start, self.end))
         return hash_num
 
+    def __reduce__(self):
+        return (
+            self.__class__,
+            (self.start, self.end, self.new_value, self.annotation),
+        )
+
 
 cdef class ReplacementGroup:   # noqa: E999
 
+    '''A group of disjoint Replacements sorted by (start, end)
+
+    Replacements are stored as contiguous arrays of starts and ends (unsigned int)
+    and lists of new_values and annotations, which are read by the Cython kernels
+    through typed memoryviews. `Replacement` objects are only created when the
+    group is indexed or iterated in Python.
+
+    Replacements are usually added from left to right, so the ordering is
+    checked incrementally in `add`. If every replacement starts at or after the
+    end of the previous one (and is not an insertion at the same position),
+    the group is already sorted, disjoint and free of duplicates, then `done`
+    finalizes it without deduplication and sorting.
+    Otherwise, `done` falls back to deduplicate, sort and validate all replacements.
+
+    E.g.
+    >>> replacement_group = ReplacementGroup()
+    >>> replacement_group.add(0, 1, 'a')
+    >>> replacement_group.add(3, 3, 'b')  # in order
+    >>> replacement_group.done()  # O(1)
+    >>> replacement_group == ReplacementGroup.from_arrays([0, 3], [1, 3], ['a', 'b'])
+    True
+
+    '''
+
     def __cinit__(self):
-        self._replacements = []
+        self._starts = array.clone(_UINT_ARRAY, 0, False)
+        self._ends = array.clone(_UINT_ARRAY, 0, False)
+        self._new_values = []
+        self._annotations = []
+        self._replacements = None
         self._is_done = False
+        self._in_order = True
+        self._value_type = None
 
     cpdef void add(  # type: ignore
             self,
@@ -85,38 +128,101 @@ cdef class ReplacementGroup:   # noqa: E999
             object new_value,
             object annotation=None,
         ):
-        cdef Replacement replacement
+        cdef Py_ssize_t n_replacements
 
-        replacement = Replacement(
-            start=start,
-            end=end,
-            new_value=new_value,
-            annotation=annotation,
-        )
-        self._replacements.append(replacement)
+        _validate_start_end_in_c(start, end)
+        n_replacements = len(self._new_values)
+        if self._in_order:
+            if n_replacements == 0:
+                self._value_type = type(new_value)
+            else:
+                self._in_order = _follows(
+                    self._starts.data.as_uints[n_replacements - 1],
+                    self._ends.data.as_uints[n_replacements - 1],
+                    start,
+                    end,
+                ) and isinstance(new_value, self._value_type)
+
+        array.resize_smart(self._starts, n_replacements + 1)
+        array.resize_smart(self._ends, n_replacements + 1)
+        self._starts.data.as_uints[n_replacements] = start
+        self._ends.data.as_uints[n_replacements] = end
+        self._new_values.append(new_value)
+        self._annotations.append(annotation)
+        self._replacements = None
 
     cpdef void done(self, bint skip_sort=False) except *:
 
-        cdef unsigned int n_replacements
-
-        self._replacements = list(set(self._replacements))
-
-        n_replacements = len(self._replacements)
-
-        if (n_replacements != 0) and (not skip_sort):
-            self._validate_new_values()
-            self._replacements = _sort_replacements(self._replacements)
-            _validate_disjoint_in_c(self._replacements)
-
+        cdef list replacements
+
+        if self._in_order:
+            # sorted, disjoint and deduplicated already
+            self._is_done = True
+            return
+
+        if is_trusted():
+            # replacements are not validated
+            replacements = None
+            if (not skip_sort) and (not _is_sorted(self._starts, self._ends)):
+                replacements = self._get_replacements()
+                self._set_replacements(_sort_replacements(replacements))
+            if _has_same_spans(self._starts, self._ends):
+                # replacements of the same span are deduplicated and ordered by set
+                # from the original order as below, so the output is the same
+                if replacements is None:
+                    replacements = self._get_replacements()
+                replacements = list(set(replacements))
+                if not skip_sort:
+                    replacements = _sort_replacements(replacements)
+                self._set_replacements(replacements)
+            self._is_done = True
+            return
+
+        replacements = list(set(self._get_replacements()))
+
+        if (len(replacements) != 0) and (not skip_sort):
+            self._validate_new_values(replacements)
+            replacements = _sort_replacements(replacements)
+            _validate_disjoint_in_c(replacements)
+
+        self._set_replacements(replacements)
         self._is_done = True
 
-    cdef void _validate_new_values(self) except *:
-        target_type = type(self._replacements[0].new_value)
-        for i, rep in enumerate(self._replacements):
+    cdef void _validate_new_values(self, list replacements) except *:
+        target_type = type(replacements[0].new_value)
+        for i, rep in enumerate(replacements):
             if not isinstance(rep.new_value, target_type):
                 raise TypeError(
                     f"the new_value of {i}-th element is not a(an) {target_type.__name__}")
 
+    cdef void _validate_done(self) except *:
+        if not self._is_done:
+            raise RuntimeError('Please call `done` first.')
+
+    cdef list _get_replacements(self):
+        cdef Py_ssize_t i
+
+        if self._replacements is None:
+            self._replacements = [
+                Replacement(
+                    self._starts.data.as_uints[i],
+                    self._ends.data.as_uints[i],
+                    self._new_values[i],
+                    self._annotations[i],
+                )
+                for i in range(len(self._new_values))
+            ]
+        return self._replacements
+
+    cdef void _set_replacements(self, list replacements):
+        cdef Replacement replacement
+
+        self._starts = py_array.array('I', [replacement.start for replacement in replacements])
+        self._ends = py_array.array('I', [replacement.end for replacement in replacements])
+        self._new_values = [replacement.new_value for replacement in replacements]
+        self._annotations = [replacement.annotation for replacement in replacements]
+        self._replacements = replacements
+
     @classmethod
     def add_all(cls, list replacements):  # type: ignore
         '''
@@ -139,25 +245,100 @@ cdef class ReplacementGroup:   # noqa: E999
         replacement_group.done()
         return replacement_group
 
+    @classmethod
+    def from_arrays(cls, starts, ends, list new_values, list annotations=None):
+        '''Create a done ReplacementGroup from arrays
+
+        Args:
+            starts (ints): start indices, e.g. a list or an array.array
+            ends (ints): end indices
+            new_values (list): the new subsequences
+            annotations (list, optional): annotations of replacements
+
+        Raise:
+            ValueError: If the lengths are not matched or replacements are invalid.
+
+        Return:
+            ReplacementGroup
+
+        '''
+        cdef ReplacementGroup replacement_group
+        cdef unsigned int[:] starts_view, ends_view
+        cdef Py_ssize_t i, n_replacements
+
+        n_replacements = len(new_values)
+        if annotations is None:
+            annotations = [None] * n_replacements
+        if not (len(starts) == len(ends) == len(annotations) == n_replacements):
+            raise ValueError('starts, ends, new_values and annotations should have the same length.')
+
+        replacement_group = cls()
+        replacement_group._starts = py_array.array('I', starts)
+        replacement_group._ends = py_array.array('I', ends)
+        replacement_group._new_values = list(new_values)
+        replacement_group._annotations = list(annotations)
+
+        starts_view = replacement_group._starts
+        ends_view = replacement_group._ends
+        for i in range(n_replacements):
+            _validate_start_end_in_c(starts_view[i], ends_view[i])
+            if i == 0:
+                replacement_group._value_type = type(new_values[0])
+            elif replacement_group._in_order:
+                replacement_group._in_order = _follows(
+                    starts_view[i - 1],
+                    ends_view[i - 1],
+                    starts_view[i],
+                    ends_view[i],
+                ) and isinstance(new_values[i], replacement_group._value_type)
+
+        replacement_group.done()
+        return replacement_group
+
+    @property
+    def starts(self):
+        '''memoryview of start indices (unsigned int), should not be modified'''
+        self._validate_done()
+        return memoryview(self._starts)
+
+    @property
+    def ends(self):
+        '''memoryview of end indices (unsigned int), should not be modified'''
+        self._validate_done()
+        return memoryview(self._ends)
+
+    @property
+    def new_values(self) -> list:
+        self._validate_done()
+        return self._new_values
+
+    @property
+    def annotations(self) -> list:
+        self._validate_done()
+        return self._annotations
+
     cpdef bint is_empty(self):
-        return len(self._replacements) == 0
+        return len(self._new_values) == 0
 
     def __eq__(self, other):
         self._warn_not_done()
         if not isinstance(other, ReplacementGroup):
             return False
-        same_length = len(other) == len(self._replacements)
-        same_elements = set(other) == set(self._replacements)
+        same_length = len(other) == len(self._new_values)
+        same_elements = set(other) == set(self._get_replacements())
         return same_length and same_elements
 
     def __getitem__(self, value):
-        if not self._is_done:
-            raise RuntimeError('Please call `done` first.')
-        return self._replacements[value]
+        self._validate_done()
+        return self._get_replacements()[value]
+
+    def __iter__(self):
+        self._validate_done()
+        return iter(self._get_replacements())
 
     def __len__(self):
         self._warn_not_done()
-        return len(self._replacements)
+        return len(self._new_values)
 
     def _warn_not_done(self):
         if not self._is_done:
@@ -165,9 +346,32 @@ cdef class ReplacementGroup:   # noqa: E999
 
     def __repr__(self):
         cdef int n_elements
-        n_elements = len(self._replacements)
+        n_elements = len(self._new_values)
         return f"ReplacementGroup has {n_elements} elements"
 
+    def __reduce__(self):
+        return (
+            self.__class__,
+            (),
+            (
+                self._starts.tolist(),
+                self._ends.tolist(),
+                self._new_values,
+                self._annotations,
+                self._is_done,
+            ),
+        )
+
+    def __setstate__(self, state):
+        if len(state) == 2:  # list of Replacements
+            replacements, self._is_done = state
+            self._set_replacements(list(replacements))
+        else:
+            starts, ends, self._new_values, self._annotations, self._is_done = state
+            self._starts = py_array.array('I', starts)
+            self._ends = py_array.array('I', ends)
+        self._in_order = False
+
 
 cdef list _sort_replacements(list replacements):
 
@@ -176,3 +380,39 @@ cdef list _sort_replacements(list replacements):
     replacements = sorted(replacements, key=lambda e: e.end)
     replacements = sorted(replacements, key=lambda e: e.start)
     return replacements
+
+
+cdef inline bint _follows(
+        unsigned int last_start,
+        unsigned int last_end,
+        unsigned int start,
+        unsigned int end,
+    ):
+    '''Whether (start, end) can be placed after the last one in a sorted and disjoint group'''
+    if start < last_end:
+        return False
+    # insertions at the same position are ordered by set in `done`
+    return not (start == last_start and end == last_end)
+
+
+cdef bint _has_same_spans(unsigned int[:] starts, unsigned int[:] ends):
+    '''Whether any two adjacent replacements have the same span'''
+
+    cdef Py_ssize_t idx
+
+    for idx in range(1, starts.shape[0]):
+        if starts[idx - 1] == starts[idx] and ends[idx - 1] == ends[idx]:
+            return True
+    return False
+
+
+cdef bint _is_sorted(unsigned int[:] starts, unsigned int[:] ends):
+
+    cdef Py_ssize_t idx
+
+    for idx in range(1, starts.shape[0]):
+        if starts[idx - 1] > starts[idx]:
+            return False
+        if starts[idx - 1] == starts[idx] and ends[idx - 1] > ends[idx]:
+            return False
+    return True
@@ -1,3 +1,6 @@
+from cpython cimport array  # noqa: E999
+
+
 cdef class Span:  # noqa: E999
 
     cdef public unsigned int start
@@ -5,6 +8,8 @@ cdef class Span:  # noqa: E999
 
 cdef class SpanGroup:
 
+    cdef array.array _starts
+    cdef array.array _ends
     cdef list _spans
     cdef bint _is_done
 
@@ -12,4 +17,6 @@ cdef class SpanGroup:
     cpdef void done(self) except *
     cpdef bint is_empty(self)
 
-    cdef void _validate_contiguousness(self, list sorted_spans) except *
+    cdef void _validate_done(self) except *
+    cdef list _get_spans(self)
+    cdef void _set_spans(self, list spans)
@@ -1,10 +1,14 @@
 from typing import List, Tuple
+import array as py_array
 import warnings
 
-from .validation cimport (  # noqa: E999, E211
-    _validate_start_end_in_c,
-    _validate_disjoint_in_c,
-)
+from cpython cimport array  # noqa: E999
+
+from .trusted import is_trusted
+from .validation cimport _validate_start_end_in_c  # noqa: E999
+
+
+cdef array.array _UINT_ARRAY = py_array.array('I')
 
 
 cdef class Span:
@@ -35,43 +39,72 @@ cdef class Span:
     def __hash__(self):
         return hash((self.start, self.end))
 
+    def __reduce__(self):
+        return (self.__class__, (self.start, self.end))
+
 
 cdef class SpanGroup:
 
-    def __init__(self):
-        self._spans = []
+    '''A group of contiguous Spans sorted by end, starting from 0
+
+    Spans are stored as contiguous arrays of starts and ends (unsigned int),
+    which are read by the Cython kernels through typed memoryviews.
+    `Span` objects are only created when the group is indexed or iterated in Python.
+
+    E.g.
+    >>> span_group = SpanGroup.add_all([(0, 2), (2, 5)])
+    >>> span_group == SpanGroup.from_arrays([0, 2], [2, 5])
+    True
+
+    '''
+
+    def __cinit__(self):
+        self._starts = array.clone(_UINT_ARRAY, 0, False)
+        self._ends = array.clone(_UINT_ARRAY, 0, False)
+        self._spans = None
         self._is_done = False
 
     cpdef void add(self, unsigned int start, unsigned int end):  # type: ignore
-        cdef Span span
-        span = Span(start=start, end=end)
-        self._spans.append(span)
+        cdef Py_ssize_t n_spans
+
+        _validate_start_end_in_c(start, end)
+        n_spans = len(self._starts)
+        array.resize_smart(self._starts, n_spans + 1)
+        array.resize_smart(self._ends, n_spans + 1)
+        self._starts.data.as_uints[n_spans] = start
+        self._ends.data.as_uints[n_spans] = end
+        self._spans = None
 
     cpdef void done(self) except *:
 
-        cdef unsigned int n_spans = len(self._spans)
+        if not _is_sorted(self._ends):
+            self._set_spans(_sorted_spans(self._get_spans()))
 
-        if n_spans != 0:
-            self._spans = _sorted_spans(self._spans)
-            _validate_disjoint_in_c(self._spans)
-            self._validate_contiguousness(self._spans)
+        if (not is_trusted()) and len(self._starts) != 0:
+            _validate_disjoint(self._starts, self._ends)
+            _validate_contiguousness(self._starts, self._ends)
         self._is_done = True
 
-    cdef void _validate_contiguousness(self, list sorted_spans) except *:
+    cdef void _validate_done(self) except *:
+        if not self._is_done:
+            raise RuntimeError('Please call `done` first.')
 
-        cdef unsigned int n_spans, idx
-        cdef Span span_current, span_next
+    cdef list _get_spans(self):
+        cdef Py_ssize_t i
 
-        n_spans = len(sorted_spans)
+        if self._spans is None:
+            self._spans = [
+                Span(self._starts.data.as_uints[i], self._ends.data.as_uints[i])
+                for i in range(len(self._starts))
+            ]
+        return self._spans
 
-        if sorted_spans[0].start != 0:
-            raise ValueError('Spans should start from 0')
+    cdef void _set_spans(self, list spans):
+        cdef Span span
 
-        for idx in range(n_spans - 1):
-            span_current = sorted_spans[idx]
-            span_next = sorted_spans[idx + 1]
-            if span_current.end != span_next.start:
-                raise ValueError('Spans should be contiguous.')
+        self._starts = py_array.array('I', [span.start for span in spans])
+        self._ends = py_array.array('I', [span.end for span in spans])
+        self._spans = spans
 
     @classmethod
     def add_all(cls, list spans):  # type: ignore
@@ -91,25 +124,72 @@ cdef class SpanGroup:
         span_group.done()
         return span_group
 
+    @classmethod
+    def from_arrays(cls, starts, ends):
+        '''Create a done SpanGroup from arrays
+
+        Args:
+            starts (ints): start indices, e.g. a list or an array.array
+            ends (ints): end indices
+
+        Raise:
+            ValueError: If the lengths are not matched or spans are invalid.
+
+        Return:
+            SpanGroup
+
+        '''
+        cdef SpanGroup span_group
+        cdef unsigned int[:] starts_view, ends_view
+        cdef Py_ssize_t i
+
+        if len(starts) != len(ends):
+            raise ValueError('starts and ends should have the same length.')
+
+        span_group = cls()
+        span_group._starts = py_array.array('I', starts)
+        span_group._ends = py_array.array('I', ends)
+        starts_view = span_group._starts
+        ends_view = span_group._ends
+        for i in range(starts_view.shape[0]):
+            _validate_start_end_in_c(starts_view[i], ends_view[i])
+        span_group.done()
+        return span_group
+
+    @property
+    def starts(self):
+        '''memoryview of start indices (unsigned int), should not be modified'''
+        self._validate_done()
+        return memoryview(self._starts)
+
+    @property
+    def ends(self):
+        '''memoryview of end indices (unsigned int), should not be modified'''
+        self._validate_done()
+        return memoryview(self._ends)
+
     cpdef bint is_empty(self):
-        return len(self._spans) == 0
+        return len(self._starts) == 0
 
     def __eq__(self, other):
         self._warn_not_done()
         if not isinstance(other, SpanGroup):
             return False
-        same_length = len(other) == len(self._spans)
-        same_elements = set(other) == set(self._spans)
+        same_length = len(other) == len(self._starts)
+        same_elements = set(other) == set(self._get_spans())
         return same_length and same_elements
 
     def __getitem__(self, value):
-        if not self._is_done:
-            raise RuntimeError('Please call `done` first.')
-        return self._spans[value]
+        self._validate_done()
+        return self._get_spans()[value]
+
+    def __iter__(self):
+        self._validate_done()
+        return iter(self._get_spans())
 
     def __len__(self):
         self._warn_not_done()
-        return len(self._spans)
+        return len(self._starts)
 
     def _warn_not_done(self):
         if not self._is_done:
@@ -118,6 +198,51 @@ cdef class SpanGroup:
     def __repr__(self):
         return str(self.__class__.__name__)
 
+    def __reduce__(self):
+        return (
+            self.__class__,
+            (),
+            (self._starts.tolist(), self._ends.tolist(), self._is_done),
+        )
+
+    def __setstate__(self, state):
+        if len(state) == 2:  # list of Spans
+            spans, self._is_done = state
+            self._set_spans(list(spans))
+        else:
+            starts, ends, self._is_done = state
+            self._starts = py_array.array('I', starts)
+            self._ends = py_array.array('I', ends)
+
 
 cdef list _sorted_spans(list spans):
     return sorted(spans, key=lambda e: e.end)  # set -> list
+
+
+cdef bint _is_sorted(unsigned int[:] ends):
+
+    cdef Py_ssize_t idx
+
+    for idx in range(1, ends.shape[0]):
+        if ends[idx - 1] > ends[idx]:
+            return False
+    return True
+
+
+cdef void _validate_disjoint(unsigned int[:] starts, unsigned int[:] ends) except *:
+    cdef Py_ssize_t idx
+
+    for idx in range(1, starts.shape[0]):
+        if starts[idx] < ends[idx - 1]:
+            raise ValueError(f"overlapped")
+
+
+cdef void _validate_contiguousness(unsigned int[:] starts, unsigned int[:] ends) except *:
+    cdef Py_ssize_t idx
+
+    if starts[0] != 0:
+        raise ValueError('Spans should start from 0')
+
+    for idx in range(starts.shape[0] - 1):
+        if ends[idx] != starts[idx + 1]:
+            raise ValueError('Spans should be contiguous.')
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Sequence, Tuple
 
 from .replacement import ReplacementGroup
 from .span import SpanGroup
@@ -9,14 +9,14 @@ def apply(input_str: str, span_group: SpanGroup) -> List[str]:
     _validate_compatibility(input_str, span_group)
 
     output_lst = [''] * len(span_group)
-    for i, span in enumerate(span_group):
-        output_lst[i] = input_str[span.start: span.end]
+    for i, (start, end) in enumerate(zip(span_group.starts, span_group.ends)):
+        output_lst[i] = input_str[start: end]
 
     return output_lst
 
 
 def _validate_compatibility(input_str: str, span_group: SpanGroup):
-    if len(input_str) != span_group[-1].end:
+    if len(input_str) != span_group.ends[-1]:
         raise ValueError('Input list and span group is not compatible.')
 
 
@@ -56,3 +56,59 @@ def gen_replacement_group(input_str: str, tokens: List[str]) -> ReplacementGroup
 
     replacement_group.done()
     return replacement_group
+
+
+def gen_edit_from_offsets(
+        input_str: str,
+        offsets: Sequence[Tuple[int, int]],
+    ) -> Tuple[ReplacementGroup, SpanGroup]:
+    '''Generate the edit of tokenization from offsets of tokens
+
+    The characters not covered by offsets are removed by the ReplacementGroup,
+    and the SpanGroup spans the tokens of the removed string.
+    It is equivalent to `gen_replacement_group` and `gen_span_group` with
+    tokens = [input_str[start: end] for start, end in offsets], but in one pass.
+
+    E.g.
+    Given input_str ' ab c' and offsets [(1, 3), (4, 5)], i.e. tokens ['ab', 'c']
+        replacement_group: [(0, 1) => '', (3, 4) => '']
+        span_group: [(0, 2), (2, 3)]
+
+    Args:
+        input_str (str)
+        offsets (list of tuples): sorted and disjoint (start, end) of tokens
+
+    Raise:
+        ValueError: If offsets are not sorted, disjoint or out of input_str.
+
+    Returns:
+        replacement_group (ReplacementGroup)
+        span_group (SpanGroup)
+
+    '''
+    removed_starts, removed_ends = [], []
+    span_starts, span_ends = [], []
+
+    shift = 0
+    length = 0
+    for start, end in offsets:
+        if start < shift or end < start:
+            raise ValueError('offsets should be sorted and disjoint.')
+        if start > shift:
+            removed_starts.append(shift)
+            removed_ends.append(start)
+        span_starts.append(length)
+        length += end - start
+        span_ends.append(length)
+        shift = end
+
+    if shift > len(input_str):
+        raise ValueError('offsets are out of input_str.')
+    if shift != len(input_str):
+        removed_starts.append(shift)
+        removed_ends.append(len(input_str))
+
+    replacement_group = ReplacementGroup.from_arrays(
+        removed_starts, removed_ends, [''] * len(removed_starts))
+    span_group = SpanGroup.from_arrays(span_starts, span_ends)
+    return replacement_group, span_group
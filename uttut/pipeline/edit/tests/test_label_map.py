@@ -0,0 +1,126 @@
+import pytest
+
+from ..replacement import ReplacementGroup
+from ..span import SpanGroup
+from ..label_map import LabelMap
+from ..label_propagation import (
+    propagate_by_replacement_group,
+    reduce_by_span_group,
+    expand_by_span_group,
+)
+
+
+def get_not_entity(labels, output_size):
+    return [0] * output_size
+
+
+def pad_with_not_entity(labels, output_size):
+    return [0] + labels + [0]
+
+
+def strip_not_entity(labels, output_size):
+    return labels[1: -1]
+
+
+test_cases = [
+    pytest.param(
+        [1, 1, 1, 0, 0, 3, 0, 2, 2],
+        [
+            ('propagate', ReplacementGroup.add_all([(0, 3, 'a'), (5, 6, 'abc'), (7, 9, 'abcd')])),
+            ('propagate', ReplacementGroup.add_all([(0, 2, 'abcd'), (4, 5, '')])),
+        ],
+        id='propagate',
+    ),
+    pytest.param(
+        [1, 2, 3, 4],
+        [
+            ('propagate', ReplacementGroup.add_all([(0, 0, 'a'), (1, 1, 'abc'), (4, 4, 'ab')]),
+             get_not_entity),
+            ('propagate', ReplacementGroup.add_all([(1, 3, 'xyz'), (5, 9, 'x')])),
+        ],
+        id='propagate-insert',
+    ),
+    pytest.param(
+        [1, 2, 0, 3, 3],
+        [
+            ('propagate', ReplacementGroup.add_all([(1, 2, ' b '), (3, 4, ' d ')]),
+             pad_with_not_entity),
+            ('propagate', ReplacementGroup.add_all([(2, 5, 'c')])),
+            ('reduce', SpanGroup.add_all([(0, 2), (2, 3), (3, 5), (5, 7)])),
+        ],
+        id='propagate-reduce',
+    ),
+    pytest.param(
+        [1, 2, 3],
+        [
+            ('expand', SpanGroup.add_all([(0, 2), (2, 3), (3, 6)])),
+            ('propagate', ReplacementGroup.add_all([(1, 2, ' b '), (4, 5, ' d ')]),
+             pad_with_not_entity),
+            ('propagate', ReplacementGroup.add_all([(0, 3, 'b'), (5, 8, 'd')]),
+             strip_not_entity),
+            ('reduce', SpanGroup.add_all([(0, 1), (1, 3), (3, 6)])),
+            ('expand', SpanGroup.add_all([(0, 1), (1, 3), (3, 3)])),
+        ],
+        id='expand-propagate-reduce',
+    ),
+    pytest.param(
+        [],
+        [
+            ('reduce', SpanGroup.add_all([])),
+            ('expand', SpanGroup.add_all([])),
+            ('propagate', ReplacementGroup.add_all([(0, 0, 'ab')])),
+        ],
+        id='empty',
+    ),
+]
+
+
+def apply_steps(labels, steps):
+    funcs = {
+        'propagate': propagate_by_replacement_group,
+        'reduce': reduce_by_span_group,
+        'expand': expand_by_span_group,
+    }
+    for name, edit, *transduce_func in steps:
+        labels = funcs[name](labels, edit, *transduce_func)
+    return labels
+
+
+def compile_steps(input_length, steps):
+    label_map = LabelMap(input_length)
+    for name, edit, *transduce_func in steps:
+        getattr(label_map, name)(edit, *transduce_func)
+    return label_map
+
+
+@pytest.mark.parametrize("labels,steps", test_cases)
+def test_apply(labels, steps):
+    expected_output = apply_steps(labels, steps)
+    label_map = compile_steps(len(labels), steps)
+    assert label_map.output_length == len(expected_output)
+    assert expected_output == label_map.apply(labels)
+
+
+def test_pieces_are_merged():
+    label_map = LabelMap(6)
+    label_map.propagate(ReplacementGroup.add_all([(1, 1, 'ab')]))
+    label_map.propagate(ReplacementGroup.add_all([(1, 3, '')]))
+    assert [(None, 0, 6)] == label_map.pieces
+
+
+def test_apply_raise_invalid_labels():
+    label_map = LabelMap(3)
+    with pytest.raises(ValueError):
+        label_map.apply([1, 2])
+
+
+@pytest.mark.parametrize(
+    "input_length,step",
+    [
+        pytest.param(3, ('reduce', SpanGroup.add_all([(0, 2)])), id='reduce'),
+        pytest.param(3, ('expand', SpanGroup.add_all([(0, 2)])), id='expand'),
+    ],
+)
+def test_raise_incompatible_span_group(input_length, step):
+    with pytest.raises(ValueError):
+        compile_steps(input_length, [step])
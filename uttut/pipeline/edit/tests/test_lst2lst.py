@@ -72,3 +72,39 @@ def test_forward_inverse(input_lst, forward_replacements, output_lst, inverse_re
 def test_backward_inverse(input_lst, forward_replacements, output_lst, inverse_replacements):
     output = lst2lst.inverse(output_lst, inverse_replacements)
     assert forward_replacements == output
+
+
+def test_apply_in_place():
+    input_lst = ['a', 'b', 'c', 'd']
+    output = lst2lst.apply_in_place(
+        input_lst,
+        ReplacementGroup.add_all([(0, 1, [1]), (2, 4, [3, 4])]),
+    )
+    assert output is input_lst
+    assert [1, 'b', 3, 4] == input_lst
+
+
+def test_apply_in_place_raise_length_changed():
+    input_lst = ['a', 'b', 'c']
+    with pytest.raises(ValueError):
+        lst2lst.apply_in_place(input_lst, ReplacementGroup.add_all([(0, 1, [1]), (1, 2, [])]))
+    assert ['a', 'b', 'c'] == input_lst
+
+
+def test_apply_does_not_modify_input():
+    input_lst = ['a', 'b', 'c']
+    output = lst2lst.apply(input_lst, ReplacementGroup.add_all([(1, 2, ['B'])]))
+    assert ['a', 'B', 'c'] == output
+    assert ['a', 'b', 'c'] == input_lst
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        pytest.param(lst2lst.apply, id='apply'),
+        pytest.param(lst2lst.apply_in_place, id='apply_in_place'),
+    ],
+)
+def test_apply_raise_incompatible(func):
+    with pytest.raises(ValueError):
+        func(['a'], ReplacementGroup.add_all([(1, 2, ['b'])]))
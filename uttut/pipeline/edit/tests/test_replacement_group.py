@@ -1,6 +1,9 @@
+import pickle
+
 import pytest
 
 from ..replacement import ReplacementGroup, Replacement
+from ..trusted import trusted
 
 
 @pytest.mark.filterwarnings("ignore")
@@ -52,6 +55,7 @@ def test_not_done_error():
         pytest.param([(0, 0, 'a', 'a', 'a')], TypeError, id='has redundant elements'),
         pytest.param([(0, 1, 'a'), (0, 2, ['b']), (3, 5, 10000)],
                      TypeError, id='mixed replacements'),
+        pytest.param([(0, 1, 'a'), (2, 3, ['b'])], TypeError, id='mixed replacements in order'),
     ],
 )
 def test_add_fails(obj, error_type):
@@ -108,6 +112,22 @@ def test_need_sorted(objs, expected_objs):
     assert expected_objs == obj_group[:]
 
 
+@pytest.mark.parametrize(
+    "objs,expected_objs",
+    [
+        pytest.param([(0, 0, 'a'), (0, 1, 'b'), (1, 1, 'c'), (3, 5, 'd')],
+                     [(0, 0, 'a'), (0, 1, 'b'), (1, 1, 'c'), (3, 5, 'd')], id='in order'),
+        pytest.param([(0, 1, 'a'), (0, 1, 'a'), (2, 3, 'b')],
+                     [(0, 1, 'a'), (2, 3, 'b')], id='duplicated'),
+        pytest.param([(2, 3, 'b'), (0, 1, 'a'), (5, 5, 'c')],
+                     [(0, 1, 'a'), (2, 3, 'b'), (5, 5, 'c')], id='not in order'),
+    ],
+)
+def test_done_in_order_or_not(objs, expected_objs):
+    obj_group = ReplacementGroup.add_all(objs)
+    assert [Replacement(*obj) for obj in expected_objs] == obj_group[:]
+
+
 @pytest.mark.parametrize(
     "objs",
     [
@@ -130,3 +150,85 @@ def test_validate_disjoint(objs):
 def test_representation(representation, input_lst):
     group = ReplacementGroup.add_all(input_lst)
     assert representation == repr(group)
+
+
+def test_pickle():
+    group = ReplacementGroup.add_all([(0, 2, 'a', 'ohoh'), (3, 5, 'b')])
+    loaded_group = pickle.loads(pickle.dumps(group))
+    assert group == loaded_group
+    assert ['ohoh', None] == [rep.annotation for rep in loaded_group]
+
+
+def test_unpickle_list_of_replacements():
+    group = ReplacementGroup.add_all([(0, 2, 'a', 'ohoh'), (3, 5, 'b')])
+    loaded_group = ReplacementGroup()
+    loaded_group.__setstate__((group[:], True))
+    assert group == loaded_group
+    assert [3, 5] == [loaded_group.starts[1], loaded_group.ends[1]]
+
+
+@pytest.mark.parametrize(
+    "objs",
+    [
+        pytest.param([(0, 1, 'a', 'ohoh'), (3, 5, 'b', None)], id='in order'),
+        pytest.param([(3, 5, 'b', None), (0, 1, 'a', 'ohoh')], id='not in order'),
+        pytest.param([], id='empty'),
+    ],
+)
+def test_from_arrays(objs):
+    starts, ends, new_values, annotations = [list(arr) for arr in zip(*objs)] or [[]] * 4
+    group = ReplacementGroup.from_arrays(starts, ends, new_values, annotations)
+    expected_group = ReplacementGroup.add_all(objs)
+    assert expected_group == group
+    assert expected_group.starts.tolist() == group.starts.tolist()
+    assert expected_group.ends.tolist() == group.ends.tolist()
+    assert expected_group.new_values == group.new_values
+    assert expected_group.annotations == group.annotations
+
+
+@pytest.mark.parametrize(
+    "args,error_type",
+    [
+        pytest.param(([0, 1], [1], ['a', 'b']), ValueError, id='different length'),
+        pytest.param(([2], [1], ['a']), ValueError, id='start > end'),
+        pytest.param(([0, 1], [2, 3], ['a', 'b']), ValueError, id='overlapped'),
+        pytest.param(([-1], [1], ['a']), OverflowError, id='negative'),
+    ],
+)
+def test_from_arrays_fails(args, error_type):
+    with pytest.raises(error_type):
+        ReplacementGroup.from_arrays(*args)
+
+
+def test_arrays_need_done():
+    group = ReplacementGroup()
+    group.add(0, 1, 'a')
+    with pytest.raises(RuntimeError, match='Please call `done` first.'):
+        group.starts
+    group.done()
+    assert [0] == group.starts.tolist()
+
+
+def test_done_in_trusted_mode():
+    with trusted():
+        replacement_group = ReplacementGroup.add_all([(3, 5, 'a'), (0, 1, 'b'), (0, 0, 'c')])
+        assert [Replacement(0, 0, 'c'), Replacement(0, 1, 'b'), Replacement(3, 5, 'a')] == \
+            replacement_group[:]
+
+        # not validated
+        replacement_group = ReplacementGroup.add_all([(0, 2, 'a'), (1, 3, ['b'])])
+        assert 2 == len(replacement_group)
+
+
+@pytest.mark.parametrize(
+    "replacements",
+    [
+        pytest.param([(0, 0, ['a']), (0, 0, ['b'])], id='insertions at the same position'),
+        pytest.param([(2, 2, ['a']), (0, 0, ['b']), (2, 2, ['c'])], id='not sorted'),
+        pytest.param([(0, 1, 'a'), (0, 1, 'a')], id='duplicated'),
+    ],
+)
+def test_same_spans_in_trusted_mode(replacements):
+    expected = ReplacementGroup.add_all(replacements)[:]
+    with trusted():
+        assert expected == ReplacementGroup.add_all(replacements)[:]
@@ -1,6 +1,9 @@
+import pickle
+
 import pytest
 
 from ..span import Span, SpanGroup
+from ..trusted import trusted
 
 
 @pytest.mark.filterwarnings("ignore")
@@ -116,3 +119,55 @@ def test_validate_disjoint(objs):
 )
 def test_representation(name, group):
     assert name == repr(group)
+
+
+def test_pickle():
+    group = SpanGroup.add_all([(0, 2), (2, 5)])
+    assert group == pickle.loads(pickle.dumps(group))
+
+
+def test_unpickle_list_of_spans():
+    group = SpanGroup.add_all([(0, 2), (2, 5)])
+    loaded_group = SpanGroup()
+    loaded_group.__setstate__((group[:], True))
+    assert group == loaded_group
+
+
+@pytest.mark.parametrize(
+    "spans",
+    [
+        pytest.param([(0, 2), (2, 5)], id='sorted'),
+        pytest.param([(2, 5), (0, 2)], id='not sorted'),
+        pytest.param([], id='empty'),
+    ],
+)
+def test_from_arrays(spans):
+    starts, ends = [list(arr) for arr in zip(*spans)] or [[], []]
+    group = SpanGroup.from_arrays(starts, ends)
+    expected_group = SpanGroup.add_all(spans)
+    assert expected_group == group
+    assert expected_group.starts.tolist() == group.starts.tolist()
+    assert expected_group.ends.tolist() == group.ends.tolist()
+
+
+@pytest.mark.parametrize(
+    "starts,ends",
+    [
+        pytest.param([0, 2], [2], id='different length'),
+        pytest.param([0, 3], [2, 5], id='not contiguous'),
+        pytest.param([2], [1], id='start > end'),
+    ],
+)
+def test_from_arrays_fails(starts, ends):
+    with pytest.raises(ValueError):
+        SpanGroup.from_arrays(starts, ends)
+
+
+def test_done_in_trusted_mode():
+    with trusted():
+        span_group = SpanGroup.add_all([(2, 5), (0, 2)])
+        assert [Span(0, 2), Span(2, 5)] == span_group[:]
+
+        # not validated
+        span_group = SpanGroup.add_all([(1, 10), (2, 15)])
+        assert 2 == len(span_group)
@@ -132,3 +132,34 @@ def test_gen_replacement_group(input_str, tokens, replacement_group):
 def test_gen_replacement_group_fail(input_str, tokens):
     with pytest.raises(ValueError, match='input_str and tokens are not compatible'):
         str2lst.gen_replacement_group(input_str, tokens)
+
+
+@pytest.mark.parametrize(
+    "input_str,offsets",
+    [
+        pytest.param(' ab  c ', [(1, 3), (5, 6)], id='removed'),
+        pytest.param('abc', [(0, 1), (1, 3)], id='nothing removed'),
+        pytest.param('   ', [], id='all removed'),
+        pytest.param('', [], id='empty'),
+    ],
+)
+def test_gen_edit_from_offsets(input_str, offsets):
+    tokens = [input_str[start: end] for start, end in offsets]
+    replacement_group, span_group = str2lst.gen_edit_from_offsets(input_str, offsets)
+
+    expected_replacement_group = str2lst.gen_replacement_group(input_str, tokens)
+    assert expected_replacement_group == replacement_group
+    assert str2lst.gen_span_group(''.join(tokens), tokens) == span_group
+
+
+@pytest.mark.parametrize(
+    "offsets",
+    [
+        pytest.param([(2, 3), (0, 1)], id='not sorted'),
+        pytest.param([(0, 2), (1, 3)], id='overlapped'),
+        pytest.param([(0, 4)], id='out of input_str'),
+    ],
+)
+def test_gen_edit_from_offsets_raise(offsets):
+    with pytest.raises(ValueError):
+        str2lst.gen_edit_from_offsets('abc', offsets)
@@ -0,0 +1,33 @@
+"""Trusted mode of edits and operators
+
+Within `trusted()`, the defensive checks on the transform hot path are
+skipped, i.e.
+- type checks of input and output in `Operator.transform`
+- length checks of labels in `LabelAligner.transform` and `inverse_transform`
+- deduplication and validation in `ReplacementGroup.done`
+- validation in `SpanGroup.done`
+The edits are still sorted if they are not added in order.
+
+It should only be used when the operators are known to produce
+well-formed edits, e.g. the built-in operators of a tested pipe.
+"""
+from contextlib import contextmanager
+import threading
+
+
+_trusted_state = threading.local()
+
+
+@contextmanager
+def trusted():
+    """Skip validation on the transform hot path within the context"""
+    orig_trusted = is_trusted()
+    _trusted_state.trusted = True
+    try:
+        yield
+    finally:
+        _trusted_state.trusted = orig_trusted
+
+
+def is_trusted() -> bool:
+    return getattr(_trusted_state, 'trusted', False)
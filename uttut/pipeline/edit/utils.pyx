@@ -12,15 +12,21 @@ def _transform_sequence(
     input_seq: list of str or pure str
     '''
 
-    cdef unsigned int start, i
-    cdef Replacement replacement
+    cdef unsigned int start, i, idx
+    cdef unsigned int[:] starts, ends
+    cdef list new_values
+
+    replacement_group._validate_done()
+    starts = replacement_group._starts
+    ends = replacement_group._ends
+    new_values = replacement_group._new_values
 
     start = 0
     i = 0
-    for replacement in replacement_group:
-        output[i] = input_seq[start: replacement.start]
-        output[i + 1] = replacement.new_value
-        start = replacement.end
+    for idx in range(starts.shape[0]):
+        output[i] = input_seq[start: starts[idx]]
+        output[i + 1] = new_values[idx]
+        start = ends[idx]
         i += 2
 
     # tail
@@ -29,6 +35,114 @@ def _transform_sequence(
     return output
 
 
+def _apply_to_list(list input_lst, ReplacementGroup replacement_group) -> list:
+    '''Apply replacement_group to a list in linear time
+
+    The output list is preallocated by its final length, then the unchanged
+    fragments and the new values are copied into it.
+    If all replacements preserve length, the input list is copied and
+    replaced in place instead.
+    '''
+
+    cdef Py_ssize_t n_replacement, output_len, i_start, o_start, idx, j
+    cdef unsigned int[:] starts, ends
+    cdef list new_values, output
+    cdef bint preserve_length
+    cdef object new_value, item
+
+    replacement_group._validate_done()
+    starts = replacement_group._starts
+    ends = replacement_group._ends
+    new_values = replacement_group._new_values
+    n_replacement = starts.shape[0]
+    _validate_list_compatibility(input_lst, ends)
+
+    output_len = len(input_lst)
+    preserve_length = True
+    for idx in range(n_replacement):
+        output_len += len(new_values[idx])
+        output_len -= ends[idx] - starts[idx]
+        if len(new_values[idx]) != ends[idx] - starts[idx]:
+            preserve_length = False
+
+    if preserve_length:
+        output = input_lst[:]
+        _replace_in_place(output, starts, ends, new_values)
+        return output
+
+    output = [None] * output_len
+    i_start = 0
+    o_start = 0
+    for idx in range(n_replacement):
+        # before replacement
+        for j in range(i_start, starts[idx]):
+            output[o_start] = input_lst[j]
+            o_start += 1
+
+        # replacement
+        new_value = new_values[idx]
+        for item in new_value:
+            output[o_start] = item
+            o_start += 1
+        i_start = ends[idx]
+
+    # tail
+    for j in range(i_start, len(input_lst)):
+        output[o_start] = input_lst[j]
+        o_start += 1
+
+    return output
+
+
+def _apply_to_list_in_place(list input_lst, ReplacementGroup replacement_group) -> list:
+    '''Apply length-preserving replacements to input_lst in place
+
+    Raise:
+        ValueError: If any replacement changes the length, input_lst is not modified.
+    '''
+
+    cdef Py_ssize_t idx
+    cdef unsigned int[:] starts, ends
+    cdef list new_values
+
+    replacement_group._validate_done()
+    starts = replacement_group._starts
+    ends = replacement_group._ends
+    new_values = replacement_group._new_values
+    _validate_list_compatibility(input_lst, ends)
+
+    for idx in range(starts.shape[0]):
+        if len(new_values[idx]) != ends[idx] - starts[idx]:
+            raise ValueError(
+                f"{idx}-th replacement changes the length, it can not be applied in place.")
+
+    _replace_in_place(input_lst, starts, ends, new_values)
+    return input_lst
+
+
+cdef void _replace_in_place(
+        list lst,
+        unsigned int[:] starts,
+        unsigned int[:] ends,
+        list new_values,
+    ) except *:
+    cdef Py_ssize_t idx, j
+    cdef object new_value
+
+    for idx in range(starts.shape[0]):
+        new_value = new_values[idx]
+        if ends[idx] - starts[idx] == 1:
+            lst[starts[idx]] = new_value[0]
+        else:
+            for j in range(ends[idx] - starts[idx]):
+                lst[starts[idx] + j] = new_value[j]
+
+
+cdef void _validate_list_compatibility(list input_lst, unsigned int[:] ends) except *:
+    if ends.shape[0] > 0 and ends[ends.shape[0] - 1] > len(input_lst):
+        raise ValueError('Input list and replacement group are not compatible.')
+
+
 def _gen_inverse_replacement_group(
         input_seq: Union[str, List[str]],
         ReplacementGroup replacement_group,
@@ -37,9 +151,9 @@ def _gen_inverse_replacement_group(
     input_seq: list of str or pure str
     '''
 
-    cdef unsigned int n_replacement, start, dist
-    cdef list dists
-    cdef Replacement replacement
+    cdef unsigned int n_replacement, start, i, new_length
+    cdef unsigned int[:] starts, ends
+    cdef list new_values
     cdef ReplacementGroup inverse_replacement_group
 
     inverse_replacement_group = ReplacementGroup()
@@ -48,22 +162,24 @@ def _gen_inverse_replacement_group(
         inverse_replacement_group.done()
         return inverse_replacement_group
 
-    n_replacement = len(replacement_group)
-
-    dists = get_dist_bt_replacement_group(replacement_group)
-    dists.append(0)
+    replacement_group._validate_done()
+    starts = replacement_group._starts
+    ends = replacement_group._ends
+    new_values = replacement_group._new_values
+    n_replacement = starts.shape[0]
 
-    start = replacement_group[0].start
+    start = starts[0]
 
     for i in range(n_replacement):
-        replacement = replacement_group[i]
-        dist = dists[i]
+        new_length = len(new_values[i])
         inverse_replacement_group.add(
             start=start,
-            end=start + len(replacement.new_value),
-            new_value=input_seq[replacement.start: replacement.end],
+            end=start + new_length,
+            new_value=input_seq[starts[i]: ends[i]],
         )
-        start += len(replacement.new_value) + dist
+        start += new_length
+        if i + 1 < n_replacement:
+            start += starts[i + 1] - ends[i]
     inverse_replacement_group.done()
     return inverse_replacement_group
 
@@ -86,17 +202,17 @@ def get_dist_bt_replacement_group(ReplacementGroup replacement_group) -> List[in
         dist (ints)
     '''
 
-    cdef unsigned int n_replacement, dist
+    cdef Py_ssize_t n_replacement, i
+    cdef unsigned int[:] starts, ends
     cdef list dists
-    cdef Replacement current_replacement, next_replacement
 
-    n_replacement = len(replacement_group)
-    dists = [0] * (n_replacement - 1)
+    replacement_group._validate_done()
+    starts = replacement_group._starts
+    ends = replacement_group._ends
+    n_replacement = starts.shape[0]
+    dists = [0] * max(n_replacement - 1, 0)
 
     for i in range(n_replacement - 1):
-        current_replacement = replacement_group[i]
-        next_replacement = replacement_group[i + 1]
-        dist = next_replacement.start - current_replacement.end
-        dists[i] = dist
+        dists[i] = starts[i + 1] - ends[i]
 
     return dists
@@ -8,12 +8,24 @@ class Intermediate:
     attributes:
         collection (list): store input intermediates
         checkpoints (dict): (key, value) = (name, index)
+        checkpoints_only (bool): if True, only intermediates of checkpoints are stored
+            and the others are replaced by None.
 
     """
 
-    def __init__(self, checkpoints: Dict[str, int]):
+    def __init__(self, checkpoints: Dict[str, int], checkpoints_only: bool = False):
         self._collection: list = []
         self._checkpoints = checkpoints
+        self._checkpoints_only = checkpoints_only
+        self._checkpoint_indices = set(checkpoints.values())
+
+    def __copy__(self):
+        copy_intermediate = Intermediate(self._checkpoints, self._checkpoints_only)
+        copy_intermediate._collection = [
+            intermediate.copy() if isinstance(intermediate, list) else intermediate
+            for intermediate in self._collection
+        ]
+        return copy_intermediate
 
     def add(self, intermediate):
         """Append intermediate into self._collection
@@ -22,6 +34,8 @@ class Intermediate:
             intermediate: object to be stored in self.collection
 
         """
+        if self._checkpoints_only and len(self._collection) not in self._checkpoint_indices:
+            intermediate = None
         self._collection.append(intermediate)
 
     def get_from_checkpoint(self, name: str):
@@ -0,0 +1,99 @@
+from functools import partial
+from typing import Callable, List
+import asyncio
+
+
+class MicroBatcher:
+
+    """Coalesce concurrent submissions into batches run in an executor
+
+    Items submitted within `max_delay` seconds after the first pending one
+    (or until `max_batch_size` items are pending) are processed by a single
+    call of `func` in the executor, so the event loop is never blocked.
+
+    A cancelled submission is dropped from its batch if the batch has not
+    been dispatched yet, otherwise its result is discarded.
+
+    Args:
+        func: a function maps a list of items to a list of (result, error).
+            If error is not None, it is raised to the corresponding submitter.
+        executor: an instance of concurrent.futures.Executor.
+            If None, the default executor of the event loop is used.
+        max_batch_size (int): max number of items in a batch.
+        max_delay (float): max seconds to wait for more items.
+
+    Raises:
+        ValueError: If max_batch_size < 1 or max_delay < 0.
+
+    """
+
+    def __init__(
+            self,
+            func: Callable[[List], List],
+            executor=None,
+            max_batch_size: int = 32,
+            max_delay: float = 0.001,
+        ):
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size should be a positive integer. Got {max_batch_size}")
+        if max_delay < 0:
+            raise ValueError(f"max_delay should not be negative. Got {max_delay}")
+
+        self._func = func
+        self._executor = executor
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+        self._pending = []
+        self._timer = None
+
+    async def submit(self, item):
+        """Process item in the next batch
+
+        Arg:
+            item: an item passed to func
+
+        Return:
+            the result of item
+
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_delay, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch = [(item, future) for item, future in self._pending if not future.cancelled()]
+        self._pending = []
+        if not batch:
+            return
+
+        items, futures = zip(*batch)
+        loop = asyncio.get_running_loop()
+        task = loop.run_in_executor(self._executor, self._func, list(items))
+        task.add_done_callback(partial(_set_results, futures=futures))
+
+
+def _set_results(task, futures):
+    if task.cancelled():
+        for future in futures:
+            future.cancel()
+        return
+
+    batch_error = task.exception()
+    results = [(None, batch_error)] * len(futures) if batch_error else task.result()
+    for future, (result, error) in zip(futures, results):
+        if future.done():
+            continue
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
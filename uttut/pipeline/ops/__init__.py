@@ -1,34 +1,41 @@
 from .base import Operator
+from .factory import gen_lazy_getattr
 
-from .lowercase import Lowercase
-from .add_whitespace_around_cjk import AddWhitespaceAroundCJK
-from .add_whitespace_around_punctuation import AddWhitespaceAroundPunctuation
-from .add_whitespace_around_word_n_zhchar import AddWhitespaceAroundWordnZhChar
-from .strip_accent_token import StripAccentToken
-from .punctuation_except_endpoint_to_whitespace import PunctuationExceptEndpointToWhitespace
 
-from .pattern_recognizers import (
-    IntToken,
-    FloatToken,
-    IntTokenWithSpace,
-    FloatTokenWithSpace,
-    NumTokenWithSpace,
-    MergeWhiteSpaceCharacters,
-    StripWhiteSpaceCharacters,
-    StopwordsToWhitespace,
-    ReplaceAwithB,
-)
-from .tokenizers import (
-    CharTokenizer,
-    EngTokenizer,
-    ZhCharTokenizer,
-    WhiteSpaceTokenizer,
-    CustomWordTokenizer,
-)
+# operators are imported on first access, see `OperatorFactory.register_lazy`
+_OPERATOR_MODULES = {
+    'Lowercase': '.lowercase',
+    'AddWhitespaceAroundCJK': '.add_whitespace_around_cjk',
+    'AddWhitespaceAroundPunctuation': '.add_whitespace_around_punctuation',
+    'AddWhitespaceAroundWordnZhChar': '.add_whitespace_around_word_n_zhchar',
+    'StripAccentToken': '.strip_accent_token',
+    'PunctuationExceptEndpointToWhitespace': '.punctuation_except_endpoint_to_whitespace',
 
-from .add_sos_eos import AddSosEos
-from .pad import Pad
-from .token_to_index import Token2Index
-from .span_subwords import SpanSubwords
-from .token_to_index_with_hash import Token2IndexwithHash
-from .pure_num_to_token import PureNum2Token
+    'IntToken': '.pattern_recognizers.int_token',
+    'FloatToken': '.pattern_recognizers.float_token',
+    'IntTokenWithSpace': '.pattern_recognizers.int_token_with_space',
+    'FloatTokenWithSpace': '.pattern_recognizers.float_token_with_space',
+    'NumTokenWithSpace': '.pattern_recognizers.num_token_with_space',
+    'MergeWhiteSpaceCharacters': '.pattern_recognizers.merge_whitespace_characters',
+    'StripWhiteSpaceCharacters': '.pattern_recognizers.strip_whitespace_characters',
+    'StopwordsToWhitespace': '.pattern_recognizers.stopwords_to_whitespace',
+    'ReplaceAwithB': '.pattern_recognizers.replace_a_with_b',
+
+    'CharTokenizer': '.tokenizers.char_tokenizer',
+    'EngTokenizer': '.tokenizers.eng_tokenizer',
+    'ZhCharTokenizer': '.tokenizers.zh_char_tokenizer',
+    'WhiteSpaceTokenizer': '.tokenizers.whitespace_tokenizer',
+    'CustomWordTokenizer': '.tokenizers.custom_word_tokenizer',
+
+    'AddSosEos': '.add_sos_eos',
+    'Pad': '.pad',
+    'Token2Index': '.token_to_index',
+    'SpanSubwords': '.span_subwords',
+    'Token2IndexwithHash': '.token_to_index_with_hash',
+    'CharNgramHash': '.char_ngram_hash',
+    'PureNum2Token': '.pure_num_to_token',
+}
+
+__all__ = ['Operator'] + list(_OPERATOR_MODULES)
+
+__getattr__ = gen_lazy_getattr(Operator.op_factory, __name__, _OPERATOR_MODULES, globals())
@@ -6,6 +6,7 @@ from .label_transducer import get_not_entity
 from ..edit import lst2lst
 from ..edit.replacement import ReplacementGroup
 from ..edit.label_propagation import propagate_by_replacement_group
+from ..edit.label_map import LabelMap
 
 
 class AddSosEos(Operator):
@@ -88,3 +89,9 @@ class AddSosEosAligner(LabelAligner):
 
     def _backward_transduce_func(self, labels: List[int], output_size: int) -> List[int]:
         return get_not_entity(labels=labels, output_size=output_size)
+
+    def _compile_transform(self, label_map: LabelMap):
+        label_map.propagate(self._forward_edit, self._forward_transduce_func)
+
+    def _compile_inverse_transform(self, label_map: LabelMap):
+        label_map.propagate_inverse(self._forward_edit, self._backward_transduce_func)
@@ -5,6 +5,8 @@ from .label_transducer import get_most_common_except_not_entity
 from ..edit.replacement import ReplacementGroup
 from ..edit import str2str
 from ..edit.label_propagation import propagate_by_replacement_group
+from ..edit.label_map import LabelMap
+from .utils.unicode_class import find_chars
 from uttut import ENTITY_LABEL
 
 
@@ -13,10 +15,14 @@ class AddWhitespaceAroundCharacter(Operator):
     """
     Base class for Operators which recognize the characters using function `_is_valid_char`
     and add whitespace around the matched one
+
+    Sub-classes recognizing a class of `utils.unicode_class` (e.g. CJK) can set
+    `_valid_char_class` instead, then the characters are found by table lookups.
     """
 
     _input_type = str
     _output_type = str
+    _valid_char_class = None
 
     def _transform(self, input_sequence: str) -> Tuple[str, 'LabelAligner']:
         forward_replacement_group = self._gen_forward_replacement_group(input_sequence)
@@ -32,18 +38,22 @@ class AddWhitespaceAroundCharacter(Operator):
     def _gen_forward_replacement_group(self, input_str: str) -> ReplacementGroup:
         replacement_group = ReplacementGroup()
 
-        for i, char in enumerate(input_str):
-            if self._is_valid_char(char):
-                replacement_group.add(
-                    start=i,
-                    end=i + 1,
-                    new_value=f" {char} ",
-                    annotation="add-whitespace-around-any-CJK-char",
-                )
+        for i in self._find_valid_chars(input_str):
+            replacement_group.add(
+                start=i,
+                end=i + 1,
+                new_value=f" {input_str[i]} ",
+                annotation="add-whitespace-around-any-CJK-char",
+            )
 
         replacement_group.done()
         return replacement_group
 
+    def _find_valid_chars(self, input_str: str) -> List[int]:
+        if self._valid_char_class is not None:
+            return find_chars(input_str, self._valid_char_class)
+        return [i for i, char in enumerate(input_str) if self._is_valid_char(char)]
+
     def _is_valid_char(self, char: str) -> bool:
         raise NotImplementedError
 
@@ -71,3 +81,9 @@ class AddWhitespaceAroundCharAligner(LabelAligner):
 
     def _backward_transduce_func(self, labels: List[int], output_size: int) -> List[int]:
         return get_most_common_except_not_entity(labels, output_size)
+
+    def _compile_transform(self, label_map: LabelMap):
+        label_map.propagate(self._forward_edit, self._forward_transduce_func)
+
+    def _compile_inverse_transform(self, label_map: LabelMap):
+        label_map.propagate_inverse(self._forward_edit, self._backward_transduce_func)
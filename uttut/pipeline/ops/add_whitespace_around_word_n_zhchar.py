@@ -1,12 +1,14 @@
 from typing import List, Tuple
 
-from .base import Operator, LabelAligner
+from .base import Operator, LabelAligner, get_prebuilt_trie
 from ..edit.replacement import ReplacementGroup
 from ..edit import str2str
 from ..edit.label_propagation import propagate_by_replacement_group
+from ..edit.label_map import LabelMap
 from uttut import ENTITY_LABEL
 
-from .utils.trie import Trie
+from .utils.double_array_trie import DoubleArrayTrie
+from .utils.unicode_class import CJK, find_chars
 
 
 class AddWhitespaceAroundWordnZhChar(Operator):
@@ -46,9 +48,11 @@ class AddWhitespaceAroundWordnZhChar(Operator):
     def __init__(self, user_words: List[str], shortest: bool = False):
         self.validate_user_words(user_words)
         self._user_words = user_words
-        self._trie = Trie()
-        for word in self._user_words:
-            self._trie.insert(word)
+        self._trie = get_prebuilt_trie('user_words')
+        if self._trie is None:
+            self._trie = DoubleArrayTrie()
+            for word in self._user_words:
+                self._trie.insert(word)
 
         self._shortest = shortest
 
@@ -57,6 +61,9 @@ class AddWhitespaceAroundWordnZhChar(Operator):
         if user_words is None or len(user_words) < 1:
             raise ValueError('User words should not be empty.')
 
+    def _get_tries(self):
+        return {'user_words': self._trie}
+
     def _transform(self, input_sequence: str) -> Tuple[str, 'LabelAligner']:
         forward_replacement_group = self._gen_forward_replacement_group(input_sequence)
         output_sequence = str2str.apply(input_sequence, forward_replacement_group)
@@ -69,67 +76,35 @@ class AddWhitespaceAroundWordnZhChar(Operator):
         return output_sequence, label_aligner
 
     def _gen_forward_replacement_group(self, input_str: str) -> ReplacementGroup:
-        start = 0
         replacement_group = ReplacementGroup()
-        while start < len(input_str):
-            match_result = self._trie.match_prefix(
-                input_str[start:],
-                shortest=self._shortest,
-            )
-            if match_result is not None:
-                # word level
-                token = match_result
+        word_offsets = self._trie.gen_match_offsets(input_str, shortest=self._shortest)
+        char_indices = find_chars(input_str, CJK)
+        char_idx = 0
+        for start, end in word_offsets + [(len(input_str), len(input_str))]:
+            # char level, CJK characters before the word
+            while char_idx < len(char_indices) and char_indices[char_idx] < start:
+                idx = char_indices[char_idx]
+                replacement_group.add(
+                    start=idx,
+                    end=idx + 1,
+                    new_value=f" {input_str[idx]} ",
+                    annotation="add-whitespace-around-word",
+                )
+                char_idx += 1
+            while char_idx < len(char_indices) and char_indices[char_idx] < end:
+                char_idx += 1  # covered by the word
+
+            # word level
+            if start < end:
                 replacement_group.add(
                     start=start,
-                    end=start + len(token),
-                    new_value=f" {token} ",
+                    end=end,
+                    new_value=f" {input_str[start: end]} ",
                     annotation="add-whitespace-around-word",
                 )
-                start += len(token)
-            else:
-                # char level
-                char = input_str[start: start + 1]
-                if self._is_valid_char(char):
-                    replacement_group.add(
-                        start=start,
-                        end=start + 1,
-                        new_value=f" {char} ",
-                        annotation="add-whitespace-around-word",
-                    )
-                start += 1
         replacement_group.done()
         return replacement_group
 
-    def _is_valid_char(self, char: str) -> bool:
-        """Check whether input char is the codepoint of a CJK character.
-
-        This code is copied from Bert `tokenization.py`.
-
-        This defines a "chinese character" as anything in the CJK Unicode block:
-        https://en.wikipedia.org/wiki/CJK_Unified_Ideographs_(Unicode_block)
-
-        Note that the CJK Unicode block is NOT all Japanese and Korean characters,
-        despite its name. The modern Korean Hangul alphabet is a different block,
-        as is Japanese Hiragana and Katakana. Those alphabets are used to write
-        space - separated words, so they are not treated specially and handled
-        like the all of the other languages.
-
-        """
-        code_point = ord(char)
-        if ((
-                code_point >= 0x4E00 and code_point <= 0x9FFF) or (
-                code_point >= 0x3400 and code_point <= 0x4DBF) or (
-                code_point >= 0x20000 and code_point <= 0x2A6DF) or (
-                code_point >= 0x2A700 and code_point <= 0x2B73F) or (
-                code_point >= 0x2B740 and code_point <= 0x2B81F) or (
-                code_point >= 0x2B820 and code_point <= 0x2CEAF) or (
-                code_point >= 0xF900 and code_point <= 0xFAFF) or (
-                code_point >= 0x2F800 and code_point <= 0x2FA1F)
-            ):
-            return True
-
-        return False
-
 
 class AddWhitespaceAroundWordAligner(LabelAligner):
 
@@ -156,3 +131,9 @@ class AddWhitespaceAroundWordAligner(LabelAligner):
 
     def _backward_transduce_func(self, labels: List[int], output_size: int) -> List[int]:
         return labels[1: -1]
+
+    def _compile_transform(self, label_map: LabelMap):
+        label_map.propagate(self._forward_edit, self._forward_transduce_func)
+
+    def _compile_inverse_transform(self, label_map: LabelMap):
+        label_map.propagate_inverse(self._forward_edit, self._backward_transduce_func)
@@ -1,11 +1,67 @@
+from contextlib import contextmanager
 import abc
+import hashlib
 import inspect
 import itertools
 import json
 import reprlib
-from typing import Any, List, Tuple
+import threading
+from typing import Any, Dict, List, Tuple
 
 from .factory import OperatorFactory
+from ..edit.label_map import LabelMap
+from ..edit.trusted import is_trusted
+
+
+_validation_state = threading.local()
+
+
+@contextmanager
+def skip_validation():
+    """Skip validation of configs when creating operators within the context
+
+    It is used when the configs are known to be valid, e.g. loaded
+    from an artifact written by `Pipe.to_artifact`.
+
+    """
+    orig_skipped = validation_skipped()
+    _validation_state.skipped = True
+    try:
+        yield
+    finally:
+        _validation_state.skipped = orig_skipped
+
+
+def validation_skipped() -> bool:
+    return getattr(_validation_state, 'skipped', False)
+
+
+_tries_state = threading.local()
+
+
+@contextmanager
+def prebuilt_tries(tries: Dict[str, Any]):
+    """Use prebuilt tries when creating an operator within the context
+
+    It is used when the tries are known to be built from the configs, e.g.
+    loaded from an artifact written by `Pipe.to_artifact`, so that operators
+    do not build them again, see `Operator._get_tries`.
+
+    Arg:
+        tries (dict): (key, value) = (name, DoubleArrayTrie)
+
+    """
+    orig_tries = getattr(_tries_state, 'tries', {})
+    _tries_state.tries = tries
+    try:
+        yield
+    finally:
+        _tries_state.tries = orig_tries
+
+
+def get_prebuilt_trie(name: str):
+    """The prebuilt trie of name, None if it is not given, see `prebuilt_tries`"""
+    return getattr(_tries_state, 'tries', {}).get(name)
 
 
 class Serializable(abc.ABC):
@@ -41,6 +97,7 @@ class Serializable(abc.ABC):
                     )
                     if arg_name not in self._configs
                 })
+            self._fingerprint = None
 
         cls.__init__ = __init__
 
@@ -54,10 +111,13 @@ class Serializable(abc.ABC):
         return cls.from_dict(params)
 
     @classmethod
-    def from_dict(cls, params):
+    def from_dict(cls, params, validate: bool = True):
         cls_name = params['op_name']
         kwargs = params['op_kwargs']
-        return cls.op_factory[cls_name](**kwargs)
+        if validate:
+            return cls.op_factory[cls_name](**kwargs)
+        with skip_validation():
+            return cls.op_factory[cls_name](**kwargs)
 
     def serialize(self) -> str:
         return json.dumps(
@@ -73,6 +133,27 @@ class Serializable(abc.ABC):
     def configs(self):
         return self._configs
 
+    @property
+    def fingerprint(self) -> str:
+        """A stable content hash of the class name and configs
+
+        It is computed once and memoized since configs should not be modified
+        after initialization.
+
+        Return:
+            hex digest of SHA-256 (str)
+
+        """
+        if self._fingerprint is None:
+            content = json.dumps(
+                [self.__class__.__name__, self.configs],
+                ensure_ascii=False,
+                sort_keys=True,
+                separators=(',', ':'),
+            )
+            self._fingerprint = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        return self._fingerprint
+
 
 class Operator(Serializable):
 
@@ -126,7 +207,10 @@ class Operator(Serializable):
 
         Raises:
             TypeError: If input_type or output_type isn't correct.
+                It is not checked in trusted mode, see `uttut.pipeline.edit.trusted`.
         """
+        if is_trusted():
+            return self._transform(input_sequence)
 
         if not isinstance(input_sequence, self.input_type):
             raise TypeError('Invalid input type')
@@ -140,8 +224,23 @@ class Operator(Serializable):
     def _transform(self, input_sequence) -> Tuple[Any, 'LabelAligner']:
         pass
 
+    def _get_tries(self) -> Dict[str, Any]:
+        """Tries built from configs
+
+        They are stored in artifacts by `Pipe.to_artifact`, and given back
+        by `prebuilt_tries` when the operator is loaded.
+
+        Return:
+            tries (dict): (key, value) = (name, DoubleArrayTrie)
+
+        """
+        return {}
+
     def __eq__(self, other):
-        return type(self) == type(other) and self.configs == other.configs
+        return type(self) == type(other) and self.fingerprint == other.fingerprint
+
+    def __hash__(self):
+        return hash(self.fingerprint)
 
     def __str__(self):
 
@@ -188,12 +287,14 @@ class LabelAligner(abc.ABC):
             labels (ints): has same length as the input_sequence of Operator.transfrom
 
         Raise:
-            ValueError if length of labels is not matched.
+            ValueError if length of labels is not matched (not checked in trusted mode).
 
         Return:
             labels (ints): has same length as the output_sequence of Operator.transform
 
         """
+        if is_trusted():
+            return self._transform(labels)
         self._validate_input(labels)
         output_labels = self._transform(labels)
         self._validate_output(output_labels)
@@ -206,12 +307,14 @@ class LabelAligner(abc.ABC):
             labels (ints): has same length as the output_sequence of Operator.transfrom
 
         Raise:
-            ValueError if length of labels is not matched.
+            ValueError if length of labels is not matched (not checked in trusted mode).
 
         Return:
             labels (ints): has same length as the input_sequence of Operator.transform
 
         """
+        if is_trusted():
+            return self._inverse_transform(labels)
         self._validate_output(labels)
         output_labels = self._inverse_transform(labels)
         self._validate_input(output_labels)
@@ -233,6 +336,28 @@ class LabelAligner(abc.ABC):
     def _inverse_transform(self, labels: List[int]) -> List[int]:
         pass
 
+    def _compile_transform(self, label_map: LabelMap):
+        """Compose `_transform` into label_map
+
+        Sub-classes should implement it to support `LabelAlignerSequence.compile`.
+
+        Raise:
+            NotImplementedError if this label aligner can not be compiled.
+
+        """
+        raise NotImplementedError
+
+    def _compile_inverse_transform(self, label_map: LabelMap):
+        """Compose `_inverse_transform` into label_map
+
+        Sub-classes should implement it to support `LabelAlignerSequence.compile`.
+
+        Raise:
+            NotImplementedError if this label aligner can not be compiled.
+
+        """
+        raise NotImplementedError
+
 
 class NullLabelAligner(LabelAligner):
 
@@ -241,3 +366,9 @@ class NullLabelAligner(LabelAligner):
 
     def _inverse_transform(self, labels):
         return labels
+
+    def _compile_transform(self, label_map: LabelMap):
+        pass
+
+    def _compile_inverse_transform(self, label_map: LabelMap):
+        pass
@@ -0,0 +1,75 @@
+from typing import List, Tuple
+
+from .base import Operator, LabelAligner, validation_skipped
+from .span_subwords import SpanSubwordsAligner
+from ..edit.replacement import ReplacementGroup
+from .utils.char_ngram import hash_char_ngrams
+
+
+class CharNgramHash(Operator):
+
+    """
+    Span each token to the bucket ids of its character n-grams
+
+    The n-grams are taken from the token wrapped by '<' and '>' as fastText does,
+    and the bucket id of an n-gram is consistent_hash(ngram, num_buckets).
+    If the wrapped token is shorter than min_n, the wrapped token itself is
+    the only n-gram.
+
+    E.g.
+    >>> from uttut.pipeline.ops.char_ngram_hash import CharNgramHash
+    >>> from uttut.pipeline.ops.utils.consistent_hash import consistent_hash
+    >>> op = CharNgramHash(min_n=3, max_n=3, num_buckets=100)
+    >>> output_seq, label_aligner = op.transform(['I', 'like'])
+    >>> output_labels = label_aligner.transform([1, 2])
+    >>> output_seq
+    [consistent_hash('<I>', 100),
+     consistent_hash('<li', 100), consistent_hash('lik', 100),
+     consistent_hash('ike', 100), consistent_hash('ke>', 100)]
+    >>> output_labels
+    [1, 2, 2, 2, 2]
+    >>> label_aligner.inverse_transform(output_labels)
+    [1, 2]
+
+    """
+
+    _input_type = list
+    _output_type = list
+
+    def __init__(self, min_n: int = 3, max_n: int = 6, num_buckets: int = 2000000):
+        if not validation_skipped():
+            self._validate_args(min_n, max_n, num_buckets)
+        self.min_n = min_n
+        self.max_n = max_n
+        self.num_buckets = num_buckets
+
+    def _validate_args(self, min_n: int, max_n: int, num_buckets: int):
+        if not 1 <= min_n <= max_n:
+            raise ValueError(
+                f"Invalid n-gram range: ({min_n}, {max_n}), 1 <= min_n <= max_n is required.",
+            )
+        if num_buckets < 1:
+            raise ValueError('num_buckets should be positive')
+
+    def _transform(self, input_sequence: List[str]) -> Tuple[List[int], 'LabelAligner']:
+        bucket_ids = hash_char_ngrams(input_sequence, self.min_n, self.max_n, self.num_buckets)
+        output_sequence = [bucket_id for token_bucket_ids in bucket_ids
+                           for bucket_id in token_bucket_ids]
+
+        num_tokens = len(input_sequence)
+        forward_replacement_group = ReplacementGroup.from_arrays(
+            starts=range(num_tokens),
+            ends=range(1, num_tokens + 1),
+            new_values=bucket_ids,
+            annotations=['char-ngram-hash'] * num_tokens,
+        )
+        label_aligner = CharNgramHashAligner(
+            input_sequence=input_sequence,
+            edit=forward_replacement_group,
+            output_length=len(output_sequence),
+        )
+        return output_sequence, label_aligner
+
+
+# a token and its n-grams are aligned as a word and its subwords
+CharNgramHashAligner = SpanSubwordsAligner
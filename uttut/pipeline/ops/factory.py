@@ -1,7 +1,30 @@
+from typing import Callable, Dict, Union
+import importlib
+import sys
+
+
+ENTRY_POINT_GROUP = 'uttut.operators'
+
+
 class OperatorFactory:
 
+    """Registry of operators
+
+    Operators are registered eagerly by `register` (done when an Operator
+    subclass is defined) or lazily by `register_lazy`, which defers importing
+    the module of an operator until it is looked up by name.
+
+    Third-party operators can be registered through the entry points of
+    group `uttut.operators`, e.g. in setup.py
+        entry_points={'uttut.operators': ['MyOp = my_package.ops:MyOp']}
+    The entry points are scanned when a name is not found.
+
+    """
+
     def __init__(self):
         self._factory = {}
+        self._lazy_factory = {}
+        self._entry_points_loaded = False
 
     def register(self, name: str, op_class):
         """register an operator
@@ -19,12 +42,109 @@ class OperatorFactory:
         else:
             raise KeyError(f"{name} already exists.")
 
+    def register_lazy(self, name: str, target: Union[str, Callable]):
+        """register an operator which is resolved on first lookup
+
+        Args:
+            name (str): user defined name of operator
+            target: path of the module which defines the operator, e.g.
+                'uttut.pipeline.ops.lowercase', or 'module:attribute', or
+                a callable returning the Operator class.
+
+        """
+        if name not in self._factory:
+            self._lazy_factory.setdefault(name, target)
+
+    def __contains__(self, op_name):
+        return op_name in self._factory or op_name in self._lazy_factory
+
     def __getitem__(self, op_name):
-        if op_name not in self._factory:
+        if op_name in self._factory:
+            return self._factory[op_name]
+
+        if op_name not in self._lazy_factory:
+            self._load_entry_points()
+        if op_name not in self._lazy_factory:
             raise KeyError(f"{op_name} is not registered")
+
+        op_class = _resolve(self._lazy_factory.pop(op_name))
+        if op_name not in self._factory:
+            if not isinstance(op_class, type):
+                raise KeyError(f"{op_name} is not registered")
+            self._factory[op_name] = op_class
         return self._factory[op_name]
 
+    def _load_entry_points(self):
+        if self._entry_points_loaded:
+            return
+        self._entry_points_loaded = True
+        for entry_point in _iter_entry_points(ENTRY_POINT_GROUP):
+            self.register_lazy(entry_point.name, entry_point.load)
+
     def __eq__(self, other):
         if not isinstance(other, OperatorFactory):
             return False
-        return self._factory == other._factory
+        return (self._factory, self._lazy_factory) == (other._factory, other._lazy_factory)
+
+
+def gen_lazy_getattr(
+        op_factory: OperatorFactory,
+        package_name: str,
+        name2module: Dict[str, str],
+        namespace: Dict,
+    ) -> Callable:
+    """Register operators of a package lazily and create its module `__getattr__`
+
+    The module of an operator is imported when the operator is accessed as
+    an attribute of the package or looked up in op_factory by name.
+
+    Args:
+        op_factory (OperatorFactory)
+        package_name (str): `__name__` of the package
+        name2module (dict): (key, value) = (name of operator, relative module path)
+        namespace (dict): `globals()` of the package, where resolved operators are cached
+
+    Return:
+        __getattr__ of the package (PEP 562)
+
+    """
+    for op_name, module_name in name2module.items():
+        op_factory.register_lazy(op_name, package_name + module_name)
+
+    def __getattr__(name):
+        if name not in name2module:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        op_class = op_factory[name]
+        namespace[name] = op_class
+        return op_class
+
+    if sys.version_info < (3, 7):  # module __getattr__ is not supported
+        for op_name in name2module:
+            namespace[op_name] = op_factory[op_name]
+    return __getattr__
+
+
+def _resolve(target: Union[str, Callable]):
+    if callable(target):
+        return target()
+    module_name, _, attr_name = target.partition(':')
+    module = importlib.import_module(module_name)
+    if attr_name:
+        return getattr(module, attr_name)
+    return module
+
+
+def _iter_entry_points(group: str):
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:  # python < 3.8
+        try:
+            import pkg_resources
+        except ImportError:
+            return []
+        return list(pkg_resources.iter_entry_points(group))
+
+    eps = entry_points()
+    if hasattr(eps, 'select'):
+        return list(eps.select(group=group))
+    return list(eps.get(group, []))
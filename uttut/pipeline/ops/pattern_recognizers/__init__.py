@@ -1,9 +1,19 @@
-from .int_token import IntToken
-from .float_token import FloatToken
-from .int_token_with_space import IntTokenWithSpace
-from .float_token_with_space import FloatTokenWithSpace
-from .merge_whitespace_characters import MergeWhiteSpaceCharacters
-from .strip_whitespace_characters import StripWhiteSpaceCharacters
-from .stopwords_to_whitespace import StopwordsToWhitespace
-from .num_token_with_space import NumTokenWithSpace
-from .replace_a_with_b import ReplaceAwithB
+from ..base import Operator
+from ..factory import gen_lazy_getattr
+
+
+_OPERATOR_MODULES = {
+    'IntToken': '.int_token',
+    'FloatToken': '.float_token',
+    'IntTokenWithSpace': '.int_token_with_space',
+    'FloatTokenWithSpace': '.float_token_with_space',
+    'MergeWhiteSpaceCharacters': '.merge_whitespace_characters',
+    'StripWhiteSpaceCharacters': '.strip_whitespace_characters',
+    'StopwordsToWhitespace': '.stopwords_to_whitespace',
+    'NumTokenWithSpace': '.num_token_with_space',
+    'ReplaceAwithB': '.replace_a_with_b',
+}
+
+__all__ = list(_OPERATOR_MODULES)
+
+__getattr__ = gen_lazy_getattr(Operator.op_factory, __name__, _OPERATOR_MODULES, globals())
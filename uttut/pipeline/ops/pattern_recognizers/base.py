@@ -2,6 +2,7 @@ from typing import List, Tuple, Pattern
 
 from uttut.pipeline.edit import str2str
 from uttut.pipeline.edit.label_propagation import propagate_by_replacement_group
+from uttut.pipeline.edit.label_map import LabelMap
 from uttut.pipeline.edit.replacement import ReplacementGroup
 from ..base import Operator, LabelAligner
 
@@ -82,3 +83,9 @@ class PatternRecognizerAligner(LabelAligner):
 
     def _backward_transduce_func(self, labels: List[int], output_size: int) -> List[int]:
         raise NotImplementedError
+
+    def _compile_transform(self, label_map: LabelMap):
+        label_map.propagate(self._forward_edit, self._forward_transduce_func)
+
+    def _compile_inverse_transform(self, label_map: LabelMap):
+        label_map.propagate_inverse(self._forward_edit, self._backward_transduce_func)
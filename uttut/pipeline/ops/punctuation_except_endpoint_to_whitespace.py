@@ -4,7 +4,8 @@ from .base import Operator, LabelAligner
 from ..edit.replacement import ReplacementGroup
 from ..edit import str2str
 from ..edit.label_propagation import propagate_by_replacement_group
-from .add_whitespace_around_punctuation import is_punctuation
+from ..edit.label_map import LabelMap
+from .utils.unicode_class import PUNCTUATION, find_chars
 from .label_transducer import get_not_entity
 
 
@@ -46,8 +47,8 @@ class PunctuationExceptEndpointToWhitespace(Operator):
     def _gen_forward_replacement_group(self, input_str: str) -> ReplacementGroup:
         replacement_group = ReplacementGroup()
 
-        for i, char in enumerate(input_str):
-            if is_punctuation(char) and not self._is_endpoint(char):
+        for i in find_chars(input_str, PUNCTUATION):
+            if not self._is_endpoint(input_str[i]):
                 replacement_group.add(
                     start=i,
                     end=i + 1,
@@ -85,3 +86,9 @@ class PunctuationExceptEndpointToWhitespaceAligner(LabelAligner):
 
     def _backward_transduce_func(self, labels: List[int], output_size: int) -> List[int]:
         return get_not_entity(labels, output_size)
+
+    def _compile_transform(self, label_map: LabelMap):
+        label_map.propagate(self._forward_edit, self._forward_transduce_func)
+
+    def _compile_inverse_transform(self, label_map: LabelMap):
+        label_map.propagate_inverse(self._forward_edit, self._backward_transduce_func)
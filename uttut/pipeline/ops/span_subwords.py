@@ -1,17 +1,24 @@
-from typing import List, Tuple, Dict
+from typing import List, Optional, Tuple, Dict
 
 from .tokens import UNK_TOKEN
-from .base import Operator, LabelAligner
+from .base import Operator, LabelAligner, get_prebuilt_trie
 from .label_transducer import get_most_common, get_most_common_except_not_entity
 from ..edit import lst2lst
 from ..edit.replacement import ReplacementGroup
 from ..edit.label_propagation import propagate_by_replacement_group
+from ..edit.label_map import LabelMap
+from ..cache import LRUCache
+from .utils.double_array_trie import DoubleArrayTrie
+
+
+CONTINUATION_PREFIX = '##'
 
 
 class SpanSubwords(Operator):
 
     _input_type = list
     _output_type = list
+    _cache_size = 4096  # max number of words whose subwords are cached
 
     def __init__(
             self,
@@ -48,6 +55,18 @@ class SpanSubwords(Operator):
         self.vocab = vocab
         self.unk_token = unk_token
         self.maxlen_per_token = maxlen_per_token
+        self._vocab_tries = VocabTries(
+            vocab,
+            trie=get_prebuilt_trie('vocab'),
+            continuation_trie=get_prebuilt_trie('vocab_continuation'),
+        )
+        self._cache = LRUCache(max_entries=self._cache_size)
+
+    def _get_tries(self):
+        return {
+            'vocab': self._vocab_tries.trie,
+            'vocab_continuation': self._vocab_tries.continuation_trie,
+        }
 
     def _transform(self, input_sequence: List[str]) -> Tuple[List[str], 'LabelAligner']:
         """
@@ -67,23 +86,29 @@ class SpanSubwords(Operator):
     def _gen_forward_replacement_group(self, input_lst: List[str]) -> ReplacementGroup:
         replacement_group = ReplacementGroup()
         for i, token in enumerate(input_lst):
-            subtokens = span_subwords(
-                word=token,
-                unk_token=self.unk_token,
-                vocab=self.vocab,
-                max_input_chars_per_word=self.maxlen_per_token,
-            )
-            if subtokens != [token]:
+            subtokens = self._span_subwords(token)
+            if subtokens != (token,):
                 replacement_group.add(
                     start=i,
                     end=i + 1,
-                    new_value=subtokens,
+                    new_value=list(subtokens),
                     annotation='span-subwords',
                 )
         replacement_group.done()
 
         return replacement_group
 
+    def _span_subwords(self, word: str) -> Tuple[str, ...]:
+        if len(word) > self.maxlen_per_token:
+            return (self.unk_token,)
+
+        subtokens = self._cache.get(word)
+        if subtokens is None:
+            subtokens = self._vocab_tries.span(word)
+            subtokens = (self.unk_token,) if subtokens is None else tuple(subtokens)
+            self._cache.put(word, subtokens, nbytes=0)
+        return subtokens
+
 
 class SpanSubwordsAligner(LabelAligner):
 
@@ -108,6 +133,12 @@ class SpanSubwordsAligner(LabelAligner):
     def _backward_transduce_func(self, labels: List[int], output_size: int) -> List[int]:
         return get_most_common_except_not_entity(labels, output_size)
 
+    def _compile_transform(self, label_map: LabelMap):
+        label_map.propagate(self._forward_edit, self._forward_transduce_func)
+
+    def _compile_inverse_transform(self, label_map: LabelMap):
+        label_map.propagate_inverse(self._forward_edit, self._backward_transduce_func)
+
 
 def span_subwords(
         word: str,
@@ -169,3 +200,64 @@ def span_subwords(
         # one of subwords is not in vocab
         return [unk_token]
     return sub_tokens
+
+
+class VocabTries:
+
+    """Tries of a WordPiece vocabulary
+
+    A word is spanned by the greedy longest-match-first algorithm as
+    `span_subwords` does, but the longest match at each position is found by
+    one walk of a trie instead of looking up every shorter substring. The first
+    subword is matched in the trie of all tokens, and the others are matched in
+    the trie of continuation tokens (with CONTINUATION_PREFIX stripped).
+
+    A trie which is given is trusted to be built from vocab, see `trie` and
+    `continuation_trie`, otherwise it is built.
+
+    """
+
+    def __init__(
+            self,
+            vocab: Dict[str, int],
+            trie: Optional[DoubleArrayTrie] = None,
+            continuation_trie: Optional[DoubleArrayTrie] = None,
+        ):
+        if trie is None:
+            trie = DoubleArrayTrie(vocab)
+        if continuation_trie is None:
+            continuation_trie = DoubleArrayTrie(
+                token[len(CONTINUATION_PREFIX):]
+                for token in vocab
+                if token.startswith(CONTINUATION_PREFIX)
+            )
+        self._trie = trie
+        self._continuation_trie = continuation_trie
+
+    @property
+    def trie(self) -> DoubleArrayTrie:
+        """trie of all tokens"""
+        return self._trie
+
+    @property
+    def continuation_trie(self) -> DoubleArrayTrie:
+        """trie of continuation tokens with CONTINUATION_PREFIX stripped"""
+        return self._continuation_trie
+
+    def span(self, word: str) -> Optional[List[str]]:
+        """Subwords of word, None if a part of word is not found in vocabulary"""
+        if not word:
+            return []
+        subword = self._trie.match_prefix(word)
+        if subword is None:
+            return None
+
+        subwords = [subword]
+        start = len(subword)
+        while start < len(word):
+            subword = self._continuation_trie.match_prefix(word, start=start)
+            if subword is None:
+                return None
+            subwords.append(CONTINUATION_PREFIX + subword)
+            start += len(subword)
+        return subwords
@@ -6,6 +6,8 @@ from .label_transducer import get_most_common_except_not_entity
 from ..edit.replacement import ReplacementGroup
 from ..edit import str2str
 from ..edit.label_propagation import propagate_by_replacement_group
+from ..edit.label_map import LabelMap
+from .utils.unicode_class import COMBINING_MARK, remove_chars
 
 
 class StripAccentToken(Operator):
@@ -81,6 +83,12 @@ class StripAccentTokenAligner(LabelAligner):
     def _backward_transduce_func(self, labels: List[int], output_size: int) -> List[int]:
         return get_most_common_except_not_entity(labels, output_size)
 
+    def _compile_transform(self, label_map: LabelMap):
+        label_map.propagate(self._forward_edit, self._forward_transduce_func)
+
+    def _compile_inverse_transform(self, label_map: LabelMap):
+        label_map.propagate_inverse(self._forward_edit, self._backward_transduce_func)
+
 
 def _strip_accents(text: str) -> str:
 
@@ -91,10 +99,4 @@ def _strip_accents(text: str) -> str:
     """
 
     text = unicodedata.normalize("NFD", text)
-    output = []
-    for char in text:
-        cat = unicodedata.category(char)
-        if cat == "Mn":
-            continue
-        output.append(char)
-    return "".join(output)
+    return remove_chars(text, COMBINING_MARK)
@@ -2,6 +2,8 @@ import abc
 from collections import namedtuple
 from typing import List
 
+from uttut.pipeline.edit.trusted import trusted
+
 
 class OperatorTestTemplate(abc.ABC):
 
@@ -57,6 +59,21 @@ class OperatorTestTemplate(abc.ABC):
         output = label_aligner.inverse_transform(output_labels)
         assert input_labels == output
 
+    def test_trusted_transform(self, input_sequence, input_labels, output_labels, op):
+        output_sequence, label_aligner = op.transform(input_sequence)
+        with trusted():
+            trusted_output_sequence, trusted_label_aligner = op.transform(input_sequence)
+            assert output_sequence == trusted_output_sequence
+            assert output_labels == trusted_label_aligner.transform(input_labels)
+            assert input_labels == trusted_label_aligner.inverse_transform(output_labels)
+
+    def test_fingerprint(self, op):
+        loaded_op = op.deserialize(op.serialize())
+        assert 64 == len(op.fingerprint)
+        assert op.fingerprint == loaded_op.fingerprint
+        assert op == loaded_op
+        assert hash(op) == hash(loaded_op)
+
     def test_str(self, op):
         assert str(op).startswith(op.__class__.__name__)
 
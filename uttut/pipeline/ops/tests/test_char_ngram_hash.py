@@ -0,0 +1,61 @@
+import pytest
+
+from ..char_ngram_hash import CharNgramHash
+from ..utils.consistent_hash import consistent_hash
+from .common_tests import OperatorTestTemplate, ParamTuple
+
+
+def hash_ngrams(*ngrams):
+    return [consistent_hash(ngram, 1000) for ngram in ngrams]
+
+
+class TestCharNgramHash(OperatorTestTemplate):
+
+    params = [
+        ParamTuple(
+            ['I', 'like', '薄餡'],
+            [1, 2, 3],
+            hash_ngrams('<I>', '<li', 'lik', 'ike', 'ke>', '<薄餡', '薄餡>'),
+            [1, 2, 2, 2, 2, 3, 3],
+            id='en zh',
+        ),
+        ParamTuple(
+            ['a', ''],
+            [0, 1],
+            hash_ngrams('<a>', '<>'),
+            [0, 1],
+            id='shorter than min_n',
+        ),
+        ParamTuple(
+            [],
+            [],
+            [],
+            [],
+            id='empty',
+        ),
+    ]
+
+    @pytest.fixture(scope='class')
+    def op(self):
+        return CharNgramHash(min_n=3, max_n=3, num_buckets=1000)
+
+    def test_ngram_range(self):
+        op = CharNgramHash(min_n=2, max_n=3, num_buckets=1000)
+        output_sequence, _ = op.transform(['ab'])
+        assert hash_ngrams('<a', '<ab', 'ab', 'ab>', 'b>') == output_sequence
+
+    @pytest.mark.parametrize(
+        'min_n,max_n,num_buckets',
+        [
+            pytest.param(0, 3, 1000, id='min_n is 0'),
+            pytest.param(4, 3, 1000, id='max_n < min_n'),
+            pytest.param(3, 6, 0, id='no buckets'),
+        ],
+    )
+    def test_invalid_args(self, min_n, max_n, num_buckets):
+        with pytest.raises(ValueError):
+            CharNgramHash(min_n=min_n, max_n=max_n, num_buckets=num_buckets)
+
+    def test_equal(self, op):
+        assert op == CharNgramHash(min_n=3, max_n=3, num_buckets=1000)
+        assert op != CharNgramHash(min_n=3, max_n=4, num_buckets=1000)
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 
 
@@ -29,3 +32,54 @@ def test_operator_not_found(op_factory):
 
     with pytest.raises(KeyError):
         op_factory['2']
+
+
+class FakeEntryPoint:
+
+    def __init__(self, name, op_class):
+        self.name = name
+        self.op_class = op_class
+
+    def load(self):
+        return self.op_class
+
+
+def test_register_lazy(op_factory):
+    op_factory.register_lazy('Lowercase', 'uttut.pipeline.ops.lowercase')
+    op_factory.register_lazy('Pad', 'uttut.pipeline.ops.pad:Pad')
+    op_factory.register_lazy('Fake', lambda: int)
+    assert 'Pad' in op_factory and 'Fake' in op_factory
+
+    assert 'Pad' == op_factory['Pad'].__name__
+    assert int == op_factory['Fake']
+    assert int == op_factory['Fake']
+
+
+def test_register_lazy_not_resolved(op_factory):
+    op_factory.register_lazy('Lowercase', 'uttut.pipeline.ops.lowercase')
+    with pytest.raises(KeyError):
+        op_factory['Lowercase']  # registered into another factory
+
+
+def test_entry_points(op_factory, mocker):
+    mocked_iter = mocker.patch(
+        'uttut.pipeline.ops.factory._iter_entry_points',
+        return_value=[FakeEntryPoint('ThirdPartyOp', float)],
+    )
+    assert float == op_factory['ThirdPartyOp']
+    with pytest.raises(KeyError):
+        op_factory['NotFound']
+    mocked_iter.assert_called_once_with('uttut.operators')
+
+
+def test_import_operators_lazily():
+    script = (
+        "import sys\n"
+        "import uttut.pipeline\n"
+        "assert 'uttut.pipeline.ops.pattern_recognizers.stopwords_to_whitespace' "
+        "not in sys.modules\n"
+        "from uttut.pipeline.ops import StopwordsToWhitespace\n"
+        "from uttut.pipeline.ops.base import Operator\n"
+        "assert Operator.op_factory['StopwordsToWhitespace'] is StopwordsToWhitespace\n"
+    )
+    subprocess.run([sys.executable, '-c', script], check=True)
@@ -1,7 +1,12 @@
+import random
+
 import pytest
 
-from ..span_subwords import SpanSubwords
+from ..base import prebuilt_tries
+from ..span_subwords import SpanSubwords, span_subwords
 from .common_tests import OperatorTestTemplate, ParamTuple
+from uttut.pipeline.bert.tests.tokenization import WordpieceTokenizer
+from uttut.pipeline.cache import LRUCache
 
 
 def to_dict(input_list):
@@ -121,3 +126,48 @@ class TestSpanSubwordsHasSubwords(OperatorTestTemplate):
 )
 def test_not_equal(obj1, obj2):
     assert obj1 != obj2
+
+
+def test_same_as_bert():
+    rng = random.Random(0)
+    chars = 'ab#珍奶'
+    for _ in range(50):
+        vocab = to_dict({
+            ('##' if rng.random() < 0.5 else '') + ''.join(
+                rng.choice(chars) for _ in range(rng.randint(1, 4)))
+            for _ in range(20)
+        } | {'[UNK]'})
+        op = SpanSubwords(vocab=vocab, unk_token='[UNK]', maxlen_per_token=8)
+        bert_tokenizer = WordpieceTokenizer(vocab, '[UNK]', 8)
+        words = [''.join(rng.choice(chars) for _ in range(rng.randint(1, 10))) for _ in range(20)]
+
+        output_seq, _ = op.transform(words)
+        assert bert_tokenizer.tokenize(' '.join(words)) == output_seq
+        assert [
+            subword
+            for word in words
+            for subword in span_subwords(word, '[UNK]', vocab, 8)
+        ] == output_seq
+
+
+def test_cache():
+    op = SpanSubwords(
+        vocab=to_dict(["un", "##want", "##ed", "runn", "##ing", "[UNK]"]),
+        unk_token="[UNK]",
+    )
+    op._cache = LRUCache(max_entries=2)
+    for _ in range(2):
+        output_seq, _ = op.transform(["unwanted", "running", "unwantedX"])
+        assert ["un", "##want", "##ed", "runn", "##ing", "[UNK]"] == output_seq
+    assert 2 == len(op._cache)
+
+
+def test_prebuilt_tries():
+    vocab = to_dict(["un", "##want", "##ed", "runn", "##ing", "[UNK]"])
+    tries = SpanSubwords(vocab=vocab, unk_token="[UNK]")._get_tries()
+    assert ['ed', 'ing', 'want'] == list(tries['vocab_continuation'])
+    with prebuilt_tries(tries):
+        op = SpanSubwords(vocab=vocab, unk_token="[UNK]")
+    assert tries == op._get_tries()
+    output_seq, _ = op.transform(["unwanted", "running"])
+    assert ["un", "##want", "##ed", "runn", "##ing"] == output_seq
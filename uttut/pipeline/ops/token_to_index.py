@@ -1,10 +1,8 @@
 from typing import List, Tuple, Dict
 
-from .base import Operator, NullLabelAligner
+from .base import Operator, NullLabelAligner, validation_skipped
 from .tokens import UNK_TOKEN
-
-from ..edit import lst2lst
-from ..edit.replacement import ReplacementGroup
+from .utils.token_lookup import lookup_indices
 
 
 def validate_continuity(token2index: Dict[str, int]):
@@ -43,7 +41,8 @@ class Token2Index(Operator):
     _output_type = list
 
     def __init__(self, token2index: Dict[str, int], unk_token: str = UNK_TOKEN):
-        self._validate_token2index(token2index, unk_token)
+        if not validation_skipped():
+            self._validate_token2index(token2index, unk_token)
         self.token2index = token2index
         self.unk_token = unk_token
 
@@ -53,32 +52,16 @@ class Token2Index(Operator):
             raise KeyError(f"token2index should have token {unk_token}")
 
     def _transform(self, input_sequence: List[str]) -> Tuple[List[int], 'LabelAligner']:
-        forward_replacement_group = self._gen_forward_replacement_group(input_sequence)
-        output_sequence = lst2lst.apply(input_sequence, forward_replacement_group)
+        # tokens are mapped one to one, so no edit is needed to align labels
+        output_sequence = lookup_indices(
+            input_sequence, self.token2index, self.token2index[self.unk_token])
 
         label_aligner = Token2IndexAligner(
             input_sequence=input_sequence,
-            edit=forward_replacement_group,
+            edit=None,
             output_length=len(output_sequence),
         )
         return output_sequence, label_aligner
 
-    def _gen_forward_replacement_group(self, input_lst: List[str]) -> ReplacementGroup:
-
-        replacement_group = ReplacementGroup()
-        for idx, token in enumerate(input_lst):
-            if token in self.token2index:
-                index = self.token2index[token]
-            else:
-                index = self.token2index[self.unk_token]
-            replacement_group.add(
-                start=idx,
-                end=idx + 1,
-                new_value=[index],
-                annotation='token2index',
-            )
-        replacement_group.done()
-        return replacement_group
-
 
 Token2IndexAligner = NullLabelAligner
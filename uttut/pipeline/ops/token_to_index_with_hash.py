@@ -1,10 +1,8 @@
 from typing import List, Tuple, Dict
 
-from .base import Operator
+from .base import Operator, validation_skipped
 
-from ..edit import lst2lst
-from ..edit.replacement import ReplacementGroup
-from .utils.consistent_hash import consistent_hash
+from .utils.token_lookup import lookup_indices_with_hash
 from .token_to_index import validate_continuity, Token2IndexAligner
 
 
@@ -35,36 +33,20 @@ class Token2IndexwithHash(Operator):
     _output_type = list
 
     def __init__(self, token2index: Dict[str, int]):
-        self._validate_token2index(token2index)
+        if not validation_skipped():
+            self._validate_token2index(token2index)
         self.token2index = token2index
 
     def _validate_token2index(self, token2index: Dict[str, int]):
         validate_continuity(token2index)
 
     def _transform(self, input_sequence: List[str]) -> Tuple[List[int], 'LabelAligner']:
-        forward_replacement_group = self._gen_forward_replacement_group(input_sequence)
-        output_sequence = lst2lst.apply(input_sequence, forward_replacement_group)
+        output_sequence = lookup_indices_with_hash(
+            input_sequence, self.token2index, len(self.token2index))
 
         label_aligner = Token2IndexAligner(
             input_sequence=input_sequence,
-            edit=forward_replacement_group,
+            edit=None,
             output_length=len(output_sequence),
         )
         return output_sequence, label_aligner
-
-    def _gen_forward_replacement_group(self, input_lst: List[str]) -> ReplacementGroup:
-
-        replacement_group = ReplacementGroup()
-        for idx, token in enumerate(input_lst):
-            if token in self.token2index:
-                index = self.token2index[token]
-            else:
-                index = consistent_hash(token, len(self.token2index))
-            replacement_group.add(
-                start=idx,
-                end=idx + 1,
-                new_value=[index],
-                annotation='token2indexwithhash',
-            )
-        replacement_group.done()
-        return replacement_group
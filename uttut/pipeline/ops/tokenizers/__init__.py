@@ -1,5 +1,15 @@
-from .char_tokenizer import CharTokenizer
-from .eng_tokenizer import EngTokenizer
-from .zh_char_tokenizer import ZhCharTokenizer
-from .whitespace_tokenizer import WhiteSpaceTokenizer
-from .custom_word_tokenizer import CustomWordTokenizer
+from ..base import Operator
+from ..factory import gen_lazy_getattr
+
+
+_OPERATOR_MODULES = {
+    'CharTokenizer': '.char_tokenizer',
+    'EngTokenizer': '.eng_tokenizer',
+    'ZhCharTokenizer': '.zh_char_tokenizer',
+    'WhiteSpaceTokenizer': '.whitespace_tokenizer',
+    'CustomWordTokenizer': '.custom_word_tokenizer',
+}
+
+__all__ = list(_OPERATOR_MODULES)
+
+__getattr__ = gen_lazy_getattr(Operator.op_factory, __name__, _OPERATOR_MODULES, globals())
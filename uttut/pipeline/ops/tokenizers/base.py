@@ -6,6 +6,7 @@ from uttut.pipeline.edit.label_propagation import (
     reduce_by_span_group,
     expand_by_span_group,
 )
+from uttut.pipeline.edit.label_map import LabelMap
 
 from ..base import Operator, LabelAligner
 
@@ -27,12 +28,12 @@ class Tokenizer(Operator):
         cls.assert_has_class_attributes('_label_aligner_class')
 
     def _transform(self, input_sequence: str) -> Tuple[List[str], 'LabelAligner']:
-        tokens = self._tokenize(input_sequence)
+        offsets = self._tokenize_with_offsets(input_sequence)
+        tokens = [input_sequence[start: end] for start, end in offsets]
 
         # transform sequence
-        forward_replacement_group = str2lst.gen_replacement_group(input_sequence, tokens)
-        temp_str = str2str.apply(input_sequence, forward_replacement_group)
-        span_group = str2lst.gen_span_group(temp_str, tokens)
+        forward_replacement_group, span_group = str2lst.gen_edit_from_offsets(
+            input_sequence, offsets)
 
         label_aligner = self._label_aligner_class(
             input_sequence=input_sequence,
@@ -45,8 +46,32 @@ class Tokenizer(Operator):
 
         return tokens, label_aligner
 
+    def _tokenize_with_offsets(self, input_str: str) -> List[Tuple[int, int]]:
+        """Tokenize input_str into offsets of tokens
+
+        Sub-classes should implement it or `_tokenize`. By default, the tokens
+        of `_tokenize` are located in input_str by `str.find`.
+
+        Return:
+            offsets (list of tuples): sorted and disjoint (start, end) such that
+                tokens are input_str[start: end]. The characters not covered are removed.
+
+        """
+        if type(self)._tokenize is Tokenizer._tokenize:
+            raise NotImplementedError
+
+        shift = 0
+        offsets = []
+        for token in self._tokenize(input_str):
+            start = input_str.find(token, shift)
+            if start == -1:
+                raise ValueError('input_str and tokens are not compatible')
+            shift = start + len(token)
+            offsets.append((start, shift))
+        return offsets
+
     def _tokenize(self, input_str: str) -> List[str]:
-        raise NotImplementedError
+        return [input_str[start: end] for start, end in self._tokenize_with_offsets(input_str)]
 
 
 class TokenizerAligner(LabelAligner):
@@ -79,3 +104,17 @@ class TokenizerAligner(LabelAligner):
 
     def _backward_transduce_func(self, labels: List[int], output_size: int) -> List[int]:
         raise NotImplementedError
+
+    def _compile_transform(self, label_map: LabelMap):
+        label_map.propagate(
+            self._forward_edit['replacement_group'],
+            self._forward_transduce_func,
+        )
+        label_map.reduce(self._forward_edit['span_group'])
+
+    def _compile_inverse_transform(self, label_map: LabelMap):
+        label_map.expand(self._forward_edit['span_group'])
+        label_map.propagate_inverse(
+            self._forward_edit['replacement_group'],
+            self._backward_transduce_func,
+        )
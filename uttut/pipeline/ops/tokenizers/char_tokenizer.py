@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Tuple
 
 from .base import Tokenizer, TokenizerAligner
 
@@ -32,5 +32,5 @@ class CharTokenizer(Tokenizer):
 
     _label_aligner_class = CharTokenizerAligner
 
-    def _tokenize(self, input_str: str) -> List[str]:
-        return list(input_str)
+    def _tokenize_with_offsets(self, input_str: str) -> List[Tuple[int, int]]:
+        return [(idx, idx + 1) for idx in range(len(input_str))]
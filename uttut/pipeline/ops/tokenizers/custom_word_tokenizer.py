@@ -1,7 +1,8 @@
-from typing import List
+from typing import List, Tuple
 
 from ..label_transducer import get_most_common_except_not_entity
-from ..utils.trie import Trie
+from ..base import get_prebuilt_trie
+from ..utils.double_array_trie import DoubleArrayTrie
 from .base import Tokenizer, TokenizerAligner
 
 
@@ -37,9 +38,11 @@ class CustomWordTokenizer(Tokenizer):
     def __init__(self, user_words: List[str], shortest: bool = False):
         self.validate_user_words(user_words)
         self._user_words = user_words
-        self._trie = Trie()
-        for word in self._user_words:
-            self._trie.insert(word)
+        self._trie = get_prebuilt_trie('user_words')
+        if self._trie is None:
+            self._trie = DoubleArrayTrie()
+            for word in self._user_words:
+                self._trie.insert(word)
 
         self._shortest = shortest
 
@@ -48,19 +51,17 @@ class CustomWordTokenizer(Tokenizer):
         if user_words is None or len(user_words) < 1:
             raise ValueError('User words should not be empty.')
 
-    def _tokenize(self, input_str: str) -> List[str]:
+    def _get_tries(self):
+        return {'user_words': self._trie}
+
+    def _tokenize_with_offsets(self, input_str: str) -> List[Tuple[int, int]]:
+        """User words are tokens, each of the other characters is a token"""
         start = 0
-        tokens = []
-        while start < len(input_str):
-            match_result = self._trie.match_prefix(
-                input_str[start:],
-                shortest=self._shortest,
-            )
-            if match_result is None:
-                token = input_str[start: start + 1]
-                start += 1
-            else:
-                token = match_result
-                start += len(match_result)
-            tokens.append(token)
-        return tokens
+        offsets = []
+        for word_start, word_end in self._trie.gen_match_offsets(
+                input_str, shortest=self._shortest):
+            offsets.extend((idx, idx + 1) for idx in range(start, word_start))
+            offsets.append((word_start, word_end))
+            start = word_end
+        offsets.extend((idx, idx + 1) for idx in range(start, len(input_str)))
+        return offsets
@@ -1,8 +1,7 @@
-from typing import List
-
-import unicodedata
+from typing import List, Tuple
 
 from ..label_transducer import get_most_common_except_not_entity
+from ..utils.unicode_class import PUNCTUATION, gen_word_offsets
 from .base import Tokenizer, TokenizerAligner
 
 
@@ -37,40 +36,20 @@ class EngTokenizer(Tokenizer):
     """
 
     _label_aligner_class = EngTokenizerAligner
+    _single_char_token_class = PUNCTUATION  # characters which are tokens themselves
 
-    def _tokenize(self, input_str: str) -> List[str]:
-        orig_tokens = whitespace_tokenize(input_str)
-        split_tokens = []
-        for token in orig_tokens:
-            split_tokens.extend(self._run_split_on_punc(token))
-        output_tokens = whitespace_tokenize(" ".join(split_tokens))
-        return output_tokens
+    def _tokenize_with_offsets(self, input_str: str) -> List[Tuple[int, int]]:
+        """Split text by whitespace characters and punctuations in one pass
 
-    def _run_split_on_punc(self, text: str) -> List[str]:
-        """
-        Recognize punctuations and seperate them into independent tokens.
+        Punctuations are tokens themselves. It is equivalent to splitting text by
+        whitespace and then splitting each piece on punctuations as BERT does.
 
         E.g.
-        1. "abc, cdf" -> ["abc", ",", " ", "cdf"]
+        1. "abc, cdf" -> [(0, 3), (3, 4), (5, 8)], i.e. ["abc", ",", "cdf"]
         2. "I like apples." -> ["I", "like", "apples", "."]
 
         """
-        chars = list(text)
-        i = 0
-        start_new_word = True
-        output = []
-        while i < len(chars):
-            char = chars[i]
-            if _is_punctuation(char):
-                output.append([char])
-                start_new_word = True
-            else:
-                if start_new_word:
-                    output.append([])
-                start_new_word = False
-                output[-1].append(char)
-            i += 1
-        return ["".join(x) for x in output]
+        return gen_word_offsets(input_str, self._single_char_token_class)
 
 
 def whitespace_tokenize(text: str) -> List[str]:
@@ -84,26 +63,3 @@ def whitespace_tokenize(text: str) -> List[str]:
     """
     tokens = text.split()
     return tokens
-
-
-def _is_punctuation(char):
-    """Checks whether `chars` is a punctuation character.
-
-    We treat all non-letter/number ASCII as punctuation.
-    Characters such as "^", "$", and "`" are not in the Unicode
-    Punctuation class but we treat them as punctuation anyways, for
-    consistency.
-
-    """
-    cp = ord(char)
-    if (
-        (cp >= 33 and cp <= 47) or (
-            cp >= 58 and cp <= 64) or (
-            cp >= 91 and cp <= 96) or (
-            cp >= 123 and cp <= 126)
-    ):
-        return True
-    cat = unicodedata.category(char)
-    if cat.startswith("P"):
-        return True
-    return False
@@ -0,0 +1,31 @@
+import pytest
+
+from ..base import Tokenizer
+from ..whitespace_tokenizer import WhiteSpaceTokenizerAligner
+
+
+class CommaTokenizer(Tokenizer):
+
+    _label_aligner_class = WhiteSpaceTokenizerAligner
+
+    def _tokenize(self, input_str):
+        return [token for token in input_str.split(',') if token]
+
+
+def test_tokenize_without_offsets():
+    op = CommaTokenizer()
+    assert [(0, 1), (2, 4)] == op._tokenize_with_offsets('a,bc,')
+
+    output_sequence, label_aligner = op.transform('a,bc,')
+    assert ['a', 'bc'] == output_sequence
+    assert [1, 2] == label_aligner.transform([1, 0, 2, 2, 0])
+    assert [1, 0, 2, 2, 0] == label_aligner.inverse_transform([1, 2])
+
+
+def test_tokenize_not_implemented():
+
+    class NotImplementedTokenizer(Tokenizer):
+        _label_aligner_class = WhiteSpaceTokenizerAligner
+
+    with pytest.raises(NotImplementedError):
+        NotImplementedTokenizer().transform('a b')
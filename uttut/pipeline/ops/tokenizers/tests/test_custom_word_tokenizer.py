@@ -1,5 +1,6 @@
 import pytest
 
+from ...base import prebuilt_tries
 from ...tests.common_tests import OperatorTestTemplate, ParamTuple
 from ..custom_word_tokenizer import CustomWordTokenizer
 
@@ -93,3 +94,12 @@ def test_invertible_cases(
 
     realigned_labels = label_aligner.inverse_transform(expected_output_labels)
     assert expected_realigned_labels == realigned_labels
+
+
+def test_prebuilt_trie(op, user_words):
+    trie = op._get_tries()['user_words']
+    with prebuilt_tries({'user_words': trie}):
+        prebuilt_op = CustomWordTokenizer(user_words)
+    assert trie is prebuilt_op._get_tries()['user_words']
+    assert op.transform("一杯珍奶去冰")[0] == prebuilt_op.transform("一杯珍奶去冰")[0]
+    assert CustomWordTokenizer(user_words)._get_tries()['user_words'] is not trie
@@ -1,9 +1,14 @@
-from typing import List
+from typing import List, Tuple
+import re
 
 from ..label_transducer import get_most_common_except_not_entity
 from .base import Tokenizer, TokenizerAligner
 
 
+# `\s` matches the same characters as `str.isspace`, i.e. those `str.split` splits on
+_NON_WHITESPACE_PATTERN = re.compile(r'\S+')
+
+
 class WhiteSpaceTokenizerAligner(TokenizerAligner):
 
     def _forward_transduce_func(self, labels: List[int], output_size: int) -> List[int]:
@@ -36,13 +41,13 @@ class WhiteSpaceTokenizer(Tokenizer):
 
     _label_aligner_class = WhiteSpaceTokenizerAligner
 
-    def _tokenize(self, input_str: str) -> List[str]:
-        """Split text into list by whitespace characters
+    def _tokenize_with_offsets(self, input_str: str) -> List[Tuple[int, int]]:
+        """Split text by whitespace characters into offsets of tokens
 
         E.g.
-        1. "a  \t\t\n\n b" -> ["a", "b"]
+        1. "a  \t\t\n\n b" -> [(0, 1), (8, 9)], i.e. ["a", "b"]
         2. "  \n\t\n  " -> []
-        3. "  a b \t\n" -> ["a", "b"]
+        3. "  a b \t\n" -> [(2, 3), (4, 5)], i.e. ["a", "b"]
 
         """
-        return input_str.split()
+        return [match.span() for match in _NON_WHITESPACE_PATTERN.finditer(input_str)]
@@ -1,5 +1,4 @@
-from typing import List
-
+from ..utils.unicode_class import CJK, PUNCTUATION, is_cjk
 from .eng_tokenizer import EngTokenizer
 
 
@@ -24,28 +23,9 @@ class ZhCharTokenizer(EngTokenizer):
 
     """
 
-    def _tokenize(self, input_str: str) -> List[str]:
-        text = self._tokenize_chinese_chars(input_str)
-        return super()._tokenize(text)
-
-    def _tokenize_chinese_chars(self, text):
-        """Recognize CJK character and add whitespace around it
-
-        E.g.
-        1. "我喜歡吃蘋果" -> " 我  喜  歡  吃  蘋  果 "
-        2. "我喜歡吃apples." -> " 我  喜  歡  吃 apples."
-
-        """
-        output = []
-        for char in text:
-            code_position = ord(char)
-            if self._is_chinese_char(code_position):
-                output.append(" ")
-                output.append(char)
-                output.append(" ")
-            else:
-                output.append(char)
-        return "".join(output)
+    # punctuations and CJK characters are tokens themselves, e.g.
+    # "我喜歡吃apples." -> ["我", "喜", "歡", "吃", "apples", "."]
+    _single_char_token_class = PUNCTUATION | CJK
 
     def _is_chinese_char(self, code_position):
         """Checks whether CP is the codepoint of a CJK character.
@@ -60,13 +40,4 @@ class ZhCharTokenizer(EngTokenizer):
         like the all of the other languages.
 
         """
-        if ((code_position >= 0x4E00 and code_position <= 0x9FFF) or (
-                code_position >= 0x3400 and code_position <= 0x4DBF) or (
-                code_position >= 0x20000 and code_position <= 0x2A6DF) or (
-                code_position >= 0x2A700 and code_position <= 0x2B73F) or (
-                code_position >= 0x2B740 and code_position <= 0x2B81F) or (
-                code_position >= 0x2B820 and code_position <= 0x2CEAF) or(
-                code_position >= 0xF900 and code_position <= 0xFAFF) or (
-                code_position >= 0x2F800 and code_position <= 0x2FA1F)):  #
-            return True
-        return False
+        return is_cjk(code_position)
@@ -0,0 +1,184 @@
+"""Hashed character n-grams of tokens
+
+The n-grams are taken from a token wrapped by `BOW` and `EOW`, as fastText does,
+and hashed by `consistent_hash`. All n-grams of all tokens are located on their
+UTF-8 bytes and hashed in one loop without the GIL, no n-gram string is created.
+"""
+from cpython.unicode cimport PyUnicode_GET_LENGTH  # noqa: E999
+from libc.stdlib cimport malloc, free
+from libc.string cimport memcpy
+
+from .consistent_hash cimport hash_keys
+
+
+cdef extern from "Python.h":
+    const char* PyUnicode_AsUTF8AndSize(object unicode, Py_ssize_t *size) except NULL
+
+
+BOW = '<'
+EOW = '>'
+
+
+def gen_char_ngrams(str token, unsigned int min_n, unsigned int max_n) -> list:
+    """Character n-grams of a token, in the order of `hash_char_ngrams`
+
+    If the wrapped token is shorter than min_n, the wrapped token itself is
+    the only n-gram.
+
+    E.g.
+    >>> gen_char_ngrams("where", 3, 4)
+    ['<wh', '<whe', 'whe', 'wher', 'her', 'here', 'ere', 'ere>', 're>']
+
+    """
+    cdef str word = BOW + token + EOW
+    cdef Py_ssize_t num_chars = len(word)
+    cdef Py_ssize_t start, n
+    cdef list ngrams = []
+    for start in range(num_chars):
+        for n in range(min_n, max_n + 1):
+            if start + n > num_chars:
+                break
+            ngrams.append(word[start: start + n])
+    if not ngrams:
+        ngrams.append(word)
+    return ngrams
+
+
+cdef inline Py_ssize_t _count_ngrams(
+        Py_ssize_t num_chars,
+        Py_ssize_t min_n,
+        Py_ssize_t max_n,
+    ) nogil:
+    cdef Py_ssize_t n
+    cdef Py_ssize_t count = 0
+    for n in range(min_n, max_n + 1):
+        if n > num_chars:
+            break
+        count += num_chars - n + 1
+    return count if count > 0 else 1
+
+
+def hash_char_ngrams(
+        list tokens,
+        unsigned int min_n,
+        unsigned int max_n,
+        unsigned int num_buckets,
+    ) -> list:
+    """Bucket ids of character n-grams of each token
+
+    The bucket id of an n-gram is `consistent_hash(ngram, num_buckets)`,
+    see `gen_char_ngrams` for the n-grams of a token.
+
+    E.g.
+    >>> hash_char_ngrams(["I", "like"], 3, 4, 100)
+    [[consistent_hash("<I>", 100)], [consistent_hash("<li", 100), ...]]
+
+    Raise:
+        ValueError if min_n is 0, max_n < min_n or num_buckets is 0.
+
+    Return:
+        bucket ids (list of lists of int): one list per token
+
+    """
+    cdef tuple token_tuple = tuple(tokens)  # keep the tokens alive without the GIL
+    cdef Py_ssize_t num_tokens = len(token_tuple)
+    cdef Py_ssize_t idx, start, n, num_chars, pos
+    cdef Py_ssize_t min_len = min_n
+    cdef Py_ssize_t max_len = max_n
+    cdef Py_ssize_t num_ngrams = 0
+    cdef Py_ssize_t num_bytes = 0
+    cdef Py_ssize_t max_num_chars = 0
+    cdef Py_ssize_t offset, end
+    cdef const char **token_keys = NULL  # noqa: E225
+    cdef Py_ssize_t *token_sizes = NULL  # noqa: E225
+    cdef char *buffer = NULL  # noqa: E225
+    cdef Py_ssize_t *bounds = NULL  # noqa: E225
+    cdef const char **keys = NULL  # noqa: E225
+    cdef Py_ssize_t *sizes = NULL  # noqa: E225
+    cdef unsigned int *outs = NULL  # noqa: E225
+    cdef Py_ssize_t *counts = NULL  # noqa: E225
+    cdef list bucket_ids, token_bucket_ids
+
+    if min_n == 0 or max_n < min_n:
+        raise ValueError(f"Invalid n-gram range: ({min_n}, {max_n})")
+    if num_buckets == 0:
+        raise ValueError('num_buckets should be positive')
+    if num_tokens == 0:
+        return []
+
+    try:
+        token_keys = <const char **> malloc(num_tokens * sizeof(char *))  # noqa: E225, E226
+        token_sizes = <Py_ssize_t *> malloc(num_tokens * sizeof(Py_ssize_t))  # noqa: E225, E226
+        counts = <Py_ssize_t *> malloc(num_tokens * sizeof(Py_ssize_t))  # noqa: E225, E226
+        if token_keys == NULL or token_sizes == NULL or counts == NULL:
+            raise MemoryError()
+
+        for idx in range(num_tokens):
+            token_keys[idx] = PyUnicode_AsUTF8AndSize(token_tuple[idx], &token_sizes[idx])  # noqa: E225
+            num_chars = PyUnicode_GET_LENGTH(token_tuple[idx]) + 2
+            counts[idx] = _count_ngrams(num_chars, min_len, max_len)
+            num_ngrams += counts[idx]
+            num_bytes += token_sizes[idx] + 2
+            if num_chars > max_num_chars:
+                max_num_chars = num_chars
+
+        buffer = <char *> malloc(num_bytes)  # noqa: E225
+        bounds = <Py_ssize_t *> malloc((max_num_chars + 1) * sizeof(Py_ssize_t))  # noqa: E225, E226
+        keys = <const char **> malloc(num_ngrams * sizeof(char *))  # noqa: E225, E226
+        sizes = <Py_ssize_t *> malloc(num_ngrams * sizeof(Py_ssize_t))  # noqa: E225, E226
+        outs = <unsigned int *> malloc(num_ngrams * sizeof(unsigned int))  # noqa: E225, E226
+        if buffer == NULL or bounds == NULL or keys == NULL or sizes == NULL or outs == NULL:
+            raise MemoryError()
+
+        with nogil:
+            offset = 0
+            num_ngrams = 0
+            for idx in range(num_tokens):
+                # wrap the UTF-8 bytes of the token
+                buffer[offset] = b'<'
+                memcpy(buffer + offset + 1, token_keys[idx], token_sizes[idx])  # noqa: E226
+                end = offset + token_sizes[idx] + 2
+                buffer[end - 1] = b'>'
+
+                # byte offsets of characters, continuation bytes are 10xxxxxx
+                num_chars = 0
+                for pos in range(offset, end):
+                    if (<unsigned char> buffer[pos]) & 0xC0 != 0x80:
+                        bounds[num_chars] = pos
+                        num_chars += 1
+                bounds[num_chars] = end
+
+                if num_chars < min_len:
+                    keys[num_ngrams] = buffer + offset  # noqa: E226
+                    sizes[num_ngrams] = end - offset
+                    num_ngrams += 1
+                else:
+                    for start in range(num_chars):
+                        for n in range(min_len, max_len + 1):
+                            if start + n > num_chars:
+                                break
+                            keys[num_ngrams] = buffer + bounds[start]  # noqa: E226
+                            sizes[num_ngrams] = bounds[start + n] - bounds[start]
+                            num_ngrams += 1
+                offset = end
+
+            hash_keys(keys, sizes, num_ngrams, num_buckets, outs)
+
+        bucket_ids = []
+        pos = 0
+        for idx in range(num_tokens):
+            token_bucket_ids = [None] * counts[idx]
+            for n in range(counts[idx]):
+                token_bucket_ids[n] = outs[pos]
+                pos += 1
+            bucket_ids.append(token_bucket_ids)
+        return bucket_ids
+    finally:
+        free(token_keys)
+        free(token_sizes)
+        free(counts)
+        free(buffer)
+        free(bounds)
+        free(keys)
+        free(sizes)
+        free(outs)
@@ -4,7 +4,7 @@ cdef extern from "MurmurHash3.h":  # noqa: E999
         int len,
         unsigned int seed,
         void *out,  # noqa: E225
-    )
+    ) nogil
 
 
 cdef unsigned int consistent_hash_in_c(  # noqa: E999
@@ -12,3 +12,12 @@ cdef unsigned int consistent_hash_in_c(  # noqa: E999
         unsigned int mod_int,
         unsigned int seed,
     )
+
+
+cdef void hash_keys(
+        const char **keys,  # noqa: E225
+        const Py_ssize_t *sizes,  # noqa: E225
+        Py_ssize_t num_keys,
+        unsigned int mod_int,
+        unsigned int *outs,  # noqa: E225
+    ) nogil
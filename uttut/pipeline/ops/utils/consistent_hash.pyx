@@ -1,4 +1,8 @@
 # distutils: sources = uttut/pipeline/ops/utils/MurmurHash3.cpp
+cimport cython  # noqa: E999
+from cpython cimport array
+from libc.stdlib cimport malloc, free
+import array as py_array
 
 
 cdef extern from "MurmurHash3.h":  # noqa: E999
@@ -7,7 +11,15 @@ cdef extern from "MurmurHash3.h":  # noqa: E999
         int len,
         unsigned int seed,
         void *out,  # noqa: E225
-    )
+    ) nogil
+
+
+cdef extern from "Python.h":
+    # the UTF-8 representation is cached in the str object
+    const char* PyUnicode_AsUTF8AndSize(object unicode, Py_ssize_t *size) except NULL
+
+
+cdef array.array _UINT_ARRAY = py_array.array('I')
 
 
 def consistent_hash(input_str: str, mod_int: int):
@@ -18,16 +30,79 @@ def consistent_hash(input_str: str, mod_int: int):
     )
 
 
+def consistent_hash_batch(input_strs, unsigned int mod_int) -> array.array:
+    """Hash strings in one call, the same as `consistent_hash` for each string
+
+    The strings are hashed without holding the GIL.
+
+    E.g.
+    >>> consistent_hash_batch(["隼興", "希臘優格"], 100)
+    array('I', [15, 51])
+
+    Args:
+        input_strs (sequence of str)
+        mod_int (int): number of buckets
+
+    Return:
+        hashes (array.array of unsigned int)
+
+    """
+    cdef tuple strs = tuple(input_strs)  # keep the strings alive without the GIL
+    cdef Py_ssize_t num_strs = len(strs)
+    cdef Py_ssize_t idx
+    cdef array.array hashes = array.clone(_UINT_ARRAY, num_strs, False)
+    cdef unsigned int *outs = hashes.data.as_uints  # noqa: E225
+    cdef const char **keys  # noqa: E225
+    cdef Py_ssize_t *sizes  # noqa: E225
+
+    if mod_int == 0:
+        raise ZeroDivisionError('integer division or modulo by zero')
+    if num_strs == 0:
+        return hashes
+
+    keys = <const char **> malloc(num_strs * sizeof(char *))  # noqa: E225, E226
+    sizes = <Py_ssize_t *> malloc(num_strs * sizeof(Py_ssize_t))  # noqa: E225, E226
+    if keys == NULL or sizes == NULL:
+        free(keys)
+        free(sizes)
+        raise MemoryError()
+    try:
+        for idx in range(num_strs):
+            keys[idx] = PyUnicode_AsUTF8AndSize(strs[idx], &sizes[idx])  # noqa: E225
+        with nogil:
+            hash_keys(keys, sizes, num_strs, mod_int, outs)
+    finally:
+        free(keys)
+        free(sizes)
+    return hashes
+
+
+@cython.cdivision(True)
+cdef void hash_keys(
+        const char **keys,  # noqa: E225
+        const Py_ssize_t *sizes,  # noqa: E225
+        Py_ssize_t num_keys,
+        unsigned int mod_int,
+        unsigned int *outs,  # noqa: E225
+    ) nogil:
+    """Same as consistent_hash_in_c for each UTF-8 key, mod_int should not be 0"""
+    cdef Py_ssize_t idx
+    for idx in range(num_keys):
+        MurmurHash3_x86_32(<void *> keys[idx], <int> sizes[idx], 0, &outs[idx])  # noqa: E225
+        outs[idx] = outs[idx] % mod_int
+
+
 cdef unsigned int consistent_hash_in_c(  # noqa: E999
         str input_str,
         unsigned int mod_int,
         unsigned int seed,
     ):
     cdef unsigned int out
-    cdef bytes byte_str = input_str.encode('utf-8')
+    cdef Py_ssize_t size
+    cdef const char *key = PyUnicode_AsUTF8AndSize(input_str, &size)  # noqa: E225
     MurmurHash3_x86_32(
-        <char*> byte_str,  # noqa: E225, E226
-        len(byte_str),
+        <void *> key,  # noqa: E225
+        <int> size,
         seed,
         &out,  # noqa: E225
     )
@@ -0,0 +1,24 @@
+cdef class DoubleArrayTrie:  # noqa: E999
+
+    cdef tuple _arrays
+    cdef const unsigned int[::1] _code_points
+    cdef const unsigned int[::1] _codes
+    cdef const int[::1] _base
+    cdef const int[::1] _check
+    cdef Py_ssize_t _size
+    cdef Py_ssize_t _num_words
+    cdef list _pending_words
+    cdef set _pending_word_set
+
+    cdef void _ensure_built(self) except *
+    cdef void _set_arrays(self, tuple arrays, Py_ssize_t num_words)
+    cdef list _enumerate_words(self)
+    cdef unsigned int _get_code(self, Py_UCS4 char)
+    cdef Py_ssize_t _match_end(
+        self,
+        str text,
+        Py_ssize_t start,
+        Py_ssize_t stop,
+        bint shortest,
+    ) except -2
+    cdef bint _contains(self, str word)
@@ -0,0 +1,478 @@
+"""Compact trie of words stored in a double array
+
+A node s has a child t for character code c if check[t] == s, where
+t = base[s] + c. Code 0 is the end of a word, i.e. s is a word if
+check[base[s]] == s. Characters are mapped to codes by frequency, so that
+the children of a node are close to each other and the arrays stay compact.
+
+The arrays are flat, so a trie can be saved to a file and loaded by mmap
+without parsing. Layout (little-endian):
+
+    offset  size  content
+    0       8     MAGIC
+    8       2     format version (uint16)
+    10      2     reserved
+    12      4     number of words (uint32)
+    16      4     size of alphabet A (uint32)
+    20      4     size of double array N (uint32)
+    24      4A    code points of alphabet, sorted (uint32)
+    ...     4A    codes of the code points (uint32)
+    ...     4N    base (int32)
+    ...     4N    check (int32)
+"""
+from typing import List, Tuple
+from collections import Counter
+import mmap
+import struct
+import sys
+
+cimport cython  # noqa: E999
+from cpython cimport array
+import array as py_array
+
+
+MAGIC = b'UTTUTDAT'
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct('<8sHHIII')
+
+cdef int _FREE = -1
+cdef int _ROOT_CHECK = -2
+cdef int _SEARCH_WINDOW = 1 << 12  # free cells farther behind the end are not searched
+cdef array.array _INT_ARRAY = py_array.array('i')
+cdef array.array _CHAR_ARRAY = py_array.array('b')
+
+
+cdef class DoubleArrayTrie:
+
+    """Trie of words backed by a double array
+
+    It has the same interface as `Trie`. Inserted words are buffered and the
+    arrays are (re)built in bulk on the next search, so it is cheap to insert
+    many words at once but not to interleave inserts and searches.
+
+    E.g.
+    >>> trie = DoubleArrayTrie(['珍奶', '珍奶去冰'])
+    >>> trie.match_prefix('珍奶去冰謝謝')
+    '珍奶去冰'
+    >>> trie.save('words.trie')
+    >>> DoubleArrayTrie.load('words.trie').exactly_search('珍奶')
+    True
+
+    """
+
+    def __init__(self, words=()):
+        self._pending_words = []
+        self._pending_word_set = set()
+        self._set_arrays(_build([]), 0)
+        for word in words:
+            self.insert(word)
+
+    def __contains__(self, key):
+        return self.exactly_search(key)
+
+    def __len__(self):
+        self._ensure_built()
+        return self._num_words
+
+    def __iter__(self):
+        self._ensure_built()
+        return iter(sorted(self._enumerate_words()))
+
+    def __reduce__(self):
+        return (_from_bytes, (self.to_bytes(),))
+
+    def exactly_search(self, str word):
+        self._ensure_built()
+        return self._contains(word)
+
+    def insert(self, str word):
+        if not word:
+            return  # the empty word is never matched
+        if word in self._pending_word_set or self._contains(word):
+            raise AttributeError('Word can only be set once')
+        self._pending_words.append(word)
+        self._pending_word_set.add(word)
+
+    def match_prefix(self, str word, bint shortest=False, Py_ssize_t start=0):
+        """Return the longest (or shortest) inserted word which is a prefix of word[start:]"""
+        cdef Py_ssize_t end
+        self._ensure_built()
+        if start < 0:
+            raise ValueError('start should be non-negative.')
+        end = self._match_end(word, start, len(word), shortest)
+        if end == -1:
+            return None
+        return word[start: end]
+
+    def gen_match_offsets(self, str text, bint shortest=False) -> List[Tuple[int, int]]:
+        """Find inserted words in text greedily from left to right
+
+        Same as `Trie.gen_match_offsets`.
+
+        """
+        cdef Py_ssize_t start = 0
+        cdef Py_ssize_t end
+        cdef Py_ssize_t text_length = len(text)
+        cdef list offsets = []
+        self._ensure_built()
+        while start < text_length:
+            end = self._match_end(text, start, text_length, shortest)
+            if end == -1:
+                start += 1
+            else:
+                offsets.append((start, end))
+                start = end
+        return offsets
+
+    def to_bytes(self) -> bytes:
+        self._ensure_built()
+        chunks = [
+            _HEADER.pack(
+                MAGIC,
+                FORMAT_VERSION,
+                0,
+                self._num_words,
+                len(self._code_points),
+                self._size,
+            ),
+        ]
+        for values, typecode in zip(self._arrays, 'IIii'):
+            if sys.byteorder == 'big':
+                values = py_array.array(typecode, values)
+                values.byteswap()
+            chunks.append(memoryview(values).tobytes())
+        return b''.join(chunks)
+
+    @classmethod
+    def from_buffer(cls, buffer):
+        """Load a trie from the output of `to_bytes` without copying
+
+        Arg:
+            buffer: bytes-like object, e.g. bytes or mmap. It is referenced
+                by the trie, so it should not be modified.
+
+        Raise:
+            ValueError: If buffer is not a valid trie.
+
+        """
+        view = memoryview(buffer)
+        if len(view) < _HEADER.size:
+            raise ValueError('Double-array trie is truncated.')
+        magic, version, _, num_words, alphabet_size, size = _HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise ValueError('Not a double-array trie.')
+        if version > FORMAT_VERSION:
+            raise ValueError(
+                f"Double-array trie version {version} is not supported, "
+                f"the latest version is {FORMAT_VERSION}.",
+            )
+        if len(view) != _HEADER.size + 8 * (alphabet_size + size):
+            raise ValueError('Double-array trie is truncated.')
+
+        arrays = []
+        offset = _HEADER.size
+        for length, typecode in zip([alphabet_size, alphabet_size, size, size], 'IIii'):
+            values = view[offset: offset + 4 * length].cast(typecode)
+            if sys.byteorder == 'big':
+                values = py_array.array(typecode, values.tobytes())
+                values.byteswap()
+            arrays.append(values)
+            offset += 4 * length
+
+        cdef DoubleArrayTrie trie = cls.__new__(cls)
+        trie._pending_words = []
+        trie._pending_word_set = set()
+        trie._set_arrays(tuple(arrays), num_words)
+        return trie
+
+    def save(self, path: str):
+        with open(path, 'wb') as fp:
+            fp.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str):
+        """Load a trie from a file by mmap, the arrays are paged in on demand"""
+        with open(path, 'rb') as fp:
+            buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls.from_buffer(buffer)
+
+    cdef void _ensure_built(self) except *:
+        if not self._pending_words:
+            return
+        words = self._enumerate_words()
+        words.extend(self._pending_words)
+        self._set_arrays(_build(words), len(words))
+        self._pending_words = []
+        self._pending_word_set = set()
+
+    cdef void _set_arrays(self, tuple arrays, Py_ssize_t num_words):
+        self._arrays = arrays
+        self._code_points, self._codes, self._base, self._check = arrays
+        self._size = len(self._base)
+        self._num_words = num_words
+
+    cdef list _enumerate_words(self):
+        cdef Py_ssize_t node, parent
+        cdef list words = []
+        code2char = {}
+        for idx in range(len(self._codes)):
+            code2char[self._codes[idx]] = chr(self._code_points[idx])
+
+        children = {}
+        for node in range(1, self._size):
+            parent = self._check[node]
+            if parent >= 0:
+                children.setdefault(parent, []).append(node)
+
+        stack = [(0, '')]
+        while stack:
+            parent, prefix = stack.pop()
+            for node in children.get(parent, []):
+                code = node - self._base[parent]
+                if code == 0:
+                    words.append(prefix)
+                else:
+                    stack.append((node, prefix + code2char[code]))
+        return words
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef unsigned int _get_code(self, Py_UCS4 char):
+        """Code of char, 0 if it is not in the alphabet"""
+        cdef unsigned int code_point = <unsigned int> char
+        cdef Py_ssize_t low = 0
+        cdef Py_ssize_t high = self._code_points.shape[0] - 1
+        cdef Py_ssize_t mid
+        while low <= high:
+            mid = (low + high) >> 1
+            if self._code_points[mid] < code_point:
+                low = mid + 1
+            elif self._code_points[mid] > code_point:
+                high = mid - 1
+            else:
+                return self._codes[mid]
+        return 0
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef Py_ssize_t _match_end(
+            self,
+            str text,
+            Py_ssize_t start,
+            Py_ssize_t stop,
+            bint shortest,
+        ) except -2:
+        """End of the matched word starting at text[start], -1 if not found"""
+        cdef Py_ssize_t node = 0
+        cdef Py_ssize_t end = -1
+        cdef Py_ssize_t idx, child
+        cdef unsigned int code
+        cdef Py_UCS4 char
+        for idx in range(start, stop):
+            char = text[idx]
+            code = self._get_code(char)
+            if code == 0:
+                break
+            child = self._base[node] + <Py_ssize_t> code
+            if child >= self._size or self._check[child] != node:
+                break
+            node = child
+            child = self._base[node]
+            if child < self._size and self._check[child] == node:
+                end = idx + 1
+                if shortest:
+                    break
+        return end
+
+    cdef bint _contains(self, str word):
+        cdef Py_ssize_t word_length = len(word)
+        return word_length > 0 and \
+            self._match_end(word, 0, word_length, False) == word_length
+
+
+def _from_bytes(data: bytes):
+    return DoubleArrayTrie.from_buffer(data)
+
+
+def _build(list words) -> tuple:
+    """Build the arrays of unique non-empty words
+
+    The algorithm follows Darts (Double-ARray Trie System), the nodes are
+    placed depth first at the first position where all of their children fit.
+
+    """
+    char_counts = Counter()
+    for word in words:
+        char_counts.update(word)
+    alphabet = sorted(char_counts, key=lambda character: (-char_counts[character], character))
+    # code 0 is reserved for the end of words
+    code_point2code = {ord(character): code for code, character in enumerate(alphabet, 1)}
+    if len(code_point2code) >= 0x110000:
+        raise ValueError('Too many distinct characters.')
+
+    builder = _DoubleArrayBuilder(sorted(word.translate(code_point2code) for word in words))
+    base, check = builder.build()
+    code_points = sorted(code_point2code)
+    return (
+        py_array.array('I', code_points),
+        py_array.array('I', [code_point2code[code_point] for code_point in code_points]),
+        base,
+        check,
+    )
+
+
+cdef class _DoubleArrayBuilder:
+
+    """Place nodes into a double array
+
+    The free cells are linked in a list, so that searching for a position
+    only visits free cells. Free cells far behind the end of the array are
+    dropped from the list (they can still hold children of other nodes), so
+    that the search does not get slower as the array grows.
+
+    """
+
+    cdef list _keys
+    cdef array.array _base
+    cdef array.array _check
+    cdef array.array _used
+    cdef array.array _next_free
+    cdef array.array _prev_free
+    cdef int _free_head
+    cdef int _free_tail
+    cdef Py_ssize_t _max_index
+
+    def __init__(self, list keys):
+        """keys: sorted unique non-empty words whose characters are codes"""
+        self._keys = keys
+        self._base = array.clone(_INT_ARRAY, 0, False)
+        self._check = array.clone(_INT_ARRAY, 0, False)
+        self._used = array.clone(_CHAR_ARRAY, 0, False)
+        self._next_free = array.clone(_INT_ARRAY, 0, False)
+        self._prev_free = array.clone(_INT_ARRAY, 0, False)
+        self._free_head = -1
+        self._free_tail = -1
+        self._max_index = 0
+
+    def build(self):
+        cdef Py_ssize_t node, begin, depth, left, right
+        self._ensure_size(1024)
+        self._check.data.as_ints[0] = _ROOT_CHECK
+        self._unlink_free(0)
+
+        stack = []
+        if self._keys:
+            stack.append((0, 0, 0, len(self._keys)))
+        while stack:
+            node, depth, left, right = stack.pop()
+            children = self._fetch(depth, left, right)
+            begin = self._find_begin(children)
+            self._base.data.as_ints[node] = begin
+            for code, left, right in children:
+                self._check.data.as_ints[begin + code] = node
+                self._unlink_free(begin + code)
+                self._max_index = max(self._max_index, begin + code)
+            for code, left, right in reversed(children):
+                if code != 0:
+                    stack.append((begin + code, depth + 1, left, right))
+
+        array.resize(self._base, self._max_index + 1)
+        array.resize(self._check, self._max_index + 1)
+        return self._base, self._check
+
+    cdef list _fetch(self, Py_ssize_t depth, Py_ssize_t left, Py_ssize_t right):
+        """(code, left, right) of children of the node of keys[left: right]"""
+        cdef Py_ssize_t idx
+        cdef Py_ssize_t prev_code = -1
+        cdef Py_ssize_t code
+        cdef Py_UCS4 char
+        cdef str key
+        cdef list children = []
+        for idx in range(left, right):
+            key = self._keys[idx]
+            # keys are sorted, so the end of word comes first
+            if len(key) > depth:
+                char = key[depth]
+                code = <Py_ssize_t> char
+            else:
+                code = 0
+            if code != prev_code:
+                if children:
+                    children[-1][2] = idx
+                children.append([code, idx, right])
+                prev_code = code
+        return children
+
+    cdef Py_ssize_t _find_begin(self, list children) except -1:
+        cdef Py_ssize_t first_code = children[0][0]
+        cdef Py_ssize_t last_code = children[-1][0]
+        cdef array.array codes = array.array('i', [child[0] for child in children])
+        cdef Py_ssize_t num_codes = len(codes)
+        cdef Py_ssize_t idx, begin
+        cdef int pos = self._free_head
+        cdef int next_pos
+        cdef bint fits
+
+        while True:
+            if pos == -1:
+                # no free cell fits, append cells to the end
+                pos = len(self._base)
+                self._ensure_size(pos + first_code + 1)
+            next_pos = self._next_free.data.as_ints[pos]
+            if pos + _SEARCH_WINDOW < self._max_index:
+                self._unlink_free(pos)
+                pos = next_pos
+                continue
+
+            begin = pos - first_code
+            if begin < 1 or self._used.data.as_schars[begin]:
+                pos = next_pos
+                continue
+            self._ensure_size(begin + last_code + 1)
+            fits = True
+            for idx in range(num_codes):
+                if self._check.data.as_ints[begin + codes.data.as_ints[idx]] != _FREE:
+                    fits = False
+                    break
+            if fits:
+                break
+            pos = next_pos
+
+        self._used.data.as_schars[begin] = 1
+        return begin
+
+    cdef void _unlink_free(self, int pos):
+        cdef int prev_pos = self._prev_free.data.as_ints[pos]
+        cdef int next_pos = self._next_free.data.as_ints[pos]
+        if prev_pos == -1:
+            self._free_head = next_pos
+        else:
+            self._next_free.data.as_ints[prev_pos] = next_pos
+        if next_pos == -1:
+            self._free_tail = prev_pos
+        else:
+            self._prev_free.data.as_ints[next_pos] = prev_pos
+
+    cdef void _ensure_size(self, Py_ssize_t size) except *:
+        cdef Py_ssize_t old_size = len(self._base)
+        cdef Py_ssize_t idx
+        if size <= old_size:
+            return
+        size = max(size, 2 * old_size)
+        if size > 0x7FFFFFFF:
+            raise ValueError('Too many words.')
+        for values in (self._base, self._check, self._next_free, self._prev_free, self._used):
+            array.resize(values, size)
+        for idx in range(old_size, size):
+            self._base.data.as_ints[idx] = 0
+            self._check.data.as_ints[idx] = _FREE
+            self._used.data.as_schars[idx] = 0
+            # append to the list of free cells
+            self._prev_free.data.as_ints[idx] = self._free_tail
+            self._next_free.data.as_ints[idx] = -1
+            if self._free_tail == -1:
+                self._free_head = idx
+            else:
+                self._next_free.data.as_ints[self._free_tail] = idx
+            self._free_tail = idx
@@ -0,0 +1,42 @@
+import pytest
+
+from ..char_ngram import gen_char_ngrams, hash_char_ngrams
+from ..consistent_hash import consistent_hash
+
+
+@pytest.mark.parametrize(
+    "token,min_n,max_n,expected_ngrams",
+    [
+        pytest.param("where", 3, 4,
+                     ['<wh', '<whe', 'whe', 'wher', 'her', 'here', 'ere', 'ere>', 're>'],
+                     id='en'),
+        pytest.param("隼興", 2, 2, ['<隼', '隼興', '興>'], id='zh'),
+        pytest.param("a", 4, 6, ['<a>'], id='shorter than min_n'),
+        pytest.param("", 1, 1, ['<', '>'], id='empty'),
+    ],
+)
+def test_gen_char_ngrams(token, min_n, max_n, expected_ngrams):
+    assert expected_ngrams == gen_char_ngrams(token, min_n, max_n)
+
+
+def test_hash_char_ngrams():
+    tokens = ["where", "隼興", "a", "", "\U0001F600é"]
+    expected = [
+        [consistent_hash(ngram, 97) for ngram in gen_char_ngrams(token, 1, 4)]
+        for token in tokens
+    ]
+    assert expected == hash_char_ngrams(tokens, 1, 4, 97)
+    assert [] == hash_char_ngrams([], 1, 4, 97)
+
+
+@pytest.mark.parametrize(
+    "min_n,max_n,num_buckets",
+    [
+        pytest.param(0, 3, 97, id='min_n is 0'),
+        pytest.param(4, 3, 97, id='max_n < min_n'),
+        pytest.param(3, 6, 0, id='no buckets'),
+    ],
+)
+def test_hash_char_ngrams_invalid(min_n, max_n, num_buckets):
+    with pytest.raises(ValueError):
+        hash_char_ngrams(["a"], min_n, max_n, num_buckets)
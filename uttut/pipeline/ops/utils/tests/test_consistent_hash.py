@@ -1,4 +1,6 @@
-from ..consistent_hash import consistent_hash
+import pytest
+
+from ..consistent_hash import consistent_hash, consistent_hash_batch
 
 
 def test_consistent_hash():
@@ -8,3 +10,18 @@ def test_consistent_hash():
     assert output == 51
     output = consistent_hash("隼興", 100)
     assert output == 15
+
+
+def test_consistent_hash_batch():
+    input_strs = ["隼興", "希臘優格", "", "abc", "隼興", "\U0001F600"]
+    output = consistent_hash_batch(input_strs, 100)
+    assert [consistent_hash(input_str, 100) for input_str in input_strs] == list(output)
+    assert [15, 51] == list(consistent_hash_batch(iter(["隼興", "希臘優格"]), 100))
+    assert [] == list(consistent_hash_batch([], 100))
+
+
+def test_consistent_hash_batch_invalid():
+    with pytest.raises(ZeroDivisionError):
+        consistent_hash_batch(["a"], 0)
+    with pytest.raises(UnicodeEncodeError):
+        consistent_hash_batch(["\ud800"], 100)
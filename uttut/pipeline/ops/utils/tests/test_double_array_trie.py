@@ -0,0 +1,121 @@
+import pickle
+import random
+
+import pytest
+
+from ..double_array_trie import DoubleArrayTrie
+from ..trie import Trie
+
+
+def test_exist():
+    word = 'abc'
+    trie = DoubleArrayTrie()
+    trie.insert(word)
+    assert word in trie
+    assert 'ab' not in trie
+    assert 'zxy' not in trie
+    assert '' not in trie
+
+
+def test_match_prefix():
+    trie = DoubleArrayTrie(['珍奶', '珍奶去冰'])
+
+    assert '珍奶去冰' == trie.match_prefix('珍奶去冰')
+    assert '珍奶' == trie.match_prefix('珍奶去冰', shortest=True)
+    assert '珍奶去冰' == trie.match_prefix('珍奶去冰謝謝')
+    assert trie.match_prefix('我想要珍奶去冰') is None
+    assert '珍奶去冰' == trie.match_prefix('我想要珍奶去冰', start=3)
+    assert trie.match_prefix('我想要珍奶去冰', start=7) is None
+
+
+def test_gen_match_offsets():
+    trie = DoubleArrayTrie(['珍奶', '珍奶去冰', '去冰', '奶去'])
+
+    assert [(2, 6)] == trie.gen_match_offsets('一杯珍奶去冰')
+    assert [(2, 4), (4, 6)] == trie.gen_match_offsets('一杯珍奶去冰', shortest=True)
+    assert [] == trie.gen_match_offsets('')
+
+
+def test_insert_duplicated_word():
+    trie = DoubleArrayTrie(['珍奶'])
+    with pytest.raises(AttributeError):
+        trie.insert('珍奶')
+    assert '珍奶' in trie
+    with pytest.raises(AttributeError):
+        trie.insert('珍奶')
+
+
+def test_insert_after_search():
+    trie = DoubleArrayTrie(['珍奶'])
+    assert 1 == len(trie)
+    trie.insert('珍奶去冰')
+    trie.insert('b')
+    assert ['b', '珍奶', '珍奶去冰'] == list(trie)
+    assert '珍奶去冰' == trie.match_prefix('珍奶去冰')
+
+
+def test_empty():
+    trie = DoubleArrayTrie()
+    assert 0 == len(trie)
+    assert [] == list(trie)
+    assert trie.match_prefix('abc') is None
+    assert [] == trie.gen_match_offsets('abc')
+
+
+@pytest.fixture
+def words():
+    rng = random.Random(0)
+    chars = 'ab珍奶去冰😀'
+    return sorted({
+        ''.join(rng.choice(chars) for _ in range(rng.randint(1, 6)))
+        for _ in range(200)
+    })
+
+
+def test_same_as_trie(words):
+    rng = random.Random(1)
+    trie = Trie()
+    for word in words:
+        trie.insert(word)
+    double_array_trie = DoubleArrayTrie(words)
+
+    assert words == list(double_array_trie)
+    for _ in range(200):
+        text = ''.join(rng.choice('ab珍奶去冰😀z') for _ in range(rng.randint(0, 10)))
+        assert (text in trie) == (text in double_array_trie)
+        for shortest in [False, True]:
+            assert trie.match_prefix(text, shortest=shortest) == \
+                double_array_trie.match_prefix(text, shortest=shortest)
+            assert trie.gen_match_offsets(text, shortest=shortest) == \
+                double_array_trie.gen_match_offsets(text, shortest=shortest)
+
+
+def test_save_n_load(words, tmp_path):
+    trie = DoubleArrayTrie(words)
+    path = str(tmp_path / 'words.trie')
+    trie.save(path)
+    loaded_trie = DoubleArrayTrie.load(path)
+
+    assert words == list(loaded_trie)
+    assert trie.to_bytes() == loaded_trie.to_bytes()
+    loaded_trie.insert('new word')
+    assert 'new word' in loaded_trie
+
+
+def test_pickle(words):
+    trie = DoubleArrayTrie(words)
+    unpickled_trie = pickle.loads(pickle.dumps(trie))
+    assert words == list(unpickled_trie)
+
+
+@pytest.mark.parametrize(
+    "buffer",
+    [
+        pytest.param(b'', id='empty'),
+        pytest.param(b'NOTATRIE' + bytes(16), id='magic'),
+        pytest.param(DoubleArrayTrie(['ab']).to_bytes()[:-1], id='truncated'),
+    ],
+)
+def test_invalid_buffer(buffer):
+    with pytest.raises(ValueError):
+        DoubleArrayTrie.from_buffer(buffer)
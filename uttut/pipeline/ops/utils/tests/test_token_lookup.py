@@ -0,0 +1,25 @@
+import pytest
+
+from uttut.pipeline.vocabulary import Vocabulary
+from ..consistent_hash import consistent_hash
+from ..token_lookup import lookup_indices, lookup_indices_with_hash
+
+
+def test_lookup_indices():
+    token2index = {'unk': 0, 'I': 1, 'like': 2}
+    assert [1, 2, 0] == lookup_indices(['I', 'like', 'oh'], token2index, 0)
+    assert [] == lookup_indices([], token2index, 0)
+
+
+def test_lookup_indices_with_hash():
+    token2index = {'oh': 0, 'I': 1, 'like': 2, 'apples': 3}
+    output = lookup_indices_with_hash(['I', '隼興', 'apples', ''], token2index, 4)
+    assert [1, consistent_hash('隼興', 4), 3, consistent_hash('', 4)] == output
+
+
+def test_lookup_indices_of_dict_subclass():
+    token2index = Vocabulary({'unk': 0, 'I': 1, 'like': 2})
+    assert [1, 2, 0] == lookup_indices(['I', 'like', 'oh'], token2index, 0)
+    assert [1, consistent_hash('oh', 3)] == lookup_indices_with_hash(['I', 'oh'], token2index, 3)
+    with pytest.raises(TypeError):
+        lookup_indices(['I'], [('I', 1)], 0)
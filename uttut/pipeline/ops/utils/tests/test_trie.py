@@ -19,3 +19,26 @@ def test_match_prefix():
     assert '珍奶' == trie.match_prefix('珍奶去冰', shortest=True)
     assert '珍奶去冰' == trie.match_prefix('珍奶去冰謝謝')
     assert trie.match_prefix('我想要珍奶去冰') is None
+
+
+def test_match_prefix_from_start():
+    trie = Trie()
+    trie.insert('珍奶')
+    trie.insert('珍奶去冰')
+
+    assert '珍奶去冰' == trie.match_prefix('我想要珍奶去冰', start=3)
+    assert '珍奶' == trie.match_prefix('我想要珍奶去冰', shortest=True, start=3)
+    assert trie.match_prefix('我想要珍奶去冰', start=4) is None
+    assert trie.match_prefix('我想要珍奶去冰', start=7) is None
+
+
+def test_gen_match_offsets():
+    trie = Trie()
+    for word in ['珍奶', '珍奶去冰', '去冰', '奶去']:
+        trie.insert(word)
+
+    assert [(2, 6)] == trie.gen_match_offsets('一杯珍奶去冰')
+    assert [(2, 4), (4, 6)] == trie.gen_match_offsets('一杯珍奶去冰', shortest=True)
+    assert [(0, 2), (3, 5)] == trie.gen_match_offsets('珍奶去珍奶')
+    assert [] == trie.gen_match_offsets('')
+    assert [] == trie.gen_match_offsets('一杯紅茶')
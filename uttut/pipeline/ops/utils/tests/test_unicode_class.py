@@ -0,0 +1,82 @@
+import unicodedata
+
+import pytest
+
+from ..unicode_class import (
+    CJK,
+    PUNCTUATION,
+    WHITESPACE,
+    COMBINING_MARK,
+    get_char_class,
+    is_cjk,
+    is_punctuation,
+    is_whitespace,
+    is_combining_mark,
+    find_chars,
+    remove_chars,
+    gen_word_offsets,
+)
+
+
+@pytest.mark.parametrize(
+    "char,expected_class",
+    [
+        pytest.param('a', 0, id='letter'),
+        pytest.param('1', 0, id='digit'),
+        pytest.param('我', CJK, id='cjk'),
+        pytest.param('\U00020000', CJK, id='cjk extension B'),
+        pytest.param('あ', 0, id='hiragana'),
+        pytest.param('한', 0, id='hangul'),
+        pytest.param(',', PUNCTUATION, id='ascii punctuation'),
+        pytest.param('$', PUNCTUATION, id='ascii symbol'),
+        pytest.param('。', PUNCTUATION, id='cjk punctuation'),
+        pytest.param('¥', 0, id='non-ascii symbol'),
+        pytest.param(' ', WHITESPACE, id='space'),
+        pytest.param('　', WHITESPACE, id='ideographic space'),
+        pytest.param('\x1f', WHITESPACE, id='unit separator'),
+        pytest.param('́', COMBINING_MARK, id='combining acute accent'),
+    ],
+)
+def test_get_char_class(char, expected_class):
+    assert expected_class == get_char_class(char)
+    assert expected_class == get_char_class(ord(char))
+
+
+def test_consistent_with_unicodedata():
+    for code_point in range(0, 0x110000, 7):
+        char = chr(code_point)
+        category = unicodedata.category(char)
+        assert is_whitespace(char) == char.isspace()
+        assert is_combining_mark(char) == (category == 'Mn')
+        if code_point > 127 and not is_cjk(char):
+            assert is_punctuation(char) == category.startswith('P')
+
+
+def test_invalid_char():
+    with pytest.raises(ValueError):
+        get_char_class('ab')
+
+
+def test_find_chars():
+    assert [2, 3, 4] == find_chars("GB,亂入", CJK | PUNCTUATION)
+    assert [] == find_chars("GB", CJK)
+
+
+def test_remove_chars():
+    text = unicodedata.normalize("NFD", "Héllo")
+    assert "Hello" == remove_chars(text, COMBINING_MARK)
+    assert "Hello" == remove_chars("Hello", COMBINING_MARK)
+
+
+@pytest.mark.parametrize(
+    "input_str,single_char_class,expected_offsets",
+    [
+        pytest.param("", PUNCTUATION, [], id='empty'),
+        pytest.param(" \t\n ", PUNCTUATION, [], id='whitespaces'),
+        pytest.param("abc, cdf", PUNCTUATION, [(0, 3), (3, 4), (5, 8)], id='punctuation'),
+        pytest.param("我是a b", PUNCTUATION, [(0, 3), (4, 5)], id='not cjk'),
+        pytest.param("我是a b", PUNCTUATION | CJK, [(0, 1), (1, 2), (2, 3), (4, 5)], id='cjk'),
+    ],
+)
+def test_gen_word_offsets(input_str, single_char_class, expected_offsets):
+    assert expected_offsets == gen_word_offsets(input_str, single_char_class)
@@ -0,0 +1,54 @@
+"""Map tokens to indices in bulk
+
+The loops run in C and create no intermediate objects besides the output list.
+token2index can be a dict or a subclass of dict, e.g. `Vocabulary`.
+"""
+from .consistent_hash import consistent_hash_batch
+
+
+cdef inline dict _as_dict(object token2index):  # noqa: E999
+    if not isinstance(token2index, dict):
+        raise TypeError(f"token2index should be a dict, got {type(token2index).__name__}")
+    return <dict> token2index
+
+
+def lookup_indices(list tokens, token2index, object unk_index) -> list:
+    """Indices of tokens, unk_index if a token is not in token2index
+
+    E.g.
+    >>> lookup_indices(['I', 'like', 'oh'], {'unk': 0, 'I': 1, 'like': 2}, 0)
+    [1, 2, 0]
+
+    """
+    cdef Py_ssize_t idx
+    cdef Py_ssize_t num_tokens = len(tokens)
+    cdef list indices = [None] * num_tokens
+    cdef dict mapping = _as_dict(token2index)
+    for idx in range(num_tokens):
+        indices[idx] = mapping.get(tokens[idx], unk_index)
+    return indices
+
+
+def lookup_indices_with_hash(list tokens, token2index, unsigned int mod_int) -> list:
+    """Indices of tokens, consistent_hash(token, mod_int) if a token is not in token2index
+
+    Out-of-vocabulary tokens are hashed together by `consistent_hash_batch`.
+    """
+    cdef Py_ssize_t idx
+    cdef Py_ssize_t num_tokens = len(tokens)
+    cdef list indices = [None] * num_tokens
+    cdef list oov_positions = []
+    cdef list oov_tokens = []
+    cdef dict mapping = _as_dict(token2index)
+    for idx in range(num_tokens):
+        token = tokens[idx]
+        index = mapping.get(token)
+        if index is None:
+            oov_positions.append(idx)
+            oov_tokens.append(token)
+        else:
+            indices[idx] = index
+    if oov_tokens:
+        for idx, index in zip(oov_positions, consistent_hash_batch(oov_tokens, mod_int)):
+            indices[idx] = index
+    return indices
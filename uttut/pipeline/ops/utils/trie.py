@@ -1,3 +1,6 @@
+from typing import List, Tuple
+
+
 class TrieNode:
 
     def __init__(self):
@@ -51,15 +54,58 @@ class Trie:
             current = current.get_child(char)
         current.word = word
 
-    def match_prefix(self, word: str, shortest: bool = False):
+    def match_prefix(self, word: str, shortest: bool = False, start: int = 0):
+        """Return the longest (or shortest) inserted word which is a prefix of word[start:]
+
+        word is not sliced, so matching at every position of a long text is cheap.
+
+        """
+        end = self._match_end(word, start, shortest)
+        if end == -1:
+            return None
+        return word[start: end]
+
+    def gen_match_offsets(self, text: str, shortest: bool = False) -> List[Tuple[int, int]]:
+        """Find inserted words in text greedily from left to right
+
+        At each position, the longest (or shortest) inserted word starting there
+        is matched and the scan continues after it. Otherwise, the scan moves to
+        the next position. It is the same as calling `match_prefix(text[start:])`
+        at every position, but text is scanned without slicing, so the cost is
+        linear to len(text) (times the length of the longest inserted word at worst).
+
+        E.g.
+        >>> trie.insert('珍奶')
+        >>> trie.insert('珍奶去冰')
+        >>> trie.gen_match_offsets('一杯珍奶去冰')
+        [(2, 6)]
+
+        Return:
+            offsets (list of tuples): (start, end) of matched words
+
+        """
+        offsets = []
+        start = 0
+        text_length = len(text)
+        while start < text_length:
+            end = self._match_end(text, start, shortest)
+            if end == -1:
+                start += 1
+            else:
+                offsets.append((start, end))
+                start = end
+        return offsets
+
+    def _match_end(self, text: str, start: int, shortest: bool) -> int:
+        """End of the matched word starting at text[start], -1 if not found"""
         current = self.root
-        longest_word = None
-        for char in word:
-            if not current.has_child(char):
-                return longest_word
-            current = current.get_child(char)
+        end = -1
+        for idx in range(start, len(text)):
+            current = current._children.get(text[idx])
+            if current is None:
+                return end
             if current.word:
-                longest_word = current.word
+                end = idx + 1
                 if shortest:
-                    return longest_word
-        return longest_word
+                    return end
+        return end
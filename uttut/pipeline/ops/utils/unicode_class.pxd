@@ -0,0 +1,8 @@
+cdef enum:  # noqa: E999
+    CJK_CLASS = 1
+    PUNCTUATION_CLASS = 2
+    WHITESPACE_CLASS = 4
+    COMBINING_MARK_CLASS = 8
+
+
+cdef unsigned char lookup(Py_UCS4 code_point) except? 0xFF  # noqa: E999
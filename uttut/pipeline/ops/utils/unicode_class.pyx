@@ -0,0 +1,164 @@
+"""Classes of unicode code points shared by operators
+
+The class of a code point is a bit set of
+- CJK: in the CJK Unified Ideographs blocks, as BERT defines a "chinese character"
+- PUNCTUATION: in the Unicode Punctuation categories (P*), or a non-letter/number
+    ASCII character, as BERT defines a punctuation
+- WHITESPACE: `str.isspace` is True
+- COMBINING_MARK: in the Unicode category Mn (Mark, Nonspacing)
+
+The classes are stored in a table with one byte per code point, so that
+classifying a character is a single read. The table is filled block by block
+(256 code points) on first lookup, from `unicodedata` of the running python.
+"""
+import unicodedata
+
+from cpython.unicode cimport PyUnicode_GET_LENGTH  # noqa: E999
+
+
+CJK = CJK_CLASS
+PUNCTUATION = PUNCTUATION_CLASS
+WHITESPACE = WHITESPACE_CLASS
+COMBINING_MARK = COMBINING_MARK_CLASS
+
+cdef enum:
+    _BLOCK_BITS = 8
+    _BLOCK_SIZE = 1 << _BLOCK_BITS
+    _NUM_CODE_POINTS = 0x110000
+    _NUM_BLOCKS = _NUM_CODE_POINTS >> _BLOCK_BITS
+
+cdef unsigned char _table[_NUM_CODE_POINTS]
+cdef unsigned char _block_filled[_NUM_BLOCKS]
+
+
+cdef unsigned char lookup(Py_UCS4 code_point) except? 0xFF:
+    cdef unsigned int index = <unsigned int> code_point
+    if not _block_filled[index >> _BLOCK_BITS]:
+        _fill_block(index >> _BLOCK_BITS)
+    return _table[index]
+
+
+cdef void _fill_block(unsigned int block) except *:
+    cdef unsigned int code_point
+    cdef unsigned int start = block << _BLOCK_BITS
+    cdef Py_UCS4 char
+    cdef unsigned char char_class
+    category = unicodedata.category
+    for code_point in range(start, start + _BLOCK_SIZE):
+        char_class = 0
+        if _is_cjk(code_point):
+            char_class |= CJK_CLASS
+        char = <Py_UCS4> code_point
+        cat = category(char)
+        if _is_ascii_symbol(code_point) or cat[0] == 'P':
+            char_class |= PUNCTUATION_CLASS
+        if char.isspace():
+            char_class |= WHITESPACE_CLASS
+        if cat == 'Mn':
+            char_class |= COMBINING_MARK_CLASS
+        _table[code_point] = char_class
+    _block_filled[block] = 1
+
+
+cdef inline bint _is_cjk(unsigned int code_point):
+    return (0x4E00 <= code_point <= 0x9FFF) or \
+        (0x3400 <= code_point <= 0x4DBF) or \
+        (0x20000 <= code_point <= 0x2A6DF) or \
+        (0x2A700 <= code_point <= 0x2B73F) or \
+        (0x2B740 <= code_point <= 0x2B81F) or \
+        (0x2B820 <= code_point <= 0x2CEAF) or \
+        (0xF900 <= code_point <= 0xFAFF) or \
+        (0x2F800 <= code_point <= 0x2FA1F)
+
+
+cdef inline bint _is_ascii_symbol(unsigned int code_point):
+    return (33 <= code_point <= 47) or \
+        (58 <= code_point <= 64) or \
+        (91 <= code_point <= 96) or \
+        (123 <= code_point <= 126)
+
+
+def get_char_class(Py_UCS4 char) -> int:
+    """Return the class of a character (or a code point)"""
+    return lookup(char)
+
+
+def is_cjk(Py_UCS4 char) -> bool:
+    return lookup(char) & CJK_CLASS != 0
+
+
+def is_punctuation(Py_UCS4 char) -> bool:
+    return lookup(char) & PUNCTUATION_CLASS != 0
+
+
+def is_whitespace(Py_UCS4 char) -> bool:
+    return lookup(char) & WHITESPACE_CLASS != 0
+
+
+def is_combining_mark(Py_UCS4 char) -> bool:
+    return lookup(char) & COMBINING_MARK_CLASS != 0
+
+
+def find_chars(str input_str, unsigned char char_class) -> list:
+    """Indices of the characters in any of char_class
+
+    E.g.
+    >>> find_chars("GB,亂入", CJK | PUNCTUATION)
+    [2, 3, 4]
+
+    """
+    cdef Py_ssize_t idx
+    cdef Py_UCS4 char
+    cdef list indices = []
+    for idx, char in enumerate(input_str):
+        if lookup(char) & char_class:
+            indices.append(idx)
+    return indices
+
+
+def remove_chars(str input_str, unsigned char char_class) -> str:
+    """Remove the characters in any of char_class"""
+    cdef Py_UCS4 char
+    cdef list chars = []
+    cdef bint removed = False
+    for char in input_str:
+        if lookup(char) & char_class:
+            removed = True
+        else:
+            chars.append(char)
+    if not removed:
+        return input_str
+    return ''.join(chars)
+
+
+def gen_word_offsets(str input_str, unsigned char single_char_class) -> list:
+    """Split input_str by whitespaces and characters in single_char_class
+
+    The characters in single_char_class are words themselves.
+
+    E.g.
+    >>> gen_word_offsets("abc, cdf", PUNCTUATION)
+    [(0, 3), (3, 4), (5, 8)]
+
+    """
+    cdef Py_ssize_t idx
+    cdef Py_ssize_t start = -1  # start of current word, -1 if not in a word
+    cdef Py_UCS4 char
+    cdef unsigned char char_class
+    cdef list offsets = []
+    for idx, char in enumerate(input_str):
+        char_class = lookup(char)
+        if char_class & WHITESPACE_CLASS:
+            if start != -1:
+                offsets.append((start, idx))
+                start = -1
+        elif char_class & single_char_class:
+            if start != -1:
+                offsets.append((start, idx))
+                start = -1
+            offsets.append((idx, idx + 1))
+        elif start == -1:
+            start = idx
+    if start != -1:
+        offsets.append((start, PyUnicode_GET_LENGTH(input_str)))
+    return offsets
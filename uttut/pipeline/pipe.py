@@ -1,13 +1,34 @@
-from typing import Dict, List
+from collections import deque
+from contextlib import contextmanager
+import copy
+from functools import partial
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List
+import asyncio
+import hashlib
+import mmap
+import multiprocessing
+import time
 import warnings
+import weakref
 
 import json
 
 from uttut.elements import Datum
 
+from . import artifact, vocabulary
+from .cache import CacheInfo, LRUCache, get_nbytes
+from .edit.label_map import LabelMap
+from .edit.trusted import is_trusted, trusted
 from .intermediate import Intermediate
-from .ops.base import LabelAligner, Operator
+from .micro_batcher import MicroBatcher
+from .ops.base import LabelAligner, Operator, prebuilt_tries
+from .profiler import Profiler
 from .utils import unpack_datum
+from .vocabulary import Vocabulary
+
+
+INTERMEDIATE_MODES = ('all', 'checkpoints', 'none')
 
 
 class Pipe:
@@ -23,6 +44,23 @@ class Pipe:
     def __init__(self):
         self._steps: List[Operator] = []
         self._checkpoints: Dict[str, int] = {}
+        self._batchers = weakref.WeakKeyDictionary()
+        self._cache: LRUCache = None
+        self._steps_fingerprint: str = None
+        self._hooks: List[Callable] = []
+        self._profiler: Profiler = None
+        self._trusted = False
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_batchers']  # bound to event loops
+        state['_hooks'] = []
+        state['_profiler'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._batchers = weakref.WeakKeyDictionary()
 
     def add(self, op_name: str, op_kwargs: Dict = None, checkpoint: str = None):
         """Add op into steps based on the operation name & kwargs.
@@ -70,6 +108,9 @@ class Pipe:
                     f"Got {op.input_type}, but requires {self.output_type}",
                 )
         self._steps.append(op)
+        self._steps_fingerprint = None
+        if self._cache is not None:
+            self._cache.clear()
 
         if checkpoint is not None:
             if checkpoint in self.checkpoints:
@@ -77,7 +118,29 @@ class Pipe:
             self._checkpoints[checkpoint] = len(self.steps)
 
     def __eq__(self, other):
-        return (self.steps, self.checkpoints) == (other.steps, other.checkpoints)
+        return isinstance(other, Pipe) and self.fingerprint == other.fingerprint
+
+    def __hash__(self):
+        return hash(self.fingerprint)
+
+    @property
+    def fingerprint(self) -> str:
+        """A stable content hash of steps and checkpoints
+
+        The hash of steps is memoized and recomputed only if operators are added
+        by `add`, `add_op` or `+=`. It assumes that operators are immutable
+        as `Operator.fingerprint` does, so steps should not be modified in place.
+        The hash of a pipe changes if operators or checkpoints are added.
+
+        Return:
+            hex digest of SHA-256 (str)
+
+        """
+        if self._steps_fingerprint is None:
+            self._steps_fingerprint = _hash_str(
+                ','.join(op.fingerprint for op in self.steps))
+        checkpoints = json.dumps(self.checkpoints, ensure_ascii=False, sort_keys=True)
+        return _hash_str(self._steps_fingerprint + checkpoints)
 
     def __add__(self, other):
         concat_pipe = self.__copy__()
@@ -95,6 +158,9 @@ class Pipe:
                 f"duplicated checkpoints between: {self.checkpoints}, {other.checkpoints}",
             )
         self._steps += other.steps
+        self._steps_fingerprint = None
+        if self._cache is not None:
+            self._cache.clear()
         self.checkpoints.update({
             ckpt_name: i + len(self.steps)  # since it's concated after self
             for ckpt_name, i in other.checkpoints.items()
@@ -175,83 +241,606 @@ class Pipe:
         print(f"Total checkpoints: {len(self.checkpoints)}")
         print("_" * 80)
 
-    def transform(self, datum: Datum):
+        if self._profiler is not None and self._profiler.stats:
+            print("Cost of the last profiling run")
+            print("=" * 80)
+            for line in self._profiler.report():
+                print(line)
+            print("_" * 80)
+
+    def add_hook(self, hook: Callable):
+        """Add a hook called after each step of `transform_sequence`
+
+        Args:
+            hook (callable): called with
+                (idx, op, input_sequence, output_sequence, label_aligner, elapsed),
+                where elapsed is the wall time of op.transform in seconds.
+
+        """
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: Callable):
+        self._hooks.remove(hook)
+
+    @contextmanager
+    def profile(self):
+        """Record costs of each step within the context
+
+        The result of the last profiling run is also shown by `summary`.
+
+        E.g.
+        >>> with p.profile() as profiler:
+        ...     for datum in data:
+        ...         p.transform(datum)
+        >>> p.summary()
+
+        Yield:
+            profiler: an instance of Profiler
+
+        """
+        profiler = Profiler()
+        self._profiler = profiler
+        self.add_hook(profiler)
+        try:
+            yield profiler
+        finally:
+            self.remove_hook(profiler)
+
+    def transform(self, datum: Datum, intermediate_mode: str = 'all'):
         """Process data based on steps
 
         This method processes datum according to the Pipe's steps.
 
-        Arg:
+        Args:
             datum (Datum)
+            intermediate_mode (str): see `transform_sequence`
 
         Returns:
             output_sequence: transfromed sequence
             intent_labels (ints)
             entity_labels (ints)
             label_alingers: an instance of LabelAlignerSequence
-            intermediate: an instance of Intermediate
+            intermediate: an instance of Intermediate, None if intermediate_mode is 'none'
 
         """
+        if self._trusted and not is_trusted():
+            with trusted():
+                return self.transform(datum, intermediate_mode=intermediate_mode)
+
         input_sequence, intent_labels, entity_labels = unpack_datum(datum)
-        output_sequence, label_aligners, intermediate = self.transform_sequence(input_sequence)
+        output_sequence, label_aligners, intermediate = self.transform_sequence(
+            input_sequence,
+            intermediate_mode=intermediate_mode,
+        )
         updated_entity_labels = label_aligners.transform(entity_labels)
 
         return output_sequence, intent_labels, updated_entity_labels, label_aligners, intermediate
 
-    def transform_sequence(self, input_sequence):
+    def transform_sequence(self, input_sequence, intermediate_mode: str = 'all'):
         """Process input_sequence based on steps
 
         This method processes input_sequence according to the Pipe's steps.
+        If the cache is enabled (see `enable_cache`), the cached results are
+        copied and returned.
 
-        Arg:
+        Args:
             input_sequence
+            intermediate_mode (str): which intermediates are kept
+                'all': output of every step is kept
+                'checkpoints': only outputs of checkpoints are kept
+                'none': no Intermediate is created
 
         Returns:
             output_sequence: transfromed sequence
             label_alingers: an instance of LabelAlignerSequence
-            intermediate: an instance of Intermediate
+            intermediate: an instance of Intermediate, None if intermediate_mode is 'none'
 
-        """
-        intermediate = Intermediate(self.checkpoints)
+        Raises:
+            ValueError: If intermediate_mode is not valid.
 
-        intermediate.add(input_sequence)
+        """
+        if self._trusted and not is_trusted():
+            with trusted():
+                return self.transform_sequence(input_sequence, intermediate_mode=intermediate_mode)
+
+        if self._cache is None:
+            return self._transform_sequence(input_sequence, intermediate_mode)
+
+        key = (_to_hashable(input_sequence), intermediate_mode)
+        result = self._cache.get(key)
+        if result is None:
+            # the cached result owns its input, the caller may modify input_sequence later
+            input_sequence = _copy_sequence(input_sequence)
+            result = self._transform_sequence(input_sequence, intermediate_mode)
+            self._cache.put(key, result, nbytes=_get_result_nbytes(input_sequence, result))
+        return _copy_result(result)
+
+    def _transform_sequence(self, input_sequence, intermediate_mode: str):
+        intermediate = self._create_intermediate(input_sequence, intermediate_mode)
         label_aligners = LabelAlignerSequence()
 
-        for op in self.steps:
-            input_sequence, label_aligner = op.transform(input_sequence)
-            intermediate.add(input_sequence)
+        hooks = self._hooks
+        for idx, op in enumerate(self.steps):
+            if hooks:
+                input_sequence, label_aligner = _run_with_hooks(hooks, idx, op, input_sequence)
+            else:
+                input_sequence, label_aligner = op.transform(input_sequence)
+            if intermediate is not None:
+                intermediate.add(input_sequence)
             label_aligners.add(label_aligner)
 
         return input_sequence, label_aligners, intermediate
 
-    def serialize(self) -> str:
-        return json.dumps(
-            {
-                'steps': [op.serialize() for op in self.steps],
-                'checkpoints': self.checkpoints,
-            },
-            ensure_ascii=False,
-            indent=2,
+    def _create_intermediate(self, input_sequence, intermediate_mode: str):
+        if intermediate_mode not in INTERMEDIATE_MODES:
+            raise ValueError(
+                f"intermediate_mode should be one of {INTERMEDIATE_MODES}. "
+                f"Got {intermediate_mode}",
+            )
+        if intermediate_mode == 'none':
+            return None
+
+        intermediate = Intermediate(
+            self.checkpoints,
+            checkpoints_only=intermediate_mode == 'checkpoints',
         )
+        intermediate.add(input_sequence)
+        return intermediate
+
+    def enable_cache(self, max_entries: int = 1024, max_bytes: int = None):
+        """Cache the results of `transform_sequence` in a LRU cache
+
+        The cache is keyed by input_sequence and intermediate_mode. The cached
+        results are never handed out, their copies are returned instead.
+        The cache is cleared if operators are added.
+
+        Args:
+            max_entries (int): max number of cached results. If None, it is unbounded.
+            max_bytes (int): max approximate size of cached results in bytes.
+                If None, it is unbounded.
+
+        Raises:
+            ValueError: If max_entries or max_bytes < 1.
+
+        """
+        self._cache = LRUCache(max_entries=max_entries, max_bytes=max_bytes)
+
+    def disable_cache(self):
+        self._cache = None
+
+    def cache_info(self) -> CacheInfo:
+        """Statistics of the cache, None if the cache is not enabled"""
+        if self._cache is None:
+            return None
+        return self._cache.info()
+
+    def enable_trusted_mode(self):
+        """Skip redundant validation when transforming
+
+        The type checks of operators, the length checks of label aligners and
+        the validation of edits are skipped, see `uttut.pipeline.edit.trusted`.
+        It is faster but invalid outputs of operators are not detected,
+        so it should be enabled only if the operators are known to produce
+        well-formed edits. Note that the label aligners returned still validate
+        labels when they are used outside `transform`.
+
+        """
+        self._trusted = True
+
+    def disable_trusted_mode(self):
+        self._trusted = False
+
+    @property
+    def trusted(self) -> bool:
+        return self._trusted
+
+    def transform_batch(
+            self,
+            data: List[Datum],
+            workers: int = 1,
+            chunksize: int = None,
+            intermediate_mode: str = 'all',
+        ):
+        """Process a batch of data based on steps
+
+        This method processes data according to the Pipe's steps using
+        a pool of worker processes. The pipe is sent to each worker once
+        when the worker starts, and the data are dispatched in chunks.
+
+        Args:
+            data (Datums)
+            workers (int): number of worker processes. If 1, data are
+                processed in the current process.
+            chunksize (int): number of data sent to a worker at a time.
+                If None, it is determined by multiprocessing.
+            intermediate_mode (str): see `transform_sequence`
+
+        Returns:
+            outputs (list): the outputs of `transform` in the same order as data.
+                The output is None if its datum fails to be transformed.
+            errors (dict): (key, value) = (index of failed datum, raised exception)
+
+        Raises:
+            ValueError: If workers < 1.
+
+        """
+        if workers < 1:
+            raise ValueError(f"workers should be a positive integer. Got {workers}")
+
+        if workers == 1:
+            results = [_transform_safely(self, datum, intermediate_mode) for datum in data]
+        else:
+            with multiprocessing.Pool(
+                    processes=workers,
+                    initializer=_init_worker,
+                    initargs=(self,),
+                ) as pool:
+                results = pool.map(
+                    partial(_transform_in_worker, intermediate_mode=intermediate_mode),
+                    data,
+                    chunksize=chunksize,
+                )
+
+        outputs = []
+        errors = {}
+        for idx, (output, error) in enumerate(results):
+            outputs.append(output)
+            if error is not None:
+                errors[idx] = error
+        return outputs, errors
+
+    def transform_stream(
+            self,
+            data: Iterable[Datum],
+            workers: int = 1,
+            chunksize: int = 1,
+            prefetch: int = None,
+            intermediate_mode: str = 'all',
+        ) -> Iterator:
+        """Lazily process a stream of data based on steps
+
+        Unlike `transform_batch`, data are consumed from the iterable on demand,
+        so the memory usage is bounded by the number of data in flight instead
+        of the size of the dataset.
+
+        Args:
+            data (iterable of Datum): e.g. `uttut.transformers.read_jsonl`
+            workers (int): number of worker processes. If 1, data are
+                processed in the current process one by one.
+            chunksize (int): number of data sent to a worker at a time.
+            prefetch (int): max number of chunks dispatched ahead of the consumer.
+                If None, 2 * workers is used. Ignored if workers is 1.
+            intermediate_mode (str): see `transform_sequence`
+
+        Yields:
+            (output, error) in the same order as data, where output is the output
+            of `transform` or None if the datum fails to be transformed, and error
+            is the raised exception or None.
+
+        Raises:
+            ValueError: If workers, chunksize or prefetch < 1 or intermediate_mode
+                is not valid.
+
+        """
+        if workers < 1:
+            raise ValueError(f"workers should be a positive integer. Got {workers}")
+        if chunksize < 1:
+            raise ValueError(f"chunksize should be a positive integer. Got {chunksize}")
+        if prefetch is None:
+            prefetch = 2 * workers
+        if prefetch < 1:
+            raise ValueError(f"prefetch should be a positive integer. Got {prefetch}")
+        if intermediate_mode not in INTERMEDIATE_MODES:
+            raise ValueError(
+                f"intermediate_mode should be one of {INTERMEDIATE_MODES}. "
+                f"Got {intermediate_mode}",
+            )
+
+        if workers == 1:
+            return (_transform_safely(self, datum, intermediate_mode) for datum in data)
+        return self._transform_stream_in_pool(
+            data,
+            workers=workers,
+            chunksize=chunksize,
+            prefetch=prefetch,
+            intermediate_mode=intermediate_mode,
+        )
+
+    def _transform_stream_in_pool(
+            self,
+            data: Iterable[Datum],
+            workers: int,
+            chunksize: int,
+            prefetch: int,
+            intermediate_mode: str,
+        ):
+        func = partial(_transform_chunk_in_worker, intermediate_mode=intermediate_mode)
+        with multiprocessing.Pool(
+                processes=workers,
+                initializer=_init_worker,
+                initargs=(self,),
+            ) as pool:
+            pending = deque()
+            for chunk in _gen_chunks(data, chunksize):
+                pending.append(pool.apply_async(func, (chunk,)))
+                if len(pending) >= prefetch:
+                    yield from pending.popleft().get()
+            while pending:
+                yield from pending.popleft().get()
+
+    async def atransform(
+            self,
+            datum: Datum,
+            executor=None,
+            max_batch_size: int = 1,
+            max_delay: float = 0.001,
+            intermediate_mode: str = 'all',
+        ):
+        """Process data based on steps without blocking the event loop
+
+        The transformation is offloaded to the executor. If max_batch_size > 1,
+        concurrent calls with the same arguments are coalesced into micro-batches,
+        see `MicroBatcher`. Cancelling the call drops the datum if its batch has not
+        been dispatched yet.
+
+        Args:
+            datum (Datum)
+            executor: an instance of concurrent.futures.Executor.
+                If None, the default executor of the event loop is used.
+            max_batch_size (int): max number of data processed in one executor call.
+            max_delay (float): max seconds to wait for coalescing data.
+                Ignored if max_batch_size is 1.
+            intermediate_mode (str): see `transform_sequence`
+
+        Returns:
+            the output of `transform`
+
+        Raises:
+            ValueError: If max_batch_size < 1 or max_delay < 0.
+
+        """
+        loop = asyncio.get_running_loop()
+        if max_batch_size == 1:
+            return await loop.run_in_executor(
+                executor,
+                partial(self.transform, datum, intermediate_mode=intermediate_mode),
+            )
+
+        batchers = self._batchers.setdefault(loop, {})
+        key = (executor, max_batch_size, max_delay, intermediate_mode)
+        if key not in batchers:
+            batchers[key] = MicroBatcher(
+                partial(_transform_chunk, self, intermediate_mode=intermediate_mode),
+                executor=executor,
+                max_batch_size=max_batch_size,
+                max_delay=max_delay,
+            )
+        return await batchers[key].submit(datum)
+
+    async def atransform_batch(
+            self,
+            data: List[Datum],
+            executor=None,
+            batch_size: int = 32,
+            intermediate_mode: str = 'all',
+        ):
+        """Process a batch of data based on steps without blocking the event loop
+
+        Data are split into batches of batch_size, and the batches are offloaded
+        to the executor concurrently. Cancelling the call cancels the batches
+        which have not started yet.
+
+        Args:
+            data (Datums)
+            executor: an instance of concurrent.futures.Executor.
+                If None, the default executor of the event loop is used.
+            batch_size (int): number of data processed in one executor call.
+            intermediate_mode (str): see `transform_sequence`
+
+        Returns:
+            outputs, errors: see `transform_batch`
+
+        Raises:
+            ValueError: If batch_size < 1.
+
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size should be a positive integer. Got {batch_size}")
+
+        loop = asyncio.get_running_loop()
+        func = partial(_transform_chunk, self, intermediate_mode=intermediate_mode)
+        batch_results = await asyncio.gather(*[
+            loop.run_in_executor(executor, func, chunk)
+            for chunk in _gen_chunks(data, batch_size)
+        ])
+
+        outputs = []
+        errors = {}
+        for idx, (output, error) in enumerate(
+                result for results in batch_results for result in results):
+            outputs.append(output)
+            if error is not None:
+                errors[idx] = error
+        return outputs, errors
+
+    def serialize(self) -> str:
+        """Serialize into a JSON string
+
+        Each `Vocabulary` in configs of operators is stored once under
+        'vocabularies' and referred by its id, see `uttut.pipeline.vocabulary`.
+
+        """
+        vocabularies = {}
+        pipe_bundle = {
+            'steps': [
+                json.dumps(
+                    {
+                        'op_name': op.__class__.__name__,
+                        'op_kwargs': vocabulary.externalize(op.configs, vocabularies),
+                    },
+                    ensure_ascii=False,
+                    indent=2,
+                )
+                for op in self.steps
+            ],
+            'checkpoints': self.checkpoints,
+        }
+        if vocabularies:
+            pipe_bundle['vocabularies'] = {
+                vocab_id: vocab.serialize() for vocab_id, vocab in vocabularies.items()
+            }
+        return json.dumps(pipe_bundle, ensure_ascii=False, indent=2)
 
     @classmethod
     def deserialize(cls, serialized_str: str) -> 'Pipe':
         pipe = cls()
         pipe_bundle = json.loads(serialized_str)
+        serialized_vocabularies = pipe_bundle.get('vocabularies', {})
+
+        def get_vocabulary(vocab_id: str) -> Vocabulary:
+            return Vocabulary.load_serialized(serialized_vocabularies[vocab_id])
+
         # restore steps
         for step_info in pipe_bundle['steps']:
             if isinstance(step_info, str):
-                op = Operator.deserialize(step_info)
+                step_info = json.loads(step_info)
             # backward compatibility
-            elif isinstance(step_info, dict):
-                op = Operator.from_dict(step_info)
-            else:
+            elif not isinstance(step_info, dict):
                 raise TypeError("Invalid json string format!")
-            pipe.add_op(op)
+            step_info = {
+                'op_name': step_info['op_name'],
+                'op_kwargs': vocabulary.resolve(step_info['op_kwargs'], get_vocabulary),
+            }
+            pipe.add_op(Operator.from_dict(step_info))
 
         # restore checkpoints
         pipe._checkpoints = pipe_bundle['checkpoints']
         return pipe
 
+    def to_artifact(self) -> bytes:
+        """Serialize into a binary artifact, see `uttut.pipeline.artifact`"""
+        return artifact.dumps([artifact.op_to_step(op) for op in self.steps], self.checkpoints)
+
+    @classmethod
+    def from_artifact(cls, buffer, validate: bool = False) -> 'Pipe':
+        """Deserialize from a binary artifact
+
+        Args:
+            buffer: bytes-like object, e.g. bytes or mmap
+            validate (bool): whether to validate configs of operators.
+                The checksum only detects corruption. It is False by default
+                since `to_artifact` and `artifact.json_to_artifact` write
+                configs of validated operators, it should be True for
+                artifacts from other sources. The stored tries of operators
+                are used only if it is False, otherwise they are rebuilt.
+
+        Return:
+            Pipe
+
+        Raise:
+            ArtifactError: If the artifact is not valid or corrupted.
+
+        """
+        steps, checkpoints = artifact.loads(buffer)
+        pipe = cls()
+        for step_info in steps:
+            tries = {} if validate else step_info.get('tries', {})
+            with prebuilt_tries(tries):
+                pipe.add_op(Operator.from_dict(step_info, validate=validate))
+        pipe._checkpoints = checkpoints
+        return pipe
+
+    def save_artifact(self, path: str):
+        with open(path, 'wb') as f_out:
+            f_out.write(self.to_artifact())
+
+    @classmethod
+    def load_artifact(cls, path: str, validate: bool = False) -> 'Pipe':
+        """Load a binary artifact from file by mmap, see `from_artifact`
+
+        The stored tries of operators are loaded from the mapping without
+        copying, and they keep the mapping open as long as they are alive.
+
+        """
+        with open(path, 'rb') as f_in:
+            buffer = mmap.mmap(f_in.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls.from_artifact(buffer, validate=validate)
+
+
+def _run_with_hooks(hooks: List[Callable], idx: int, op, input_sequence):
+    start = time.perf_counter()
+    output_sequence, label_aligner = op.transform(input_sequence)
+    elapsed = time.perf_counter() - start
+    for hook in hooks:
+        hook(idx, op, input_sequence, output_sequence, label_aligner, elapsed)
+    return output_sequence, label_aligner
+
+
+def _hash_str(content: str) -> str:
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def _to_hashable(sequence):
+    if isinstance(sequence, list):
+        return tuple(sequence)
+    return sequence
+
+
+def _get_result_nbytes(input_sequence, result) -> int:
+    output_sequence, _, intermediate = result
+    nbytes = get_nbytes(input_sequence) + get_nbytes(output_sequence)
+    if intermediate is not None:
+        nbytes += sum(get_nbytes(sequence) for sequence in intermediate[:] if sequence is not None)
+    return nbytes
+
+
+def _copy_result(result):
+    output_sequence, label_aligners, intermediate = result
+    if intermediate is not None:
+        intermediate = copy.copy(intermediate)
+    return _copy_sequence(output_sequence), copy.copy(label_aligners), intermediate
+
+
+def _copy_sequence(sequence):
+    if isinstance(sequence, list):
+        return sequence.copy()
+    return sequence
+
+
+_worker_pipe = None
+
+
+def _init_worker(pipe: Pipe):
+    global _worker_pipe
+    _worker_pipe = pipe
+
+
+def _transform_in_worker(datum: Datum, intermediate_mode: str):
+    return _transform_safely(_worker_pipe, datum, intermediate_mode)
+
+
+def _transform_chunk_in_worker(chunk: List[Datum], intermediate_mode: str):
+    return _transform_chunk(_worker_pipe, chunk, intermediate_mode)
+
+
+def _transform_chunk(pipe: Pipe, chunk: List[Datum], intermediate_mode: str):
+    return [_transform_safely(pipe, datum, intermediate_mode) for datum in chunk]
+
+
+def _gen_chunks(data: Iterable, chunksize: int):
+    iterator = iter(data)
+    chunk = list(islice(iterator, chunksize))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunksize))
+
+
+def _transform_safely(pipe: Pipe, datum: Datum, intermediate_mode: str):
+    try:
+        return pipe.transform(datum, intermediate_mode=intermediate_mode), None
+    except Exception as error:
+        return None, error
+
 
 class LabelAlignerSequence:
 
@@ -267,6 +856,11 @@ class LabelAlignerSequence:
         """
         self.collections.append(label_aligner)
 
+    def __copy__(self):
+        copy_label_aligners = LabelAlignerSequence()
+        copy_label_aligners.collections = self.collections.copy()
+        return copy_label_aligners
+
     def transform(self, labels: List[int]) -> List[int]:
         """Update labels based on given label_aligners
 
@@ -296,3 +890,71 @@ class LabelAlignerSequence:
         for label_aligner in self.collections[::-1]:
             labels = label_aligner.inverse_transform(labels)
         return labels
+
+    def compile(self) -> 'LabelAlignerSequence':
+        """Compose label_aligners into precomputed label maps
+
+        Consecutive label_aligners which support compilation are composed
+        into a CompiledLabelAligner, such that labels are mapped in a single pass.
+        The others are kept as they are.
+
+        Return:
+            LabelAlignerSequence: has the same transform and inverse_transform
+                                  results as self
+
+        """
+        compiled_label_aligners = LabelAlignerSequence()
+        block: List[LabelAligner] = []
+        forward_map = None
+
+        for label_aligner in self.collections:
+            if forward_map is None:
+                forward_map = LabelMap(label_aligner._input_length)
+            try:
+                label_aligner._compile_transform(forward_map)
+            except NotImplementedError:
+                if block:
+                    compiled_label_aligners.add(_compile_block(block, forward_map))
+                    block = []
+                forward_map = None
+                compiled_label_aligners.add(label_aligner)
+            else:
+                block.append(label_aligner)
+
+        if block:
+            compiled_label_aligners.add(_compile_block(block, forward_map))
+        return compiled_label_aligners
+
+
+def _compile_block(label_aligners: List[LabelAligner], forward_map: LabelMap):
+    inverse_map = LabelMap(label_aligners[-1]._output_length)
+    for label_aligner in label_aligners[::-1]:
+        label_aligner._compile_inverse_transform(inverse_map)
+    return CompiledLabelAligner(forward_map, inverse_map)
+
+
+class CompiledLabelAligner(LabelAligner):
+
+    """LabelAligner composed of precomputed label maps
+
+    Note that it does not hold the input_sequence.
+
+    Attributes:
+        forward_map (LabelMap): maps labels of input to those of output
+        inverse_map (LabelMap): maps labels of output to those of input
+
+    """
+
+    def __init__(self, forward_map: LabelMap, inverse_map: LabelMap):
+        self._input_length = forward_map.input_length
+        self._output_length = forward_map.output_length
+
+        self._input_sequence = None
+        self._forward_edit = forward_map
+        self._inverse_edit = inverse_map
+
+    def _transform(self, labels: List[int]) -> List[int]:
+        return self._forward_edit.apply(labels)
+
+    def _inverse_transform(self, labels: List[int]) -> List[int]:
+        return self._inverse_edit.apply(labels)
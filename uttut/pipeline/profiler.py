@@ -0,0 +1,114 @@
+from collections import OrderedDict
+from typing import List
+
+from .edit.replacement import ReplacementGroup
+from .ops.base import LabelAligner
+
+
+class StepStats:
+
+    """Accumulated costs of a step
+
+    Attributes:
+        name (str): str of the operator
+        calls (int): number of calls
+        total_time (float): total wall time in seconds
+        input_length (int): total length of input sequences
+        output_length (int): total length of output sequences
+        replacements (int): total number of replacements, None if unknown
+
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.total_time = 0.
+        self.input_length = 0
+        self.output_length = 0
+        self.replacements = 0
+
+    def update(self, input_sequence, output_sequence, label_aligner, elapsed: float):
+        self.calls += 1
+        self.total_time += elapsed
+        self.input_length += len(input_sequence)
+        self.output_length += len(output_sequence)
+        n_replacements = _count_replacements(label_aligner)
+        if n_replacements is None or self.replacements is None:
+            self.replacements = None
+        else:
+            self.replacements += n_replacements
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.calls if self.calls else 0.
+
+
+class Profiler:
+
+    """A Pipe hook which records costs of each step
+
+    E.g.
+    >>> profiler = Profiler()
+    >>> pipe.add_hook(profiler)
+    >>> pipe.transform_sequence('我想喝珍奶')
+    >>> pipe.remove_hook(profiler)
+    >>> profiler.stats[0].total_time
+
+    Attributes:
+        stats (OrderedDict): (key, value) = (index of step, StepStats)
+
+    """
+
+    def __init__(self):
+        self.stats = OrderedDict()
+
+    def __call__(self, idx, op, input_sequence, output_sequence, label_aligner, elapsed):
+        if idx not in self.stats:
+            self.stats[idx] = StepStats(str(op))
+        self.stats[idx].update(input_sequence, output_sequence, label_aligner, elapsed)
+
+    @property
+    def total_time(self) -> float:
+        return sum(step_stats.total_time for step_stats in self.stats.values())
+
+    def report(self) -> List[str]:
+        """Format stats as rows of a cost table
+
+        Return:
+            lines (strs)
+
+        """
+        total_time = self.total_time
+        lines = [
+            f"{'Step':>4}  {'Operator':<32} {'Calls':>7} {'Total(ms)':>10} "
+            f"{'Mean(us)':>9} {'%':>6} {'In':>8} {'Out':>8} {'Repl':>7}",
+        ]
+        for idx, step_stats in self.stats.items():
+            ratio = 100 * step_stats.total_time / total_time if total_time else 0.
+            replacements = '-' if step_stats.replacements is None else step_stats.replacements
+            lines.append(
+                f"{idx:>4}  {_truncate(step_stats.name, 32):<32} {step_stats.calls:>7} "
+                f"{step_stats.total_time * 1e3:>10.3f} {step_stats.mean_time * 1e6:>9.1f} "
+                f"{ratio:>6.1f} {step_stats.input_length:>8} {step_stats.output_length:>8} "
+                f"{replacements:>7}",
+            )
+        return lines
+
+
+def _count_replacements(label_aligner):
+    if not isinstance(label_aligner, LabelAligner):
+        return None
+    edit = label_aligner._forward_edit
+    if edit is None:
+        return 0
+    if isinstance(edit, dict):
+        edit = edit.get('replacement_group')
+    if isinstance(edit, ReplacementGroup):
+        return len(edit)
+    return None
+
+
+def _truncate(text: str, width: int) -> str:
+    if len(text) <= width:
+        return text
+    return text[: width - 3] + '...'
@@ -76,3 +76,11 @@ class Lst2Str(Operator):
             input_sequence=input_sequence,
             output_length=len(output_sequence),
         )
+
+
+class NonEmptyStr2Str(Str2Str):
+
+    def _transform(self, input_sequence: str):  # type: ignore
+        if not input_sequence:
+            raise ValueError('empty input')
+        return super()._transform(input_sequence)
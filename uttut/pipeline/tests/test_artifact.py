@@ -0,0 +1,146 @@
+import pytest
+
+from uttut.elements import Datum
+from ..artifact import (
+    ArtifactError,
+    FORMAT_VERSION,
+    MAGIC,
+    artifact_to_json,
+    dumps,
+    json_to_artifact,
+    loads,
+)
+from ..pipe import Pipe
+
+
+@pytest.fixture(scope='module')
+def pipe():
+    p = Pipe()
+    p.add('AddWhitespaceAroundWordnZhChar', {'user_words': ['珍奶', '去冰', '', 'ab\\n']})
+    p.add('CustomWordTokenizer', {'user_words': ['珍奶去冰', '珍奶'], 'shortest': True},
+          checkpoint='tokens')
+    p.add('Pad', {'maxlen': 10})
+    p.add('Token2Index', {'token2index': {'<unk>': 0, '珍奶': 2, '<pad>': 1, '': 3}})
+    return p
+
+
+def test_dumps_and_loads():
+    steps = [
+        {'op_name': 'A', 'op_kwargs': {'vocab': {'我': 1, 'a': 0}, 'n': 3, 'words': ['x', '']}},
+        {'op_name': 'B', 'op_kwargs': {'empty': {}, 'flags': {'a': True}, 'mixed': ['a', 1]}},
+    ]
+    artifact = dumps(steps, {'ckpt': 1})
+    assert artifact.startswith(MAGIC)
+    assert (steps, {'ckpt': 1}) == loads(artifact)
+    assert list(loads(artifact)[0][0]['op_kwargs']['vocab']) == ['我', 'a']
+
+
+def test_pipe_artifact(pipe, tmpdir):
+    artifact = pipe.to_artifact()
+    loaded_pipe = Pipe.from_artifact(artifact)
+    assert pipe == loaded_pipe
+
+    path = str(tmpdir.join('pipe.bin'))
+    pipe.save_artifact(path)
+    loaded_pipe = Pipe.load_artifact(path, validate=True)
+    assert pipe == loaded_pipe
+
+    datum = Datum('我想喝珍奶去冰')
+    assert pipe.transform(datum)[:3] == loaded_pipe.transform(datum)[:3]
+
+
+def test_tries_are_loaded_from_artifact(tmpdir):
+    p = Pipe()
+    p.add('AddWhitespaceAroundWordnZhChar', {'user_words': ['珍奶', '去冰']})
+    p.add('CustomWordTokenizer', {'user_words': ['珍奶去冰', '珍奶'], 'shortest': True})
+    p.add('SpanSubwords', {'vocab': {'<unk>': 0, '珍奶': 1, '##去冰': 2, '我': 3}})
+    p.add('Token2Index', {'token2index': {'<unk>': 0, '珍奶': 1, '##去冰': 2}})
+    path = str(tmpdir.join('pipe.bin'))
+    p.save_artifact(path)
+
+    steps, _ = loads(p.to_artifact())
+    assert [{'user_words'}, {'user_words'}, {'vocab', 'vocab_continuation'}, set()] == \
+        [set(step.get('tries', {})) for step in steps]
+
+    loaded_pipe = Pipe.load_artifact(path)
+    assert p == loaded_pipe
+    assert ['去冰'] == list(loaded_pipe.steps[2]._get_tries()['vocab_continuation'])
+
+    # the mapping is kept open by the loaded tries
+    datum = Datum('我想喝珍奶去冰')
+    assert p.transform(datum)[:3] == loaded_pipe.transform(datum)[:3]
+
+    # the tries are rebuilt with validation
+    validated_pipe = Pipe.load_artifact(path, validate=True)
+    assert p.transform(datum)[:3] == validated_pipe.transform(datum)[:3]
+
+
+def test_converters(pipe):
+    artifact = json_to_artifact(pipe.serialize())
+    assert pipe.to_artifact() == artifact
+    assert pipe.serialize() == artifact_to_json(artifact)
+
+
+def test_shared_blobs_are_written_once():
+    token2index = {'<unk>': 0, 'a': 1, 'b': 2}
+    p = Pipe()
+    p.add('Token2Index', {'token2index': token2index})
+    p.add('Token2IndexwithHash', {'token2index': token2index})
+    p.add('Token2Index', {'token2index': token2index})
+    copied_p = Pipe()
+    for op in p.steps:
+        copied_p.add(op.__class__.__name__, {'token2index': dict(token2index)})
+    assert copied_p == p
+    # the dict shared by the first two steps is written once
+    assert len(p.to_artifact()) < len(copied_p.to_artifact())
+
+    steps, _ = loads(p.to_artifact())
+    assert all(step['op_kwargs']['token2index'] is steps[0]['op_kwargs']['token2index']
+               for step in steps)
+    assert p == Pipe.from_artifact(p.to_artifact())
+
+    # steps of the same fingerprint refer to the same blobs
+    steps, _ = loads(copied_p.to_artifact())
+    assert steps[0]['op_kwargs']['token2index'] is steps[2]['op_kwargs']['token2index']
+    assert steps[0]['op_kwargs']['token2index'] is not steps[1]['op_kwargs']['token2index']
+
+
+def test_convert_old_format(get_data_path):
+    with open(get_data_path('zh_char_pipe_100_old_format.json'), 'r') as f_in:
+        serialized_str = f_in.read()
+    assert Pipe.deserialize(serialized_str) == Pipe.from_artifact(
+        json_to_artifact(serialized_str))
+
+
+def test_json_to_artifact_validates_configs():
+    p = Pipe()
+    p.add('Token2Index', {'token2index': {'<unk>': 0, 'a': 1}})
+    serialized_str = p.serialize().replace('\\"a\\": 1', '\\"a\\": 0')
+    assert serialized_str != p.serialize()
+    with pytest.raises(ValueError):
+        json_to_artifact(serialized_str)
+
+
+def test_skip_validation():
+    steps = [{'op_name': 'Token2Index', 'op_kwargs': {'token2index': {'<unk>': 0, 'a': 2}}}]
+    artifact = dumps(steps, {})
+    Pipe.from_artifact(artifact)
+    with pytest.raises(ValueError):
+        Pipe.from_artifact(artifact, validate=True)
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        pytest.param(lambda artifact: artifact[:-1] + b'\x01', id='checksum'),
+        pytest.param(lambda artifact: b'NOTUTTUT' + artifact[8:], id='magic'),
+        pytest.param(
+            lambda artifact: artifact[:8] + bytes([FORMAT_VERSION + 1, 0]) + artifact[10:],
+            id='version',
+        ),
+        pytest.param(lambda artifact: artifact[:10], id='truncated'),
+    ],
+)
+def test_raise_invalid_artifact(pipe, corrupt):
+    with pytest.raises(ArtifactError):
+        Pipe.from_artifact(corrupt(pipe.to_artifact()))
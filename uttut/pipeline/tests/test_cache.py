@@ -0,0 +1,73 @@
+import pickle
+
+import pytest
+
+from ..cache import LRUCache, get_nbytes
+
+
+def test_get_and_put():
+    cache = LRUCache(max_entries=2)
+    assert cache.get('a') is None
+    cache.put('a', 1, nbytes=1)
+    cache.put('b', 2, nbytes=1)
+    assert 1 == cache.get('a')
+    cache.put('c', 3, nbytes=1)  # b is the least recently used
+
+    assert cache.get('b') is None
+    assert 1 == cache.get('a')
+    assert 3 == cache.get('c')
+    info = cache.info()
+    assert (3, 2, 1, 2, 2) == (info.hits, info.misses, info.evictions, info.entries, info.nbytes)
+
+
+def test_evict_by_bytes():
+    cache = LRUCache(max_entries=None, max_bytes=10)
+    cache.put('a', 1, nbytes=4)
+    cache.put('b', 2, nbytes=4)
+    cache.put('c', 3, nbytes=4)
+    assert ['b', 'c'] == list(cache._entries)
+    assert 8 == cache.info().nbytes
+
+    cache.put('d', 4, nbytes=11)  # larger than max_bytes
+    assert cache.get('d') is None
+    assert 2 == len(cache)
+
+
+def test_put_existing_key():
+    cache = LRUCache(max_bytes=10)
+    cache.put('a', 1, nbytes=4)
+    cache.put('a', 2, nbytes=6)
+    assert 2 == cache.get('a')
+    assert (1, 6, 0) == (len(cache), cache.info().nbytes, cache.info().evictions)
+
+
+def test_clear():
+    cache = LRUCache()
+    cache.put('a', 1, nbytes=4)
+    cache.get('a')
+    cache.clear()
+    assert (0, 0, 1) == (len(cache), cache.info().nbytes, cache.info().hits)
+
+
+def test_pickle_without_entries():
+    cache = LRUCache(max_entries=3, max_bytes=100)
+    cache.put('a', 1, nbytes=4)
+    loaded_cache = pickle.loads(pickle.dumps(cache))
+    assert 0 == len(loaded_cache)
+    assert (3, 100) == (loaded_cache.info().max_entries, loaded_cache.info().max_bytes)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        pytest.param({'max_entries': 0}, id='max_entries'),
+        pytest.param({'max_bytes': 0}, id='max_bytes'),
+    ],
+)
+def test_raise_invalid_limits(kwargs):
+    with pytest.raises(ValueError):
+        LRUCache(**kwargs)
+
+
+def test_get_nbytes():
+    assert get_nbytes(['ab', 'c']) > get_nbytes(['ab']) > get_nbytes([])
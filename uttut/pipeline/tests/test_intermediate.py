@@ -17,3 +17,16 @@ def test_all():
     assert expected_record == intm[:]
     assert expected_record[1] == intm.get_from_checkpoint('1')
     assert expected_record[3] == intm.get_from_checkpoint('3')
+
+
+def test_checkpoints_only():
+    intm = Intermediate({'1': 1, '3': 3}, checkpoints_only=True)
+    input_lst = [0]
+    expected_record = []
+    for i in range(5):
+        input_lst = _transform(input_lst, i)
+        intm.add(input_lst)
+        expected_record.append(input_lst.copy())
+    assert [None, expected_record[1], None, expected_record[3], None] == intm[:]
+    assert expected_record[1] == intm.get_from_checkpoint('1')
+    assert expected_record[3] == intm.get_from_checkpoint('3')
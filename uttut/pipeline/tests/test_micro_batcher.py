@@ -0,0 +1,94 @@
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import threading
+
+import pytest
+
+from ..micro_batcher import MicroBatcher
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+async def gather(*coros):
+    return await asyncio.gather(*coros, return_exceptions=True)
+
+
+class RecordingFunc:
+
+    def __init__(self, event=None):
+        self.batches = []
+        self.event = event
+
+    def __call__(self, items):
+        if self.event is not None:
+            self.event.wait()
+        self.batches.append(items)
+        return [
+            (None, ValueError(item)) if item < 0 else (item * 2, None)
+            for item in items
+        ]
+
+
+def test_coalesce(loop):
+    func = RecordingFunc()
+    batcher = MicroBatcher(func, max_batch_size=3, max_delay=1.)
+    results = loop.run_until_complete(gather(*[batcher.submit(i) for i in range(5)]))
+    assert [0, 2, 4, 6, 8] == results
+    assert [[0, 1, 2], [3, 4]] == func.batches
+
+
+def test_raise_error_to_submitter(loop):
+    batcher = MicroBatcher(RecordingFunc(), executor=ThreadPoolExecutor(1))
+    results = loop.run_until_complete(gather(batcher.submit(1), batcher.submit(-1)))
+    assert 2 == results[0]
+    assert isinstance(results[1], ValueError)
+
+
+def test_cancelled_submission_is_dropped(loop):
+    func = RecordingFunc()
+    batcher = MicroBatcher(func, max_batch_size=10, max_delay=0.01)
+
+    async def main():
+        tasks = [loop.create_task(batcher.submit(i)) for i in range(3)]
+        await asyncio.sleep(0)
+        tasks[1].cancel()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = loop.run_until_complete(main())
+    assert 0 == results[0] and 4 == results[2]
+    assert isinstance(results[1], asyncio.CancelledError)
+    assert [[0, 2]] == func.batches
+
+
+def test_cancelled_after_dispatch(loop):
+    event = threading.Event()
+    func = RecordingFunc(event)
+    batcher = MicroBatcher(func, executor=ThreadPoolExecutor(1), max_batch_size=1)
+
+    async def main():
+        task = loop.create_task(batcher.submit(1))
+        await asyncio.sleep(0)
+        task.cancel()
+        event.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return await batcher.submit(2)
+
+    assert 4 == loop.run_until_complete(main())
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        pytest.param({'max_batch_size': 0}, id='max_batch_size'),
+        pytest.param({'max_delay': -1}, id='max_delay'),
+    ],
+)
+def test_raise_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        MicroBatcher(RecordingFunc(), **kwargs)
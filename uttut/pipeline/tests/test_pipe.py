@@ -1,7 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import pickle
+
 import pytest
 
 from uttut.elements import Datum, Intent, Entity
-from ..pipe import Pipe
+from ..pipe import Pipe, CompiledLabelAligner
 
 
 @pytest.fixture(scope='module')
@@ -67,6 +71,323 @@ def test_transform(fake_pipe, dummy_datum):
     assert output == [1, 2, 3]
 
 
+def test_transform_sequence_with_checkpoints_only(fake_pipe):
+    output_seq, _, intermediate = fake_pipe.transform_sequence(
+        '123',
+        intermediate_mode='checkpoints',
+    )
+    assert ['1', '2', '3'] == output_seq
+    assert '123' == intermediate.get_from_checkpoint('1')
+    assert ['1', '2', '3'] == intermediate.get_from_checkpoint('2')
+    assert [None, '123', None, ['1', '2', '3']] == intermediate[:]
+
+
+def test_transform_without_intermediate(fake_pipe, dummy_datum):
+    output = fake_pipe.transform(dummy_datum, intermediate_mode='none')
+    output_seq, intent_labels, entity_labels, label_aligner, intermediate = output
+
+    assert output_seq == ['1', '2', '3']
+    assert entity_labels == [1, 2, 3]
+    assert intermediate is None
+
+
+def test_transform_sequence_raise_invalid_intermediate_mode(fake_pipe):
+    with pytest.raises(ValueError):
+        fake_pipe.transform_sequence('123', intermediate_mode='薄餡亂入')
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_transform_batch(fake_pipe, dummy_datum, workers):
+    data = [dummy_datum, Datum(utterance='45'), dummy_datum]
+    outputs, errors = fake_pipe.transform_batch(data, workers=workers, chunksize=1)
+
+    assert errors == {}
+    assert len(outputs) == len(data)
+    for datum, output in zip(data, outputs):
+        expected_output = fake_pipe.transform(datum)
+        assert expected_output[:3] == output[:3]
+        assert expected_output[4][:] == output[4][:]
+        assert output[3].inverse_transform(output[2]) == expected_output[2]
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_transform_batch_collects_errors(dummy_datum, workers):
+    p = Pipe()
+    p.add('NonEmptyStr2Str')
+    p.add('Str2Lst')
+    data = [dummy_datum, Datum(utterance=''), dummy_datum, Datum(utterance='')]
+    outputs, errors = p.transform_batch(data, workers=workers)
+
+    assert [1, 3] == sorted(errors)
+    assert all(isinstance(error, ValueError) for error in errors.values())
+    assert outputs[1] is None and outputs[3] is None
+    assert ['1', '2', '3'] == outputs[0][0] == outputs[2][0]
+
+
+def test_transform_batch_without_intermediate(fake_pipe, dummy_datum):
+    outputs, _ = fake_pipe.transform_batch(
+        [dummy_datum], workers=2, intermediate_mode='none')
+    assert outputs[0][4] is None
+
+
+def test_transform_batch_raise_invalid_workers(fake_pipe, dummy_datum):
+    with pytest.raises(ValueError):
+        fake_pipe.transform_batch([dummy_datum], workers=0)
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_transform_stream(fake_pipe, dummy_datum, workers):
+    data = [dummy_datum, Datum(utterance='45'), dummy_datum]
+    stream = fake_pipe.transform_stream(iter(data), workers=workers, chunksize=2, prefetch=1)
+
+    results = list(stream)
+    assert len(results) == len(data)
+    for datum, (output, error) in zip(data, results):
+        assert error is None
+        expected_output = fake_pipe.transform(datum)
+        assert expected_output[:3] == output[:3]
+        assert output[3].inverse_transform(output[2]) == expected_output[2]
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_transform_stream_consumes_lazily(fake_pipe, dummy_datum, workers):
+    consumed = []
+
+    def gen_data():
+        for idx in range(100):
+            consumed.append(idx)
+            yield dummy_datum
+
+    stream = fake_pipe.transform_stream(gen_data(), workers=workers, chunksize=2, prefetch=2)
+    assert consumed == []
+    next(stream)
+    assert len(consumed) <= 4
+    stream.close()
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_transform_stream_collects_errors(dummy_datum, workers):
+    p = Pipe()
+    p.add('NonEmptyStr2Str')
+    p.add('Str2Lst')
+    data = [dummy_datum, Datum(utterance=''), dummy_datum]
+    results = list(p.transform_stream(data, workers=workers, intermediate_mode='none'))
+
+    assert results[1][0] is None
+    assert isinstance(results[1][1], ValueError)
+    assert ['1', '2', '3'] == results[0][0][0] == results[2][0][0]
+    assert results[0][1] is None and results[0][0][4] is None
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        pytest.param({'workers': 0}, id='workers'),
+        pytest.param({'chunksize': 0}, id='chunksize'),
+        pytest.param({'workers': 2, 'prefetch': 0}, id='prefetch'),
+        pytest.param({'intermediate_mode': 'invalid'}, id='intermediate_mode'),
+    ],
+)
+def test_transform_stream_raise_invalid_arguments(fake_pipe, dummy_datum, kwargs):
+    with pytest.raises(ValueError):
+        fake_pipe.transform_stream([dummy_datum], **kwargs)
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+async def gather(*coros):
+    return await asyncio.gather(*coros, return_exceptions=True)
+
+
+@pytest.mark.parametrize('max_batch_size', [1, 2])
+def test_atransform(fake_pipe, dummy_datum, loop, max_batch_size):
+    data = [dummy_datum, Datum(utterance='45'), dummy_datum]
+    with ThreadPoolExecutor(2) as executor:
+        outputs = loop.run_until_complete(gather(*[
+            fake_pipe.atransform(datum, executor=executor, max_batch_size=max_batch_size)
+            for datum in data
+        ]))
+    for datum, output in zip(data, outputs):
+        expected_output = fake_pipe.transform(datum)
+        assert expected_output[:3] == output[:3]
+        assert expected_output[4][:] == output[4][:]
+
+
+@pytest.mark.parametrize('max_batch_size', [1, 2])
+def test_atransform_raise(dummy_datum, loop, max_batch_size):
+    p = Pipe()
+    p.add('NonEmptyStr2Str')
+    with pytest.raises(ValueError):
+        loop.run_until_complete(
+            p.atransform(Datum(utterance=''), max_batch_size=max_batch_size))
+
+
+def test_atransform_batch(dummy_datum, loop):
+    p = Pipe()
+    p.add('NonEmptyStr2Str')
+    p.add('Str2Lst')
+    data = [dummy_datum, Datum(utterance=''), dummy_datum, Datum(utterance='')]
+    outputs, errors = loop.run_until_complete(p.atransform_batch(data, batch_size=3))
+
+    assert [1, 3] == sorted(errors)
+    assert outputs[1] is None and outputs[3] is None
+    assert ['1', '2', '3'] == outputs[0][0] == outputs[2][0]
+
+
+def test_atransform_batch_raise_invalid_batch_size(fake_pipe, dummy_datum, loop):
+    with pytest.raises(ValueError):
+        loop.run_until_complete(fake_pipe.atransform_batch([dummy_datum], batch_size=0))
+
+
+def test_pickle_after_atransform(fake_pipe, dummy_datum, loop):
+    loop.run_until_complete(fake_pipe.atransform(dummy_datum, max_batch_size=2))
+    assert fake_pipe == pickle.loads(pickle.dumps(fake_pipe))
+
+
+def test_cache(dummy_datum):
+    p = Pipe()
+    p.add('Str2Str', checkpoint='1')
+    p.add('Str2Lst')
+    p.add('Lst2Lst')
+    assert p.cache_info() is None
+    p.enable_cache(max_entries=2)
+
+    expected_output = p.transform(dummy_datum)
+    output = p.transform(dummy_datum)
+    assert expected_output[:3] == output[:3]
+    assert expected_output[4][:] == output[4][:]
+    assert output[3].inverse_transform(output[2]) == expected_output[3].inverse_transform(
+        expected_output[2])
+
+    info = p.cache_info()
+    assert (1, 1, 1) == (info.hits, info.misses, info.entries)
+
+    p.transform_sequence('45')
+    p.transform_sequence('67')
+    assert 1 == p.cache_info().evictions
+
+
+def test_cache_copy_on_read():
+    p = Pipe()
+    p.add('Str2Lst', checkpoint='tokens')
+    p.enable_cache()
+
+    output_sequence, label_aligners, intermediate = p.transform_sequence('123')
+    output_sequence.append('4')
+    intermediate.get_from_checkpoint('tokens').append('4')
+    label_aligners.add(None)
+
+    output_sequence, label_aligners, intermediate = p.transform_sequence('123')
+    assert ['1', '2', '3'] == output_sequence == intermediate.get_from_checkpoint('tokens')
+    assert 1 == len(label_aligners.collections)
+    assert 1 == p.cache_info().hits
+
+
+def test_cache_owns_input_sequence():
+    p = Pipe()
+    p.add('Lst2Lst')
+    p.enable_cache()
+
+    input_sequence = ['a', 'b']
+    p.transform_sequence(input_sequence)
+    input_sequence[0] = 'MUTATED'
+
+    _, _, intermediate = p.transform_sequence(['a', 'b'])
+    assert ['a', 'b'] == intermediate[0]
+    assert 1 == p.cache_info().hits
+
+
+def test_cache_keyed_by_intermediate_mode():
+    p = Pipe()
+    p.add('Str2Lst')
+    p.enable_cache()
+    p.transform_sequence('123', intermediate_mode='none')
+    _, _, intermediate = p.transform_sequence('123')
+    assert intermediate is not None
+    assert 0 == p.cache_info().hits
+
+
+def test_cache_cleared_after_adding_op():
+    p = Pipe()
+    p.add('Str2Lst')
+    p.enable_cache()
+    p.transform_sequence('123')
+    p.add('Lst2Lst')
+    assert 0 == p.cache_info().entries
+    p.disable_cache()
+    assert p.cache_info() is None
+
+
+def test_fingerprint(fake_pipe):
+    o_pipe = Pipe.deserialize(fake_pipe.serialize())
+    assert fake_pipe.fingerprint == o_pipe.fingerprint
+
+    o_pipe.add('Lst2Lst')
+    assert fake_pipe.fingerprint != o_pipe.fingerprint
+    assert fake_pipe.fingerprint == o_pipe[0:3].fingerprint
+
+    o_pipe = o_pipe[0:3]
+    o_pipe.checkpoints['2'] = 2
+    assert fake_pipe.fingerprint != o_pipe.fingerprint
+    assert fake_pipe != o_pipe
+
+
+def test_fingerprint_ignores_order_of_mapping():
+    p1 = Pipe()
+    p1.add('Token2Index', {'token2index': {'<unk>': 0, 'a': 1}})
+    p2 = Pipe()
+    p2.add('Token2Index', {'token2index': {'a': 1, '<unk>': 0}})
+    assert p1.fingerprint == p2.fingerprint
+    assert p1 == p2
+    assert hash(p1) == hash(p2)
+    assert {p1, p2} == {p1}
+
+
+def test_hooks(fake_pipe):
+    p = fake_pipe[0:3]
+    records = []
+
+    def hook(idx, op, input_sequence, output_sequence, label_aligner, elapsed):
+        records.append((idx, op, input_sequence, output_sequence, elapsed >= 0))
+
+    p.add_hook(hook)
+    output_sequence, _, _ = p.transform_sequence('123')
+    p.remove_hook(hook)
+    p.transform_sequence('123')
+
+    assert [0, 1, 2] == [record[0] for record in records]
+    assert p.steps == [record[1] for record in records]
+    assert '123' == records[0][2]
+    assert output_sequence == records[2][3]
+    assert all(record[4] for record in records)
+
+
+def test_profile(fake_pipe, capsys):
+    p = fake_pipe[0:3]
+    with p.profile() as profiler:
+        p.transform_sequence('123')
+        p.transform_sequence('45')
+    p.transform_sequence('123')
+
+    assert [0, 1, 2] == list(profiler.stats)
+    assert [2, 2, 2] == [step_stats.calls for step_stats in profiler.stats.values()]
+    assert [5, 5, 5] == [step_stats.input_length for step_stats in profiler.stats.values()]
+    assert not p._hooks
+
+    p.summary()
+    captured = capsys.readouterr()
+    assert 'Cost of the last profiling run' in captured.out
+    assert 'Lst2Lst' in captured.out.split('Cost of the last profiling run')[1]
+
+    loaded_pipe = pickle.loads(pickle.dumps(p))
+    assert loaded_pipe._profiler is None
+
+
 def test_serialize(fake_pipe):
     serialized_str = fake_pipe.serialize()
     o_pipe = Pipe.deserialize(serialized_str)
@@ -113,3 +434,98 @@ def test_getitem(fake_pipe):
 
 def test_summary(fake_pipe):
     fake_pipe.summary()
+
+
+@pytest.fixture(scope='module')
+def real_pipe():
+    p = Pipe()
+    p.add('IntTokenWithSpace')
+    p.add('Lowercase')
+    p.add('AddWhitespaceAroundCJK')
+    p.add('AddWhitespaceAroundPunctuation')
+    p.add('MergeWhiteSpaceCharacters')
+    p.add('StripWhiteSpaceCharacters')
+    p.add('StripAccentToken')
+    p.add('WhiteSpaceTokenizer')
+    p.add('SpanSubwords', {'vocab': {'<unk>': 0, 'un': 1, '##want': 2, '##ed': 3}})
+    p.add('AddSosEos')
+    p.add('Pad', {'maxlen': 12})
+    p.add('Token2Index', {'token2index': {'<unk>': 0, 'un': 1, '##want': 2, '##ed': 3}})
+    return p
+
+
+@pytest.mark.parametrize(
+    "utterance,labels",
+    [
+        pytest.param('UNwant\u00E9d,running 12', [1] * 8 + [2] * 8 + [0, 3, 3], id='eng'),
+        pytest.param('  我想要 12 杯,珍奶 ', [0, 0, 1, 1, 1, 0, 2, 2, 0, 3, 0, 4, 4, 0], id='zh'),
+        pytest.param('', [], id='empty'),
+    ],
+)
+def test_compile_label_aligners(real_pipe, utterance, labels):
+    output_sequence, label_aligners, _ = real_pipe.transform_sequence(utterance)
+    compiled_label_aligners = label_aligners.compile()
+    assert len(compiled_label_aligners.collections) == 1
+    assert isinstance(compiled_label_aligners.collections[0], CompiledLabelAligner)
+
+    output_labels = label_aligners.transform(labels)
+    assert output_labels == compiled_label_aligners.transform(labels)
+
+    for predictions in [output_labels, list(range(len(output_sequence)))]:
+        assert label_aligners.inverse_transform(predictions) == \
+            compiled_label_aligners.inverse_transform(predictions)
+
+
+def test_compile_keeps_label_aligners_not_compilable():
+    p = Pipe()
+    p.add('Lowercase')
+    p.add('Str2Str')
+    p.add('Lowercase')
+    p.add('StripWhiteSpaceCharacters')
+    _, label_aligners, _ = p.transform_sequence('AB c ')
+    compiled_label_aligners = label_aligners.compile()
+
+    assert [CompiledLabelAligner, type(label_aligners.collections[1]), CompiledLabelAligner] == \
+        [type(label_aligner) for label_aligner in compiled_label_aligners.collections]
+    assert [1, 2, 3, 4] == compiled_label_aligners.transform([1, 2, 3, 4, 5])
+    assert [1, 2, 3, 4, 0] == compiled_label_aligners.inverse_transform([1, 2, 3, 4])
+
+
+@pytest.mark.parametrize(
+    "utterance,labels",
+    [
+        pytest.param('UNwant\u00E9d,running 12', [1] * 8 + [2] * 8 + [0, 3, 3], id='eng'),
+        pytest.param('  我想要 12 杯,珍奶 ', [0, 0, 1, 1, 1, 0, 2, 2, 0, 3, 0, 4, 4, 0], id='zh'),
+        pytest.param('', [], id='empty'),
+    ],
+)
+def test_trusted_mode(real_pipe, utterance, labels):
+    p = real_pipe[:]
+    p.enable_trusted_mode()
+    assert p.trusted
+    assert not real_pipe.trusted
+
+    datum = Datum(utterance=utterance, entities=[])
+    output = p.transform_sequence(utterance)
+    expected_output = real_pipe.transform_sequence(utterance)
+    assert expected_output[0] == output[0]
+    assert expected_output[2][:] == output[2][:]
+    assert expected_output[1].transform(labels) == output[1].transform(labels)
+
+    assert real_pipe.transform(datum)[:3] == p.transform(datum)[:3]
+
+    # label aligners validate labels outside transform
+    _, label_aligners, _ = p.transform_sequence(utterance)
+    with pytest.raises(ValueError):
+        label_aligners.inverse_transform([0] * 13)
+
+    p.disable_trusted_mode()
+    assert not p.trusted
+
+
+def test_trusted_mode_skips_type_checks(fake_pipe):
+    p = fake_pipe[0:3]
+    with pytest.raises(TypeError):
+        p.transform_sequence(['a'])
+    p.enable_trusted_mode()
+    p.transform_sequence(['a'])
@@ -0,0 +1,50 @@
+from ..edit.replacement import ReplacementGroup
+from ..ops.base import NullLabelAligner
+from ..ops.tokenizers.base import TokenizerAligner
+from ..profiler import Profiler, StepStats
+
+
+def make_replacement_group(n_replacements):
+    replacement_group = ReplacementGroup()
+    for idx in range(n_replacements):
+        replacement_group.add(idx, idx + 1, 'a')
+    replacement_group.done()
+    return replacement_group
+
+
+def test_step_stats():
+    step_stats = StepStats('op')
+    label_aligner = TokenizerAligner(
+        'abc',
+        {'replacement_group': make_replacement_group(2), 'span_group': None},
+        3,
+    )
+    step_stats.update('abc', ['a', 'b', 'c'], label_aligner, 0.5)
+    step_stats.update('ab', ['a', 'b'], NullLabelAligner('ab', None, 2), 1.5)
+
+    assert (2, 2., 1.) == (step_stats.calls, step_stats.total_time, step_stats.mean_time)
+    assert (5, 5, 2) == (
+        step_stats.input_length, step_stats.output_length, step_stats.replacements)
+
+
+def test_step_stats_with_unknown_replacements():
+    step_stats = StepStats('op')
+    step_stats.update('ab', 'ab', object(), 0.5)
+    step_stats.update('ab', 'ab', NullLabelAligner('ab', None, 2), 0.5)
+    assert step_stats.replacements is None
+
+
+def test_profiler():
+    profiler = Profiler()
+    label_aligner = NullLabelAligner('ab', None, 2)
+    profiler(0, 'op0', 'ab', 'ab', label_aligner, 1.)
+    profiler(1, 'op1', 'ab', ['ab'], label_aligner, 3.)
+    profiler(0, 'op0', 'ab', 'ab', label_aligner, 1.)
+
+    assert [0, 1] == list(profiler.stats)
+    assert 5. == profiler.total_time
+    assert (2, 1) == (profiler.stats[0].calls, profiler.stats[1].calls)
+
+    lines = profiler.report()
+    assert 3 == len(lines)
+    assert 'op1' in lines[2] and '60.0' in lines[2]
@@ -0,0 +1,98 @@
+import copy
+import json
+import pickle
+
+import pytest
+
+from ..artifact import artifact_to_json, json_to_artifact
+from ..pipe import Pipe
+from ..vocabulary import REFERENCE_KEY, Vocabulary, externalize, resolve
+
+
+@pytest.fixture
+def vocab():
+    return Vocabulary({'<unk>': 0, '珍奶': 1, '去冰': 2})
+
+
+@pytest.fixture
+def pipe(vocab):
+    pipe = Pipe()
+    pipe.add('WhiteSpaceTokenizer', checkpoint='tokens')
+    pipe.add('SpanSubwords', {'vocab': vocab, 'unk_token': '<unk>'})
+    pipe.add('Token2Index', {'token2index': vocab})
+    return pipe
+
+
+def test_immutable(vocab):
+    with pytest.raises(TypeError):
+        vocab['a'] = 3
+    with pytest.raises(TypeError):
+        vocab.update({'a': 3})
+    with pytest.raises(TypeError):
+        del vocab['<unk>']
+    assert {'<unk>': 0, '珍奶': 1, '去冰': 2} == vocab
+
+
+def test_id(vocab):
+    assert vocab.id == Vocabulary(dict(vocab)).id
+    assert vocab.id != Vocabulary({'<unk>': 0}).id
+
+
+def test_pickle(vocab):
+    for loaded in [pickle.loads(pickle.dumps(vocab)), copy.deepcopy(vocab)]:
+        assert isinstance(loaded, Vocabulary)
+        assert vocab == loaded
+
+
+def test_load_once(vocab):
+    serialized_str = vocab.serialize()
+    loaded = Vocabulary.load_serialized(serialized_str)
+    assert vocab == loaded
+    assert vocab.id == loaded.id
+    assert loaded is Vocabulary.load_serialized(serialized_str)
+    assert loaded is Vocabulary.load(loaded.id, lambda: pytest.fail('loaded twice'))
+
+
+def test_externalize_and_resolve(vocab):
+    configs = {'token2index': vocab, 'unk_token': '<unk>'}
+    vocabularies = {}
+    output_configs = externalize(configs, vocabularies)
+    assert {'token2index': {REFERENCE_KEY: vocab.id}, 'unk_token': '<unk>'} == output_configs
+    assert {vocab.id: vocab} == vocabularies
+    assert configs == resolve(output_configs, vocabularies.__getitem__)
+
+    configs = {'token2index': {'a': 0}}
+    assert configs is externalize(configs, vocabularies)
+    assert configs is resolve(configs, vocabularies.__getitem__)
+
+
+def test_serialize_pipe(pipe, vocab):
+    serialized_str = pipe.serialize()
+    pipe_bundle = json.loads(serialized_str)
+    assert [vocab.id] == list(pipe_bundle['vocabularies'])
+    assert 1 == serialized_str.count('去冰')
+
+    loaded_pipe = Pipe.deserialize(serialized_str)
+    assert pipe == loaded_pipe
+    span_subwords, token2index = loaded_pipe.steps[1:]
+    assert isinstance(token2index.token2index, Vocabulary)
+    assert token2index.token2index is span_subwords.vocab
+    assert serialized_str == loaded_pipe.serialize()
+
+
+def test_pipe_artifact(pipe):
+    artifact = pipe.to_artifact()
+    assert 1 == artifact.count('去冰'.encode('utf-8'))
+
+    loaded_pipe = Pipe.from_artifact(artifact)
+    assert pipe == loaded_pipe
+    span_subwords, token2index = loaded_pipe.steps[1:]
+    assert isinstance(token2index.token2index, Vocabulary)
+    assert token2index.token2index is span_subwords.vocab
+    assert token2index.token2index is Pipe.from_artifact(artifact).steps[2].token2index
+
+
+def test_converters(pipe):
+    artifact = json_to_artifact(pipe.serialize())
+    assert pipe.to_artifact() == artifact
+    assert pipe.serialize() == artifact_to_json(artifact)
@@ -0,0 +1,154 @@
+"""Vocabularies shared by operators
+
+A `Vocabulary` is an immutable `dict` of tokens to indices. It can be passed to
+operators in place of a dict, e.g. `token2index` of `Token2Index` and
+`Token2IndexwithHash`, `vocab` of `SpanSubwords`, so that several operators
+share one vocabulary.
+
+When a pipe is serialized, each vocabulary is stored once and the configs of
+operators refer to it by its id, i.e. {REFERENCE_KEY: id}, see `Pipe.serialize`
+and `Pipe.to_artifact`. The id is the SHA-256 of the serialized vocabulary.
+
+Loaded vocabularies are registered by id, so a vocabulary used by several
+pipes is loaded once per process as long as it is alive.
+"""
+from typing import Callable, Dict
+import hashlib
+import json
+import threading
+import weakref
+
+
+REFERENCE_KEY = '$vocabulary'
+
+_registry = weakref.WeakValueDictionary()
+_registry_lock = threading.Lock()
+
+
+def _immutable(self, *args, **kwargs):
+    raise TypeError('Vocabulary can not be modified')
+
+
+class Vocabulary(dict):
+
+    """An immutable mapping of tokens (str) to indices (int)
+
+    E.g.
+    >>> from uttut.pipeline import Pipe, Vocabulary
+    >>> vocab = Vocabulary({'<unk>': 0, 'I': 1, 'like': 2})
+    >>> pipe = Pipe()
+    >>> pipe.add('Token2Index', {'token2index': vocab})
+    >>> pipe.add('Token2IndexwithHash', {'token2index': vocab})
+    >>> pipe.serialize()  # vocab is stored once
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._id = None
+
+    __setitem__ = __delitem__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+    __ior__ = _immutable
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+    @property
+    def id(self) -> str:
+        """hex digest of SHA-256 of the serialized vocabulary, computed once"""
+        if self._id is None:
+            self._id = _hash_str(self.serialize())
+        return self._id
+
+    def serialize(self) -> str:
+        return json.dumps(self, ensure_ascii=False, separators=(',', ':'))
+
+    @classmethod
+    def deserialize(cls, serialized_str: str) -> 'Vocabulary':
+        return cls(json.loads(serialized_str))
+
+    @classmethod
+    def load(cls, vocab_id: str, loader: Callable[[], Dict[str, int]]) -> 'Vocabulary':
+        """Get the registered vocabulary of vocab_id, or load and register it
+
+        Args:
+            vocab_id (str): id of the vocabulary, it is trusted to be the id
+                of the loaded mapping.
+            loader (callable): returns the mapping of the vocabulary,
+                only called if vocab_id is not registered.
+
+        Return:
+            Vocabulary
+
+        """
+        vocab = _registry.get(vocab_id)
+        if vocab is not None:
+            return vocab
+        vocab = cls(loader())
+        vocab._id = vocab_id
+        with _registry_lock:
+            return _registry.setdefault(vocab_id, vocab)
+
+    @classmethod
+    def load_serialized(cls, serialized_str: str) -> 'Vocabulary':
+        """Same as `load` for the output of `serialize`
+
+        The id is the hash of serialized_str, so it is parsed only if
+        no vocabulary of the same content is registered.
+
+        """
+        return cls.load(_hash_str(serialized_str), lambda: json.loads(serialized_str))
+
+
+def is_reference(value) -> bool:
+    return isinstance(value, dict) and len(value) == 1 and REFERENCE_KEY in value
+
+
+def externalize(configs: Dict, vocabularies: Dict[str, Vocabulary]) -> Dict:
+    """Replace vocabularies in configs with references
+
+    Args:
+        configs (dict): configs of an operator
+        vocabularies (dict): (key, value) = (id, vocabulary), the vocabularies
+            in configs are added to it.
+
+    Return:
+        configs (dict): a new dict if any vocabulary is replaced
+
+    """
+    if not any(isinstance(value, Vocabulary) for value in configs.values()):
+        return configs
+    output_configs = {}
+    for name, value in configs.items():
+        if isinstance(value, Vocabulary):
+            vocabularies[value.id] = value
+            value = {REFERENCE_KEY: value.id}
+        output_configs[name] = value
+    return output_configs
+
+
+def resolve(configs: Dict, get_vocabulary: Callable[[str], Vocabulary]) -> Dict:
+    """Replace references in configs with vocabularies, the inverse of `externalize`
+
+    Args:
+        configs (dict): configs of an operator
+        get_vocabulary (callable): returns the vocabulary of an id
+
+    Return:
+        configs (dict): a new dict if any reference is replaced
+
+    Raise:
+        KeyError: If a referred vocabulary is not found.
+
+    """
+    if not any(is_reference(value) for value in configs.values()):
+        return configs
+    return {
+        name: get_vocabulary(value[REFERENCE_KEY]) if is_reference(value) else value
+        for name, value in configs.items()
+    }
+
+
+def _hash_str(content: str) -> str:
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
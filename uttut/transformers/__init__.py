@@ -1 +1,2 @@
 from .ordinal_label import OrdinalLabel
+from .jsonl import read_jsonl, write_jsonl
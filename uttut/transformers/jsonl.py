@@ -0,0 +1,55 @@
+import json
+from typing import Iterable, Iterator
+
+from ..elements import Datum
+from .base import BaseTransformer
+
+
+def read_jsonl(path: str, transformer: BaseTransformer) -> Iterator[Datum]:
+    """Lazily read raw dictionaries from a JSONL file as Datum
+
+    Each non-empty line is a raw dictionary, e.g.
+    {"utterance": "你好", "intent": {"names": ["HI"]}}
+    which is turned into Datum by `transformer.machanize`.
+    Only one line is held in memory at a time.
+
+    Args:
+        path (str): path of the JSONL file
+        transformer (BaseTransformer): e.g. OrdinalLabel
+
+    Yields:
+        Datum
+
+    """
+    with open(path, 'r', encoding='utf-8') as f_in:
+        for line in f_in:
+            line = line.strip()
+            if not line:
+                continue
+            yield transformer.machanize(json.loads(line))
+
+
+def write_jsonl(path: str, records: Iterable, transformer: BaseTransformer = None) -> int:
+    """Write records to a JSONL file one line at a time
+
+    Args:
+        path (str): path of the JSONL file
+        records (iterable): Datum if transformer is given, otherwise
+            JSON serializable objects. The outputs of `Pipe.transform_stream`
+            hold label aligners, intermediates and errors, so they should be
+            mapped to JSON values first, e.g. {'indices': output[0]}.
+        transformer (BaseTransformer): used to humanize Datum
+
+    Returns:
+        number of written records
+
+    """
+    n_records = 0
+    with open(path, 'w', encoding='utf-8') as f_out:
+        for record in records:
+            if transformer is not None:
+                record = transformer.humanize(record)
+            f_out.write(json.dumps(record, ensure_ascii=False))
+            f_out.write('\n')
+            n_records += 1
+    return n_records
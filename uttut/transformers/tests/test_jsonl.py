@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from uttut.elements import Datum, Intent, Entity
+from ..jsonl import read_jsonl, write_jsonl
+from ..ordinal_label import OrdinalLabel
+
+
+@pytest.fixture(scope='function')
+def tx():
+    return OrdinalLabel({'HI': 0, 'ORDER': 1}, {'ITEM': 1})
+
+
+@pytest.fixture(scope='function')
+def raw_data():
+    return [
+        {'utterance': '你好', 'intent': {'names': ['HI']}},
+        {
+            'utterance': '我想喝珍奶',
+            'intent': {'names': ['ORDER']},
+            'entities': [{'name': 'ITEM', 'start': 3, 'end': 5}],
+        },
+    ]
+
+
+def test_read_jsonl(tmpdir, tx, raw_data):
+    path = tmpdir.join('data.jsonl')
+    path.write_text(
+        json.dumps(raw_data[0]) + '\n\n' + json.dumps(raw_data[1], ensure_ascii=False) + '\n',
+        encoding='utf-8',
+    )
+    data = read_jsonl(str(path), tx)
+    assert Datum('你好', [Intent(0)]) == next(data)
+    assert Datum('我想喝珍奶', [Intent(1)], [Entity(1, '珍奶', 3, 5)]) == next(data)
+    with pytest.raises(StopIteration):
+        next(data)
+
+
+def test_write_jsonl_round_trip(tmpdir, tx, raw_data):
+    path = str(tmpdir.join('data.jsonl'))
+    data = [tx.machanize(raw_datum) for raw_datum in raw_data]
+    assert 2 == write_jsonl(path, iter(data), transformer=tx)
+    assert data == list(read_jsonl(path, tx))
+
+
+def test_write_jsonl_without_transformer(tmpdir):
+    path = tmpdir.join('outputs.jsonl')
+    records = [{'tokens': ['我', '想'], 'labels': [0, 1]}, [1, 2]]
+    assert 2 == write_jsonl(str(path), records)
+    lines = path.read_text(encoding='utf-8').splitlines()
+    assert records == [json.loads(line) for line in lines]
+    assert '我' in lines[0]